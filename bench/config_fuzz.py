@@ -0,0 +1,134 @@
+# Goat - SecureMe configuration round-trip fuzz harness
+# © (c) 2025 Goat Technologies
+# https://github.com/CodeGoat-dev/SecureMe
+# Description:
+# Generates random configurations and checks they survive every ConfigManager storage format unchanged.
+# Covers quoted strings containing '=', '!', '#', brackets and non-ASCII text, '!' lists, booleans and integers.
+# Values are limited to what the INI format can represent: strings without quotes at both ends or line breaks,
+# non-negative integers and non-empty lists of strings without commas or surrounding whitespace.
+# Usage (from the repository root):
+#   python bench/config_fuzz.py [iterations] [seed]
+#   micropython bench/config_fuzz.py [iterations] [seed]
+
+# Imports
+import host
+import json
+import random
+import sys
+import ConfigManager
+
+NAME_CHARACTERS = "abcdefghijklmnopqrstuvwxyz_0123456789"
+STRING_CHARACTERS = "abcXYZ019 =!#[],;:'.-_/\\\"é°€"
+LIST_CHARACTERS = "abcXYZ019=!#[]'.-_é"
+
+def random_text(characters, minimum, maximum):
+    """Returns random text built from the given characters."""
+    return "".join([random.choice(characters) for _ in range(random.randint(minimum, maximum))])
+
+def random_value():
+    """Returns a random configuration value."""
+    kind = random.randint(0, 4)
+
+    if kind == 0:
+        return random.randint(0, 1) == 1
+    if kind == 1:
+        return random.randint(0, 2147483647)
+    if kind == 2:
+        items = []
+        for _ in range(random.randint(1, 5)):
+            item = random_text(LIST_CHARACTERS, 1, 8)
+            items.append(item.strip() or "x")
+        return items
+    if kind == 3:
+        # Strings which look like other value types
+        return random.choice(("true", "false", "123", "!a,b", "key=value", "", " padded "))
+
+    text = random_text(STRING_CHARACTERS, 0, 24)
+    if len(text) >= 2 and text[0] == '"' and text[-1] == '"':
+        text = text[1:]
+    return text
+
+def random_config():
+    """Returns a random configuration dictionary."""
+    config = {}
+
+    for section in range(random.randint(1, 8)):
+        entries = {}
+        for _ in range(random.randint(0, 10)):
+            entries[random_text(NAME_CHARACTERS, 1, 12)] = random_value()
+        config[f"{random_text(NAME_CHARACTERS, 1, 10)}_{section}"] = entries
+
+    return config
+
+def parse_text(text):
+    """Parses serialized configuration text."""
+    return ConfigManager.parse_lines([line.encode() for line in text.split("\n")])
+
+def round_trip_file(directory, config):
+    """Writes a configuration through ConfigManager and reads it back."""
+    writer = ConfigManager.ConfigManager(directory, "fuzz.conf", snapshot=False, journal=False)
+    writer.write(config, writer.filename)
+
+    reader = ConfigManager.ConfigManager(directory, "fuzz.conf", snapshot=False, journal=False)
+    reader.read()
+    return reader.config
+
+def round_trip_journal(config):
+    """Encodes a configuration as journal records and replays them."""
+    data = b""
+    for section, entries in config.items():
+        data += ConfigManager.pack_journal_record(ConfigManager._OP_SET_SECTION, section)
+        for key, value in entries.items():
+            data += ConfigManager.pack_journal_record(ConfigManager._OP_SET_ENTRY, section, key, value)
+
+    replayed = {}
+    if ConfigManager.replay_journal(data, replayed, []) != len(data):
+        raise AssertionError("Journal replay stopped early.")
+    return replayed
+
+def run(iterations=200, seed=1):
+    """Runs the fuzz harness and returns the results."""
+    random.seed(seed)
+    directory = host.scratch_directory("fuzz")
+
+    checks = {
+        "serialize": lambda config: parse_text(ConfigManager.serialize(config)),
+        "file": lambda config: round_trip_file(directory, config),
+        "snapshot": lambda config: ConfigManager.unpack_snapshot(ConfigManager.pack_snapshot(config, 1, 2), 1, 2),
+        "journal": round_trip_journal,
+    }
+
+    failures = []
+    for iteration in range(iterations):
+        config = random_config()
+
+        for name, check in checks.items():
+            try:
+                result = check(config)
+            except Exception as e:
+                result = f"{type(e).__name__}: {e}"
+
+            if result != config:
+                failures.append({"iteration": iteration, "check": name, "config": config, "result": result})
+
+    return {
+        "seed": seed,
+        "iterations": iterations,
+        "checks": list(checks),
+        "failures": len(failures),
+        "first_failure": failures[0] if failures else None,
+    }
+
+def main():
+    """Prints the fuzz harness results as JSON."""
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    seed = int(sys.argv[2]) if len(sys.argv) > 2 else 1
+
+    results = run(iterations, seed)
+    print(json.dumps(results))
+
+    if results["failures"]:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
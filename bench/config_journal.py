@@ -0,0 +1,81 @@
+# Goat - SecureMe configuration journal benchmark
+# © (c) 2025 Goat Technologies
+# https://github.com/CodeGoat-dev/SecureMe
+# Description:
+# Compares appending configuration changes to the journal with rewriting the configuration file.
+# Reports bytes written and write latency per single-entry change, including compactions.
+# Usage (from the repository root):
+#   python bench/config_journal.py
+#   micropython bench/config_journal.py
+
+# Imports
+import host
+import configs
+import uasyncio as asyncio
+from ConfigManager import ConfigManager
+
+async def measure_changes(journal, changes):
+    """Measures a series of single-entry changes and returns the results.
+
+    Args:
+    - journal: Whether the configuration manager uses the journal.
+    - changes: The number of changes to write.
+    """
+    directory = host.scratch_directory("journal" if journal else "rewrite")
+    with open(f"{directory}/secureme.conf", "w") as configfile:
+        configfile.write(configs.SMALL_CONFIG)
+
+    config = ConfigManager(directory, "secureme.conf", journal=journal)
+    await config.load_async()
+
+    total = 0
+    worst = 0
+    for i in range(changes):
+        config.set_entry("buzzer", "buzzer_volume", 1024 + i)
+
+        start = host.ticks_us()
+        await config.write_async()
+        elapsed = host.ticks_diff(host.ticks_us(), start)
+
+        total += elapsed
+        if elapsed > worst:
+            worst = elapsed
+
+    # The final state must survive a reload
+    reloaded = ConfigManager(directory, "secureme.conf", journal=journal)
+    await reloaded.load_async()
+    if reloaded.get_entry("buzzer", "buzzer_volume") != 1024 + changes - 1:
+        raise AssertionError("Configuration change lost on reload.")
+
+    stats = config.get_stats()
+
+    return {
+        "bytes_per_change": stats["bytes_written"] / changes,
+        "us_per_change": total / changes,
+        "worst_us": worst,
+        "rewrites": stats["writes"],
+        "journal_appends": stats["journal_appends"],
+        "compactions": stats["compactions"],
+    }
+
+def run(changes=200):
+    """Runs the journal benchmark and returns the results."""
+    return {
+        "rewrite": asyncio.run(measure_changes(False, changes)),
+        "journal": asyncio.run(measure_changes(True, changes)),
+    }
+
+def main():
+    """Prints the journal benchmark results."""
+    results = run()
+
+    for name, result in results.items():
+        print(name)
+        print(f"  bytes per change: {result['bytes_per_change']:.1f}")
+        print(f"  latency per change: {result['us_per_change']:.1f}us (worst {result['worst_us']}us)")
+        print(f"  rewrites: {result['rewrites']}, journal appends: {result['journal_appends']}, compactions: {result['compactions']}")
+
+    print(f"flash bytes saved: {100 - results['journal']['bytes_per_change'] * 100 / results['rewrite']['bytes_per_change']:.0f}%")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+# Goat - SecureMe lazy configuration loading benchmark
+# © (c) 2025 Goat Technologies
+# https://github.com/CodeGoat-dev/SecureMe
+# Description:
+# Compares lazy section loading with reading every section of a large configuration.
+# Reports load time, retained and peak heap, and the cost of accessing and evicting sections.
+# Usage (from the repository root):
+#   python bench/config_lazy.py
+#   micropython bench/config_lazy.py
+
+# Imports
+import host
+import configs
+from ConfigManager import ConfigManager
+
+SECTIONS = 60
+ENTRIES_PER_SECTION = 9
+
+def load(directory, lazy):
+    """Loads the configuration and returns the manager with its heap use and load time."""
+    start = host.start_allocations()
+    start_time = host.ticks_us()
+
+    config = ConfigManager(directory, "secureme.conf", snapshot=False, journal=False, lazy=lazy)
+    config.read()
+
+    elapsed = host.ticks_diff(host.ticks_us(), start_time)
+    retained = host.heap_in_use() - start
+    peak = host.stop_allocations(start)
+
+    return config, elapsed, retained, peak
+
+def run():
+    """Runs the lazy loading benchmark and returns the results."""
+    directory = host.scratch_directory("lazy")
+    text = configs.generate_config(SECTIONS * (ENTRIES_PER_SECTION + 2), ENTRIES_PER_SECTION)
+    with open(f"{directory}/secureme.conf", "w") as configfile:
+        configfile.write(text)
+
+    eager, eager_us, eager_retained, eager_peak = load(directory, False)
+    lazy, lazy_us, lazy_retained, lazy_peak = load(directory, True)
+
+    if len(lazy) != len(eager) or len(lazy) < 50:
+        raise AssertionError(f"Expected {len(eager)} sections, indexed {len(lazy)}.")
+
+    # Access a handful of sections as the firmware would
+    start_time = host.ticks_us()
+    for section in range(0, SECTIONS, 12):
+        name = f"section_{section}"
+        if lazy.get_section(name) != eager.get_section(name):
+            raise AssertionError(f"Lazy section {name} does not match.")
+    access_us = host.ticks_diff(host.ticks_us(), start_time)
+    loaded = len(lazy.config)
+
+    # Modified sections are kept and unloaded sections are copied through on write
+    lazy.set_entry("section_1", "key_0", "changed")
+    evicted = lazy.evict()
+    lazy.write()
+
+    reread = ConfigManager(directory, "secureme.conf", snapshot=False, journal=False)
+    reread.read()
+    if reread.get_entry("section_1", "key_0") != "changed" or len(reread) != len(eager):
+        raise AssertionError("Lazy write did not preserve the configuration.")
+
+    return {
+        "sections": len(eager),
+        "eager_us": eager_us,
+        "eager_retained": eager_retained,
+        "eager_peak": eager_peak,
+        "lazy_us": lazy_us,
+        "lazy_retained": lazy_retained,
+        "lazy_peak": lazy_peak,
+        "access_us": access_us,
+        "loaded_sections": loaded,
+        "evicted_sections": evicted,
+    }
+
+def main():
+    """Prints the lazy loading benchmark results."""
+    result = run()
+
+    print(f"{result['sections']} sections")
+    print(f"  eager read: {result['eager_us']}us, retained {result['eager_retained']} bytes, peak {result['eager_peak']} bytes")
+    print(f"  lazy index: {result['lazy_us']}us, retained {result['lazy_retained']} bytes, peak {result['lazy_peak']} bytes")
+    print(f"  first access of {result['loaded_sections']} sections: {result['access_us']}us")
+    print(f"  evicted {result['evicted_sections']} unused sections")
+
+if __name__ == "__main__":
+    main()
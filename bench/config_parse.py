@@ -0,0 +1,50 @@
+# Goat - SecureMe configuration parser benchmark
+# © (c) 2025 Goat Technologies
+# https://github.com/CodeGoat-dev/SecureMe
+# Description:
+# Compares the single-pass ConfigManager parser with the legacy regular expression parser.
+# Reports parse time and allocations for a small and a 1,000-line configuration.
+# Usage (from the repository root):
+#   python bench/config_parse.py
+#   micropython bench/config_parse.py
+
+# Imports
+import host
+import configs
+import legacy_config
+import ConfigManager
+
+def run(iterations=100):
+    """Runs the parser benchmark and returns the results."""
+    results = {}
+
+    for name, text in (("small", configs.SMALL_CONFIG), ("1000_lines", configs.generate_config(1000))):
+        text_lines = configs.text_lines(text)
+        byte_lines = configs.byte_lines(text)
+
+        if legacy_config.parse_lines(text_lines) != ConfigManager.parse_lines(byte_lines):
+            raise AssertionError(f"Parser output mismatch for the {name} configuration.")
+
+        legacy_time, legacy_alloc = host.measure(lambda: legacy_config.parse_lines(text_lines), iterations)
+        parser_time, parser_alloc = host.measure(lambda: ConfigManager.parse_lines(byte_lines), iterations)
+
+        results[name] = {
+            "lines": len(text_lines),
+            "legacy_us": legacy_time,
+            "legacy_bytes": legacy_alloc,
+            "parser_us": parser_time,
+            "parser_bytes": parser_alloc,
+        }
+
+    return results
+
+def main():
+    """Prints the parser benchmark results."""
+    for name, result in run().items():
+        print(f"{name} ({result['lines']} lines)")
+        print(f"  legacy regex parser: {result['legacy_us']:.1f}us, {result['legacy_bytes']} bytes")
+        print(f"  single-pass parser:  {result['parser_us']:.1f}us, {result['parser_bytes']} bytes")
+        print(f"  speedup: {result['legacy_us'] / result['parser_us']:.2f}x")
+
+if __name__ == "__main__":
+    main()
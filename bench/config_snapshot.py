@@ -0,0 +1,64 @@
+# Goat - SecureMe configuration snapshot benchmark
+# © (c) 2025 Goat Technologies
+# https://github.com/CodeGoat-dev/SecureMe
+# Description:
+# Compares loading the compiled binary configuration snapshot with text parsing.
+# Reports load time and allocations against the legacy regular expression parser
+# and the single-pass parser for a small and a 1,000-line configuration.
+# Usage (from the repository root):
+#   python bench/config_snapshot.py
+#   micropython bench/config_snapshot.py
+
+# Imports
+import host
+import configs
+import legacy_config
+import ConfigManager
+
+def run(iterations=100):
+    """Runs the snapshot benchmark and returns the results."""
+    results = {}
+
+    for name, text in (("small", configs.SMALL_CONFIG), ("1000_lines", configs.generate_config(1000))):
+        text_lines = configs.text_lines(text)
+        byte_lines = configs.byte_lines(text)
+
+        config = ConfigManager.parse_lines(byte_lines)
+        mtime = 1735689600
+        size = len(text)
+        snapshot = ConfigManager.pack_snapshot(config, mtime, size)
+
+        if ConfigManager.unpack_snapshot(snapshot, mtime, size) != legacy_config.parse_lines(text_lines):
+            raise AssertionError(f"Snapshot output mismatch for the {name} configuration.")
+        if ConfigManager.unpack_snapshot(snapshot, mtime + 1, size) is not None:
+            raise AssertionError("Snapshot loaded for a modified configuration file.")
+
+        legacy_time, legacy_alloc = host.measure(lambda: legacy_config.parse_lines(text_lines), iterations)
+        parser_time, parser_alloc = host.measure(lambda: ConfigManager.parse_lines(byte_lines), iterations)
+        snapshot_time, snapshot_alloc = host.measure(lambda: ConfigManager.unpack_snapshot(snapshot, mtime, size), iterations)
+
+        results[name] = {
+            "lines": len(text_lines),
+            "text_bytes": size,
+            "snapshot_bytes": len(snapshot),
+            "legacy_us": legacy_time,
+            "legacy_bytes": legacy_alloc,
+            "parser_us": parser_time,
+            "parser_bytes": parser_alloc,
+            "snapshot_us": snapshot_time,
+            "snapshot_alloc_bytes": snapshot_alloc,
+        }
+
+    return results
+
+def main():
+    """Prints the snapshot benchmark results."""
+    for name, result in run().items():
+        print(f"{name} ({result['lines']} lines, {result['text_bytes']} bytes, snapshot {result['snapshot_bytes']} bytes)")
+        print(f"  legacy regex parser: {result['legacy_us']:.1f}us, {result['legacy_bytes']} bytes")
+        print(f"  single-pass parser:  {result['parser_us']:.1f}us, {result['parser_bytes']} bytes")
+        print(f"  snapshot load:       {result['snapshot_us']:.1f}us, {result['snapshot_alloc_bytes']} bytes")
+        print(f"  speedup over legacy: {result['legacy_us'] / result['snapshot_us']:.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+# Goat - SecureMe configuration benchmark suite
+# © (c) 2025 Goat Technologies
+# https://github.com/CodeGoat-dev/SecureMe
+# Description:
+# Measures ConfigManager parse and write throughput, allocations per line and watcher reload cost
+# using generated configurations of increasing size, then runs the round-trip fuzz harness.
+# Results are emitted as JSON so they can be compared across firmware versions.
+# Usage (from the repository root):
+#   python bench/config_suite.py [output.json]
+#   micropython bench/config_suite.py [output.json]
+
+# Imports
+import host
+import configs
+import config_fuzz
+import json
+import sys
+import ConfigManager
+
+SIZES = (100, 500, 1000, 5000)
+
+def measure_size(directory, lines, iterations):
+    """Measures a generated configuration of the given size."""
+    text = configs.generate_config(lines)
+    byte_lines = configs.byte_lines(text)
+    line_count = len(byte_lines)
+    size = len(text)
+
+    parse_us, parse_bytes = host.measure(lambda: ConfigManager.parse_lines(byte_lines), iterations)
+
+    with open(f"{directory}/secureme.conf", "w") as configfile:
+        configfile.write(text)
+
+    # Full rewrites, as performed when the journal is compacted
+    writer = ConfigManager.ConfigManager(directory, "secureme.conf", snapshot=False, journal=False)
+    writer.read()
+
+    def write():
+        writer.dirty = True
+        writer.write()
+
+    write_us, write_bytes = host.measure(write, iterations)
+
+    # Watcher reloads use the default storage options
+    watcher = ConfigManager.ConfigManager(directory, "secureme.conf")
+    watcher.read()
+    reload_us, reload_bytes = host.measure(watcher.reload, iterations)
+
+    return {
+        "lines": line_count,
+        "bytes": size,
+        "parse_us": parse_us,
+        "parse_lines_per_s": line_count * 1000000 / parse_us if parse_us else None,
+        "parse_bytes_per_s": size * 1000000 / parse_us if parse_us else None,
+        "parse_alloc_per_line": parse_bytes / line_count,
+        "write_us": write_us,
+        "write_bytes_per_s": size * 1000000 / write_us if write_us else None,
+        "write_alloc_per_line": write_bytes / line_count,
+        "reload_us": reload_us,
+        "reload_alloc_per_line": reload_bytes / line_count,
+    }
+
+def run(iterations=20):
+    """Runs the benchmark suite and returns the results."""
+    directory = host.scratch_directory("suite")
+
+    results = {
+        "implementation": sys.implementation.name,
+        "version": ".".join([str(part) for part in sys.implementation.version[:3]]),
+        "iterations": iterations,
+        "sizes": {},
+    }
+
+    for lines in SIZES:
+        results["sizes"][str(lines)] = measure_size(directory, lines, iterations)
+
+    results["fuzz"] = config_fuzz.run()
+
+    return results
+
+def main():
+    """Prints the benchmark suite results as JSON."""
+    results = json.dumps(run())
+
+    if len(sys.argv) > 1:
+        with open(sys.argv[1], "w") as outputfile:
+            outputfile.write(results)
+
+    print(results)
+
+if __name__ == "__main__":
+    main()
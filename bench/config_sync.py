@@ -0,0 +1,80 @@
+# Goat - SecureMe synchronous configuration API benchmark
+# © (c) 2025 Goat Technologies
+# https://github.com/CodeGoat-dev/SecureMe
+# Description:
+# Compares the synchronous ConfigManager API with running the async API in a new event loop per call,
+# which is how the synchronous API was previously implemented.
+# Reports per-call overhead for reads and writes and checks auto-save writes once per change.
+# Usage (from the repository root):
+#   python bench/config_sync.py
+#   micropython bench/config_sync.py
+
+# Imports
+import host
+import configs
+import uasyncio as asyncio
+from ConfigManager import ConfigManager
+
+def run(iterations=100):
+    """Runs the synchronous API benchmark and returns the results."""
+    directory = host.scratch_directory("sync")
+    with open(f"{directory}/secureme.conf", "w") as configfile:
+        configfile.write(configs.SMALL_CONFIG)
+
+    # Rewrite the full file on every write so both paths do the same work
+    config = ConfigManager(directory, "secureme.conf", snapshot=False, journal=False)
+    volume = [0]
+
+    def change():
+        volume[0] += 1
+        config.set_entry("buzzer", "buzzer_volume", volume[0])
+
+    def read_sync():
+        config.loaded = False
+        config.read()
+
+    def read_event_loop():
+        config.loaded = False
+        asyncio.run(config.read_async())
+
+    def write_sync():
+        change()
+        config.write()
+
+    def write_event_loop():
+        change()
+        asyncio.run(config.write_async())
+
+    results = {}
+    for name, function in (("read_sync", read_sync), ("read_event_loop", read_event_loop), ("write_sync", write_sync), ("write_event_loop", write_event_loop)):
+        elapsed, allocated = host.measure(function, iterations)
+        results[name] = {"us": elapsed, "bytes": allocated}
+
+    # Auto-save must write exactly once per change
+    config.auto_save = True
+    writes = config.write_count
+    config["auto_save", "first"] = 1
+    config["auto_save", "second"] = 2
+    config.set_entry("auto_save", "second", 2)  # Unchanged
+    results["auto_save_writes"] = config.write_count - writes
+    if results["auto_save_writes"] != 2:
+        raise AssertionError(f"Expected 2 auto-save writes, got {results['auto_save_writes']}.")
+
+    return results
+
+def main():
+    """Prints the synchronous API benchmark results."""
+    results = run()
+
+    for operation in ("read", "write"):
+        sync = results[f"{operation}_sync"]
+        event_loop = results[f"{operation}_event_loop"]
+        print(operation)
+        print(f"  synchronous:          {sync['us']:.1f}us, {sync['bytes']} bytes")
+        print(f"  event loop per call:  {event_loop['us']:.1f}us, {event_loop['bytes']} bytes")
+        print(f"  overhead removed:     {event_loop['us'] - sync['us']:.1f}us per call")
+
+    print(f"auto-save writes for 2 changes: {results['auto_save_writes']}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+# Goat - SecureMe benchmark configurations
+# © (c) 2025 Goat Technologies
+# https://github.com/CodeGoat-dev/SecureMe
+# Description:
+# Generates INI-style configuration text for ConfigManager benchmarks.
+
+# A configuration matching the layout written by the SecureMe firmware
+SMALL_CONFIG = """[security]
+detect_motion=true
+detect_tilt=true
+detect_sound=true
+sensor_cooldown=10
+arming_cooldown=10
+pir_warmup_time=60
+security_code="0000"
+
+[alarm]
+alarm_sound=0
+
+[buzzer]
+buzzer_volume=3072
+
+[network]
+hostname="SecureMe"
+ip_address="0.0.0.0"
+subnet_mask="0.0.0.0"
+gateway="0.0.0.0"
+dns="0.0.0.0"
+
+[pushover]
+system_status_notifications=true
+general_notifications=true
+security_code_notifications=true
+web_interface_notifications=true
+update_notifications=true
+
+[server]
+address="0.0.0.0"
+http_port=8000
+admin_password="secureme"
+
+[update]
+enable_auto_update=true
+update_check_interval=30
+
+[time]
+enable_time_sync=true
+time_sync_server="https://goatbot.org"
+time_sync_interval=360
+
+"""
+
+def generate_config(lines, entries_per_section=9):
+    """Generates a configuration with approximately the given number of lines.
+
+    Args:
+    - lines: The number of lines to generate.
+    - entries_per_section: The number of entries in each section.
+    """
+    parts = []
+    count = 0
+    section = 0
+
+    while count < lines:
+        parts.append(f"[section_{section}]\n")
+        count += 1
+        for entry in range(entries_per_section):
+            kind = entry % 4
+            if kind == 0:
+                value = f'"value {section}.{entry}"'
+            elif kind == 1:
+                value = "true" if entry % 2 else "false"
+            elif kind == 2:
+                value = str(section * 100 + entry)
+            else:
+                value = f"!alpha,beta,{section}"
+            parts.append(f"key_{entry}={value}\n")
+            count += 1
+        parts.append("\n")
+        count += 1
+        section += 1
+
+    return "".join(parts)
+
+def text_lines(text):
+    """Splits configuration text into lines as read from a text file."""
+    return [line + "\n" for line in text.split("\n")]
+
+def byte_lines(text):
+    """Splits configuration text into lines as read from a binary file."""
+    return [line.encode() for line in text_lines(text)]
@@ -0,0 +1,157 @@
+# Goat - SecureMe host benchmark support
+# © (c) 2025 Goat Technologies
+# https://github.com/CodeGoat-dev/SecureMe
+# Description:
+# Prepares a host Python interpreter to import SecureMe firmware modules.
+# Supports CPython and the MicroPython unix port.
+# Under CPython, MicroPython module names are mapped to their CPython equivalents
+# and heap statistics are derived from tracemalloc.
+# Native and viper functions run as regular Python, so their host timings do not reflect the device.
+
+# Imports
+import gc
+import sys
+
+IS_MICROPYTHON = sys.implementation.name == "micropython"
+
+# Directory containing the firmware sources
+_here = __file__.rsplit("/", 1)[0] if "/" in __file__ else "."
+SRC_DIRECTORY = _here + "/../src"
+
+if SRC_DIRECTORY not in sys.path:
+    sys.path.insert(0, SRC_DIRECTORY)
+
+if IS_MICROPYTHON:
+    import utime
+
+    def ticks_us():
+        """Returns a microsecond timestamp."""
+        return utime.ticks_us()
+
+    def ticks_diff(end, start):
+        """Returns the difference between two timestamps."""
+        return utime.ticks_diff(end, start)
+
+    def start_allocations():
+        """Starts measuring heap allocations."""
+        gc.collect()
+        gc.disable()
+        return gc.mem_alloc()
+
+    def stop_allocations(start):
+        """Stops measuring heap allocations and returns the bytes allocated."""
+        allocated = gc.mem_alloc() - start
+        gc.enable()
+        return allocated
+
+    def heap_in_use():
+        """Returns the heap currently in use in bytes."""
+        gc.collect()
+        return gc.mem_alloc()
+else:
+    import asyncio
+    import binascii
+    import os
+    import struct
+    import time
+    import tracemalloc
+    import types
+
+    # Map MicroPython module names to their CPython equivalents
+    sys.modules.setdefault("uos", os)
+    sys.modules.setdefault("uasyncio", asyncio)
+    sys.modules.setdefault("ustruct", struct)
+    sys.modules.setdefault("ubinascii", binascii)
+
+    if "utime" not in sys.modules:
+        utime = types.ModuleType("utime")
+        utime.time = lambda: int(time.time())
+        utime.sleep = time.sleep
+        utime.sleep_ms = lambda ms: time.sleep(ms / 1000)
+        utime.ticks_ms = lambda: time.monotonic_ns() // 1000000
+        utime.ticks_us = lambda: time.monotonic_ns() // 1000
+        utime.ticks_diff = lambda end, start: end - start
+        utime.ticks_add = lambda ticks, delta: ticks + delta
+        sys.modules["utime"] = utime
+
+    # Code emitter decorators run functions as regular Python, with viper pointer casts as plain buffers
+    if "micropython" not in sys.modules:
+        import builtins
+
+        micropython = types.ModuleType("micropython")
+        micropython.native = lambda function: function
+        micropython.viper = lambda function: function
+        sys.modules["micropython"] = micropython
+        builtins.ptr8 = lambda buffer: buffer
+
+    # Heap statistics for host runs, derived from tracemalloc
+    HOST_HEAP_SIZE = 256 * 1024 * 1024
+
+    if not hasattr(gc, "mem_alloc"):
+        gc.mem_alloc = lambda: tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else 0
+        gc.mem_free = lambda: HOST_HEAP_SIZE - gc.mem_alloc()
+        gc.threshold = lambda amount=None: None
+
+    def ticks_us():
+        """Returns a microsecond timestamp."""
+        return time.perf_counter_ns() // 1000
+
+    def ticks_diff(end, start):
+        """Returns the difference between two timestamps."""
+        return end - start
+
+    def start_allocations():
+        """Starts measuring heap allocations."""
+        gc.collect()
+        tracemalloc.start()
+        return 0
+
+    def stop_allocations(start):
+        """Stops measuring heap allocations and returns the peak bytes allocated."""
+        allocated = tracemalloc.get_traced_memory()[1] - start
+        tracemalloc.stop()
+        return allocated
+
+    def heap_in_use():
+        """Returns the heap currently traced in bytes."""
+        gc.collect()
+        return tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else 0
+
+def scratch_directory(name):
+    """Returns an empty scratch directory for benchmark files.
+
+    Args:
+    - name: The name of the benchmark using the directory.
+    """
+    import uos
+
+    path = f"/tmp/secureme_bench_{name}"
+    try:
+        uos.mkdir(path)
+    except OSError:
+        for filename in uos.listdir(path):
+            uos.remove(f"{path}/{filename}")
+
+    return path
+
+def measure(function, iterations=100):
+    """Measures the average time and allocations of a function.
+
+    Args:
+    - function: The callable to measure.
+    - iterations: The number of timed iterations.
+
+    Returns a tuple of (microseconds per call, bytes allocated per call).
+    """
+    function()  # Warm up
+
+    start = ticks_us()
+    for _ in range(iterations):
+        function()
+    elapsed = ticks_diff(ticks_us(), start)
+
+    allocation_start = start_allocations()
+    function()
+    allocated = stop_allocations(allocation_start)
+
+    return elapsed / iterations, allocated
@@ -0,0 +1,98 @@
+# Goat - SecureMe HTTP dispatch benchmark
+# © (c) 2025 Goat Technologies
+# https://github.com/CodeGoat-dev/SecureMe
+# Description:
+# Compares the (method, path) route table with the previous substring route chain.
+# Reports dispatch time per request and the route chosen for early, late, unknown and wrong-method requests.
+# Usage (from the repository root):
+#   python bench/http_dispatch.py
+#   micropython bench/http_dispatch.py
+
+# Imports
+import host
+import HTTPServer
+from http_parse import GET_REQUEST, BufferReader, run_coroutine
+
+# Routes in the order the web server previously tested them
+LEGACY_CHAIN = (
+    "GET /network_settings", "GET /web_interface_settings", "GET /detection_settings", "GET /change_password",
+    "GET /pushover_settings", "GET /change_security_code", "GET /auto_update_settings", "GET /time_sync_settings",
+    "GET /reset_firmware", "GET /memory", "GET /reboot_device", "GET /", "POST /update_network_settings",
+    "POST /update_web_interface_settings", "POST /update_detection_settings", "POST /update_pushover_settings",
+    "POST /update_security_code", "POST /update_password", "POST /update_auto_update_settings",
+    "POST /update_time_sync_settings", "POST /reboot_device", "POST /reset_firmware",
+)
+
+CASES = (
+    ("early", "GET", "/network_settings"),
+    ("late", "POST", "/reset_firmware"),
+    ("index", "GET", "/"),
+    ("unknown", "GET", "/favicon.ico"),
+    ("wrong_method", "POST", "/memory"),
+)
+
+def build_router():
+    """Builds a route table matching the web server routes."""
+    router = HTTPServer.Router()
+    for route in LEGACY_CHAIN:
+        method, path = route.split(" ")
+
+        async def handler(server, request, route=route):
+            return route
+
+        router.add(method, path, handler)
+    return router
+
+def legacy_dispatch(text):
+    """Chooses a route the way the web server previously did."""
+    for route in LEGACY_CHAIN:
+        if route in text:
+            return route
+    return None
+
+def router_dispatch(router, request):
+    """Chooses a route through the route table."""
+    handler, status = router.match(request.method, request.path)
+    if handler is None:
+        return status
+    return run_coroutine(handler(None, request))
+
+def run(iterations=2000):
+    """Runs the dispatch benchmark and returns the results."""
+    router = build_router()
+    results = {}
+
+    for name, method, path in CASES:
+        data = GET_REQUEST.replace(b"GET /detection_settings", f"{method} {path}".encode())
+        text = data.decode()
+        request = run_coroutine(HTTPServer.read_request(BufferReader(data)))
+
+        legacy_us, legacy_bytes = host.measure(lambda: legacy_dispatch(text), iterations)
+        router_us, router_bytes = host.measure(lambda: router_dispatch(router, request), iterations)
+
+        results[name] = {
+            "request": f"{method} {path}",
+            "legacy_route": legacy_dispatch(text),
+            "legacy_us": legacy_us,
+            "router_result": router_dispatch(router, request),
+            "router_us": router_us,
+            "router_bytes": router_bytes,
+        }
+
+    if results["unknown"]["router_result"] != 404 or results["wrong_method"]["router_result"] != 405:
+        raise AssertionError("Unknown requests were not rejected.")
+
+    return results
+
+def main():
+    """Prints the dispatch benchmark results."""
+    results = run()
+
+    for name, method, path in CASES:
+        result = results[name]
+        print(f"{name}: {result['request']}")
+        print(f"  substring chain: {result['legacy_us']:.2f}us -> {result['legacy_route']}")
+        print(f"  route table:     {result['router_us']:.2f}us, {result['router_bytes']} bytes -> {result['router_result']}")
+
+if __name__ == "__main__":
+    main()
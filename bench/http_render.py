@@ -0,0 +1,142 @@
+# Goat - SecureMe page rendering benchmark
+# © (c) 2025 Goat Technologies
+# https://github.com/CodeGoat-dev/SecureMe
+# Description:
+# Compares streamed generator templates with the previous concatenated page responses.
+# Reports render time and peak heap per page for a typical settings form and larger pages.
+# Usage (from the repository root):
+#   python bench/http_render.py
+#   micropython bench/http_render.py
+
+# Imports
+import host
+import HTTPServer
+from http_parse import run_coroutine
+
+HEADER = """<html>
+        <head><title>{title}</title></head>
+        <body>
+        <h1>{title}</h1>
+        <p>Welcome to Goat - SecureMe.</p>
+        <p><a href="/">Home</a></p>
+        """
+
+FOOTER = """<h1>Information</h1>
+        <p>Date: 01/01/2025<br>
+        time: 12:00</p>
+        <p>Check out other Goat Technologies offerings at <a href="https://goatbot.org/">Goatbot.org</a></p>
+        <p>Contribute to <b>SecureMe</b> on <a href="https://github.com/CodeGoat-dev/SecureMe">GitHub</a></p>
+        <p><b>Version 1.6.0</b><br>
+        <b>© (c) 2024-2025 Goat Technologies</b></p>
+        </body>
+        </html>"""
+
+# A settings form of the same shape and size as the detection settings page
+FORM_SECTION = """
+            <h3>Cooldown Settings</h3>
+            <p>After detecting motion, the system will cool down for a specified time before detecting again.<br>
+            The cooldown is applied separately per sensor.</p>
+            <label for="sensor_cooldown">Sensor Cooldown Time (Sec):</label>
+            <input type="number" id="sensor_cooldown" name="sensor_cooldown" minlength=1 maxlength=2 value="{value}" required><br>
+"""
+
+def form_body(sections):
+    """Builds a settings form body with the given number of sections."""
+    body = """<h2>Detection Settings</h2>
+        <form method="POST" action="/update_detection_settings">"""
+    for index in range(sections):
+        body += FORM_SECTION.format(value=index)
+    return body + """<input type="submit" value="Save Settings">
+        </form><br>
+        """
+
+def legacy_page(title, body):
+    """Builds a response the way the web server previously did."""
+    template = HEADER.format(title=title)
+    template += body
+    template += FOOTER
+    response = "HTTP/1.1 200 OK\r\nContent-Type: text/html\r\n\r\n" + template
+    return response.encode()
+
+def streamed_page(title, body):
+    """Generates a page the way the web server templates now do."""
+    yield HEADER.format(title=title)
+    yield body
+    yield FOOTER
+
+# SinkWriter class
+class SinkWriter:
+    """Provides the stream writer interface, keeping only the written size or data."""
+    def __init__(self, keep=False):
+        self.size = 0
+        self.data = bytearray() if keep else None
+
+    def write(self, data):
+        self.size += len(data)
+        if self.data is not None:
+            self.data.extend(data)
+
+    async def drain(self):
+        pass
+
+def legacy_send(title, body):
+    """Sends a page the way the web server previously did."""
+    writer = SinkWriter()
+    writer.write(legacy_page(title, body))
+    return writer.size
+
+def streamed_send(title, body):
+    """Sends a page with chunked streaming."""
+    writer = SinkWriter()
+    run_coroutine(HTTPServer.send_stream(writer, streamed_page(title, body)))
+    return writer.size
+
+def decode_chunked(data):
+    """Returns the body of a chunked response."""
+    body = bytearray()
+    offset = data.find(b"\r\n\r\n") + 4
+    while True:
+        end = data.find(b"\r\n", offset)
+        size = int(data[offset:end], 16)
+        if not size:
+            return bytes(body)
+        body.extend(data[end + 2:end + 2 + size])
+        offset = end + 4 + size
+
+def run(iterations=200):
+    """Runs the page rendering benchmark and returns the results."""
+    results = {}
+
+    for name, sections in (("form", 4), ("large", 16), ("very_large", 64)):
+        body = form_body(sections)
+        page = legacy_page("Detection Settings", body)
+
+        writer = SinkWriter(keep=True)
+        run_coroutine(HTTPServer.send_stream(writer, streamed_page("Detection Settings", body)))
+        if decode_chunked(bytes(writer.data)) != page[page.find(b"\r\n\r\n") + 4:]:
+            raise AssertionError(f"Streamed output mismatch for the {name} page.")
+
+        legacy_us, legacy_bytes = host.measure(lambda: legacy_send("Detection Settings", body), iterations)
+        streamed_us, streamed_bytes = host.measure(lambda: streamed_send("Detection Settings", body), iterations)
+
+        results[name] = {
+            "page_bytes": len(page),
+            "legacy_us": legacy_us,
+            "legacy_peak_bytes": legacy_bytes,
+            "streamed_us": streamed_us,
+            "streamed_peak_bytes": streamed_bytes,
+        }
+
+    return results
+
+def main():
+    """Prints the page rendering benchmark results."""
+    results = run()
+
+    for name, result in results.items():
+        print(f"{name} ({result['page_bytes']} bytes)")
+        print(f"  concatenated: {result['legacy_us']:.1f}us, peak {result['legacy_peak_bytes']} bytes")
+        print(f"  streamed:     {result['streamed_us']:.1f}us, peak {result['streamed_peak_bytes']} bytes")
+
+if __name__ == "__main__":
+    main()
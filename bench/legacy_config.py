@@ -0,0 +1,51 @@
+# Goat - SecureMe legacy configuration parser
+# © (c) 2024-2025 Goat Technologies
+# https://github.com/CodeGoat-dev/SecureMe
+# Description:
+# The regular expression based parser used by ConfigManager 1.0.0.
+# Retained as a baseline for configuration benchmarks.
+
+# Imports
+import re
+
+def parse_lines(lines, config=None, sections=None):
+    """Parses INI-style configuration lines using regular expressions."""
+    if config is None:
+        config = {}
+    if sections is None:
+        sections = []
+
+    section_re = re.compile(r'\[(.*)\]')
+    entry_re = re.compile(r'(.*?)=(.*)')
+    string_re = re.compile(r'^"(.*)"$')
+    int_re = re.compile(r'^\d+$')
+    bool_re = re.compile(r'^(true|false)$')
+    comment_re = re.compile(r'^#.*')
+
+    current_section = None
+    for line in lines:
+        line = line.strip()
+        if not line or comment_re.match(line):
+            continue
+        if section_re.match(line):
+            current_section = section_re.match(line).group(1)
+            if current_section not in sections:
+                sections.append(current_section)
+            config[current_section] = {}
+        elif current_section and entry_re.match(line):
+            entry = entry_re.match(line)
+            key = entry.group(1).strip()
+            value = entry.group(2).strip()
+            if string_re.match(value):
+                value = string_re.match(value).group(1)
+            elif bool_re.match(value.lower()):
+                value = value.lower() == "true"
+            elif int_re.match(value):
+                value = int(value)
+            elif value.startswith('!'):
+                value = [v.strip() for v in value[1:].split(',')]
+            config[current_section][key] = value
+        else:
+            raise ValueError(f"Invalid format in line: {line}")
+
+    return config
@@ -0,0 +1,574 @@
+# Goat - SecureMe HTTP load test
+# © (c) 2025 Goat Technologies
+# https://github.com/CodeGoat-dev/SecureMe
+# Description:
+# Drives the web interface or captive portal with concurrent clients over real sockets.
+# Reports requests per second, p50 and p99 latency and error rate per route, and heap use during the run.
+# Web interface runs log in first and include authenticated configuration writes, which are restored afterwards.
+# Without --host, a local server built from the shared HTTP library is started on localhost,
+# serving the web interface and captive portal request paths with the firmware connection handling.
+# Usage (from the repository root):
+#   python bench/loadtest.py
+#   python bench/loadtest.py --target portal --clients 8
+#   python bench/loadtest.py --host 192.168.1.50 --port 8000 --password secureme --clients 4 --duration 10
+#   python bench/loadtest.py --target portal --host 192.168.4.1 --port 80
+#   micropython bench/loadtest.py
+
+# Imports
+import host
+import gc
+import json
+import sys
+import uasyncio as asyncio
+from ConfigManager import ConfigManager
+from config_schema import SCHEMA
+import HTTPServer
+from SessionManager import SessionManager
+
+DEFAULTS = {
+    "target": "web",
+    "host": None,
+    "port": 0,
+    "clients": 4,
+    "duration": 10,
+    "password": "secureme",
+}
+
+SESSION_COOKIE = "secureme_session"
+
+# Routes requested by each web interface client in turn, as (name, method, path, expected status)
+WEB_ROUTES = (
+    ("GET /", "GET", "/", 200),
+    ("GET /memory", "GET", "/memory", 200),
+    ("GET /api/status", "GET", "/api/status", 200),
+    ("GET /api/config/time", "GET", "/api/config/time", 200),
+    ("PATCH /api/config/time", "PATCH", "/api/config/time", 200),
+    ("POST /update_time_sync_settings", "POST", "/update_time_sync_settings", 303),
+)
+
+# Connectivity checks and pages requested by captive portal clients
+PORTAL_ROUTES = (
+    ("GET /", "GET", "/", 200),
+    ("GET /generate_204", "GET", "/generate_204", 204),
+    ("GET /hotspot-detect.html", "GET", "/hotspot-detect.html", 200),
+    ("GET /success.conf", "GET", "/success.conf", 200),
+    ("GET /ncsi.conf", "GET", "/ncsi.conf", 200),
+)
+
+def parse_arguments(argv):
+    """Parses --name value command line arguments over the defaults."""
+    options = dict(DEFAULTS)
+    index = 1
+    while index < len(argv):
+        name = argv[index][2:]
+        if not argv[index].startswith("--") or name not in options or index + 1 >= len(argv):
+            raise ValueError(f"Unknown argument: {argv[index]}")
+        default = DEFAULTS[name]
+        options[name] = int(argv[index + 1]) if isinstance(default, int) else argv[index + 1]
+        index += 2
+    return options
+
+def percentile(values, fraction):
+    """Returns a percentile of a sorted list of values."""
+    if not values:
+        return 0
+    return values[min(len(values) - 1, int(fraction * (len(values) - 1) + 0.5))]
+
+# Client class
+class Client:
+    """Sends HTTP/1.1 requests over a single connection, reconnecting when the server closes it."""
+    def __init__(self, address, port, keep_alive=True):
+        """Constructs the class and exposes properties.
+
+        Args:
+        - address: The server address.
+        - port: The server port.
+        - keep_alive: Whether to reuse the connection between requests.
+        """
+        self.address = address
+        self.port = port
+        self.keep_alive = keep_alive
+        self.cookie = None
+        self.reader = None
+        self.writer = None
+
+    async def close(self):
+        """Closes the connection."""
+        if self.writer is not None:
+            try:
+                self.writer.close()
+                await self.writer.wait_closed()
+            except OSError:
+                pass
+        self.reader = None
+        self.writer = None
+
+    async def request(self, method, path, body=b"", content_type=None):
+        """Sends a request and returns a tuple of (status, headers, body)."""
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection(self.address, self.port)
+
+        headers = f"{method} {path} HTTP/1.1\r\nHost: {self.address}\r\n"
+        if not self.keep_alive:
+            headers += "Connection: close\r\n"
+        if self.cookie:
+            headers += f"Cookie: {SESSION_COOKIE}={self.cookie}\r\n"
+        if body:
+            headers += f"Content-Type: {content_type}\r\nContent-Length: {len(body)}\r\n"
+        self.writer.write(headers.encode() + b"\r\n" + body)
+        await self.writer.drain()
+
+        try:
+            status, response_headers, response_body = await self.read_response()
+        except Exception:
+            await self.close()
+            raise
+
+        if not self.keep_alive or response_headers.get("connection", "").lower() == "close":
+            await self.close()
+
+        return status, response_headers, response_body
+
+    async def read_response(self):
+        """Reads a response, framed by Content-Length, chunked encoding or the connection closing."""
+        line = await self.reader.readline()
+        if not line:
+            raise OSError("Connection closed by the server.")
+        status = int(line.split()[1])
+
+        headers = {}
+        while True:
+            line = await self.reader.readline()
+            if not line or line in (b"\r\n", b"\n"):
+                break
+            name, _, value = line.decode().partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        if status in (204, 304):
+            body = b""
+        elif "content-length" in headers:
+            body = await self.reader.readexactly(int(headers["content-length"]))
+        elif headers.get("transfer-encoding", "").lower() == "chunked":
+            body = bytearray()
+            while True:
+                size = int((await self.reader.readline()).strip(), 16)
+                data = await self.reader.readexactly(size + 2)
+                if not size:
+                    break
+                body.extend(data[:-2])
+            body = bytes(body)
+        else:
+            # Captive portal responses are delimited by closing the connection
+            body = await self.reader.read(-1)
+            headers["connection"] = "close"
+
+        return status, headers, body
+
+    async def login(self, password):
+        """Logs in to the web interface and keeps the session cookie."""
+        status, headers, body = await self.request("POST", "/login", f"username=admin&password={password}".encode(), "application/x-www-form-urlencoded")
+        cookie = headers.get("set-cookie", "")
+        if status != 303 or not cookie.startswith(SESSION_COOKIE + "="):
+            raise RuntimeError(f"Login failed with status {status}.")
+        self.cookie = cookie[len(SESSION_COOKIE) + 1:].split(";", 1)[0]
+
+# RouteStats class
+class RouteStats:
+    """Collects request latencies and errors for a route."""
+    def __init__(self):
+        self.latencies = []
+        self.errors = 0
+
+    def summary(self, elapsed):
+        """Returns the route results as a dictionary."""
+        latencies = sorted(self.latencies)
+        requests = len(latencies) + self.errors
+        return {
+            "requests": requests,
+            "rps": round(requests / elapsed, 1) if elapsed else 0,
+            "p50_ms": round(percentile(latencies, 0.5) / 1000, 2),
+            "p99_ms": round(percentile(latencies, 0.99) / 1000, 2),
+            "error_rate": round(100 * self.errors / requests, 1) if requests else 0,
+        }
+
+# LoadTest class
+class LoadTest:
+    """Runs concurrent clients against a server for a fixed duration."""
+    def __init__(self, target, address, port, clients, duration, password):
+        """Constructs the class and exposes properties.
+
+        Args:
+        - target: Either "web" or "portal".
+        - address: The server address.
+        - port: The server port.
+        - clients: The number of concurrent clients.
+        - duration: The length of the run in seconds.
+        - password: The web interface administration password.
+        """
+        self.target = target
+        self.address = address
+        self.port = port
+        self.clients = clients
+        self.duration = duration
+        self.password = password
+
+        self.routes = WEB_ROUTES if target == "web" else PORTAL_ROUTES
+        self.stats = {name: RouteStats() for name, _, _, _ in self.routes}
+        self.running = False
+        self.time_settings = None
+
+        # Heap statistics sampled during the run
+        self.peak_heap = 0
+        self.min_mem_free = None
+
+    def request_body(self, name, sequence):
+        """Returns the body and content type for a route."""
+        if name.startswith("PATCH"):
+            # Alternate the value so every write changes the configuration
+            interval = self.time_settings["time_sync_interval"] + sequence % 2
+            return json.dumps({"time_sync_interval": interval}).encode(), "application/json"
+        if name.startswith("POST"):
+            settings = self.time_settings
+            enabled = "enable_time_sync=on&" if settings["enable_time_sync"] else ""
+            return f"{enabled}time_sync_server={settings['time_sync_server']}&time_sync_interval={settings['time_sync_interval'] + sequence % 2}".encode(), "application/x-www-form-urlencoded"
+        return b"", None
+
+    async def run_client(self, index):
+        """Requests each route in turn until the run ends."""
+        client = Client(self.address, self.port, keep_alive=self.target == "web")
+        sequence = index
+        try:
+            if self.target == "web":
+                await client.login(self.password)
+
+            while self.running:
+                name, method, path, expected = self.routes[sequence % len(self.routes)]
+                body, content_type = self.request_body(name, sequence // len(self.routes))
+                sequence += 1
+
+                stats = self.stats[name]
+                start = host.ticks_us()
+                try:
+                    status, _, _ = await client.request(method, path, body, content_type)
+                except Exception:
+                    stats.errors += 1
+                    await asyncio.sleep(0.01)
+                    continue
+
+                if status == expected:
+                    stats.latencies.append(host.ticks_diff(host.ticks_us(), start))
+                else:
+                    stats.errors += 1
+        finally:
+            await client.close()
+
+    async def sample_heap(self, local):
+        """Samples heap use until the run ends, locally or from the device metrics.
+
+        Device metrics require a web interface session, and are not served by the captive portal.
+        """
+        if not local and self.target != "web":
+            print("Heap sampling skipped: the captive portal does not serve /metrics.")
+            return
+
+        client = None if local else Client(self.address, self.port)
+        try:
+            if client is not None:
+                await client.login(self.password)
+
+            while self.running:
+                if local:
+                    self.peak_heap = max(self.peak_heap, gc.mem_alloc())
+                else:
+                    status, _, body = await client.request("GET", "/metrics")
+                    if status != 200:
+                        raise RuntimeError(f"/metrics returned status {status}.")
+                    for line in body.decode().split("\n"):
+                        if line.startswith("secureme_heap_free_bytes "):
+                            free = int(line.split()[1])
+                            if self.min_mem_free is None or free < self.min_mem_free:
+                                self.min_mem_free = free
+                await asyncio.sleep(0.05 if local else 1)
+        except Exception as e:
+            print(f"Heap sampling stopped: {e}")
+        finally:
+            if client is not None:
+                await client.close()
+
+    async def run(self, local=False):
+        """Runs the load test and returns the results."""
+        # Read the settings the configuration writes alternate, so they can be restored afterwards
+        if self.target == "web":
+            client = Client(self.address, self.port)
+            await client.login(self.password)
+            status, _, body = await client.request("GET", "/api/config/time")
+            self.time_settings = json.loads(body)
+            await client.close()
+
+        self.running = True
+        tasks = [asyncio.create_task(self.run_client(index)) for index in range(self.clients)]
+        sampler = asyncio.create_task(self.sample_heap(local))
+
+        start = host.ticks_us()
+        await asyncio.sleep(self.duration)
+        self.running = False
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await sampler
+        elapsed = host.ticks_diff(host.ticks_us(), start) / 1000000
+
+        if self.target == "web":
+            client = Client(self.address, self.port)
+            await client.login(self.password)
+            await client.request("PATCH", "/api/config/time", json.dumps({"time_sync_interval": self.time_settings["time_sync_interval"]}).encode(), "application/json")
+            await client.close()
+
+        results = {
+            "target": self.target,
+            "clients": self.clients,
+            "duration_s": round(elapsed, 1),
+            "routes": {name: stats.summary(elapsed) for name, stats in self.stats.items()},
+        }
+        total = sum(route["requests"] for route in results["routes"].values())
+        errors = sum(stats.errors for stats in self.stats.values())
+        results["rps"] = round(total / elapsed, 1)
+        results["error_rate"] = round(100 * errors / total, 1) if total else 0
+        if local:
+            results["peak_heap_bytes"] = self.peak_heap
+        else:
+            results["min_mem_free_bytes"] = self.min_mem_free
+        return results
+
+# LocalWebServer class
+class LocalWebServer:
+    """Serves the web interface request paths on localhost with the firmware connection handling.
+
+    Pages are generated at the same size as the firmware pages, and configuration writes go to a scratch file.
+    """
+    ROUTES = HTTPServer.Router()
+
+    def __init__(self, password):
+        self.password = password
+        self.connections = HTTPServer.ConnectionPool()
+        self.sessions = SessionManager()
+        self.config = None
+        self.settings = None
+
+    async def initialize(self):
+        """Creates the scratch configuration."""
+        directory = host.scratch_directory("loadtest")
+        self.config = ConfigManager(directory, "secureme.conf")
+        await self.config.load_async()
+        self.settings = await self.config.validate_async(SCHEMA)
+
+    async def handle_request(self, reader, writer):
+        """Handles a connection the way WebServer.handle_request does."""
+        if not await self.connections.acquire():
+            await HTTPServer.Response("The server is busy.", status=503, content_type="text/plain", headers="Retry-After: 1\r\n").send(writer)
+            writer.close()
+            await writer.wait_closed()
+            return
+
+        try:
+            reader = HTTPServer.RequestReader(reader)
+            keep_alive = True
+            reused = False
+            while keep_alive:
+                try:
+                    request = await asyncio.wait_for(HTTPServer.read_request(reader), self.connections.idle_timeout)
+                except asyncio.TimeoutError:
+                    self.connections.idle_timeouts += 1
+                    break
+                except HTTPServer.RequestError as e:
+                    await HTTPServer.send_error(writer, e)
+                    break
+
+                if request is None:
+                    break
+
+                self.connections.record_request(reused)
+                reused = True
+                keep_alive = await self.serve_request(request, writer)
+        except OSError:
+            pass
+        finally:
+            self.connections.release()
+            writer.close()
+            await writer.wait_closed()
+
+    async def serve_request(self, request, writer):
+        """Serves a single request the way WebServer.serve_request does."""
+        chunked = request.version == "HTTP/1.1"
+        keep_alive = chunked and request.header("connection", "").lower() != "close" and not self.connections.queued
+
+        handler, status = self.ROUTES.match(request.method, request.path)
+        if handler is None:
+            response = HTTPServer.Response("Not Found", status=status, content_type="text/plain")
+        elif request.path != "/login" and not self.authenticated(request):
+            response = HTTPServer.json_response({"error": "Unauthorized"}, status=401)
+        else:
+            response = await handler(self, request)
+
+        return await response.send(writer, chunked, keep_alive)
+
+    def authenticated(self, request):
+        """Checks the request carries a valid session cookie."""
+        for cookie in request.header("cookie", "").split(";"):
+            name, _, value = cookie.strip().partition("=")
+            if name == SESSION_COOKIE:
+                return self.sessions.verify(value)
+        return False
+
+    def parse_form_data(self, content):
+        """Parses URL-encoded form data into a dictionary."""
+        post_data = {}
+        for pair in content.split("&"):
+            if "=" in pair:
+                key, value = pair.split("=", 1)
+                post_data[key] = value
+        return post_data
+
+    def render_page(self, title, sections):
+        """Generates a page of a similar size to the firmware pages."""
+        yield f"<html><head><title>{title}</title><link rel=\"stylesheet\" href=\"/static/style.css\"></head><body><h1>{title}</h1>"
+        for index in range(sections):
+            yield f"<h3>Section {index}</h3><p>The settings below control how the SecureMe system behaves.<br>Specify the value you want to use below.</p><label for=\"value{index}\">Value:</label><input type=\"number\" id=\"value{index}\" name=\"value{index}\" value=\"{index}\"><br>"
+        yield "<p><b>Version 1.6.0</b><br><b>© (c) 2024-2025 Goat Technologies</b></p></body></html>"
+
+    @ROUTES.route("POST", "/login")
+    async def login(self, request):
+        post_data = self.parse_form_data(request.text())
+        if self.sessions.check_password(post_data.get("password", ""), self.password):
+            return HTTPServer.Response(None, status=303, headers=f"Location: /\r\nSet-Cookie: {SESSION_COOKIE}={self.sessions.create()}; Path=/; HttpOnly; SameSite=Strict\r\n")
+        return HTTPServer.redirect("/login")
+
+    @ROUTES.route("GET", "/")
+    async def index(self, request):
+        return HTTPServer.Response(self.render_page("Welcome", 4))
+
+    @ROUTES.route("GET", "/memory")
+    async def memory(self, request):
+        return HTTPServer.Response(self.render_page("Memory Telemetry", 12))
+
+    @ROUTES.route("GET", "/api/status")
+    async def api_status(self, request):
+        return HTTPServer.json_response({"version": "1.6.0", "mem_free": gc.mem_free(), "armed": False, "alarm": False})
+
+    @ROUTES.route("GET", "/api/config/*")
+    async def api_get_config(self, request):
+        return HTTPServer.json_response(self.config.get_section(request.path[len("/api/config/"):]))
+
+    @ROUTES.route("PATCH", "/api/config/*")
+    async def api_patch_config(self, request):
+        section = request.path[len("/api/config/"):]
+        changes = json.loads(request.text())
+        for key, value in changes.items():
+            name = self.settings.names.get((section, key))
+            if name is None or self.settings.check(name, value) is None:
+                return HTTPServer.json_response({"error": "Invalid entries", "keys": [key]}, status=400)
+            self.settings.set(name, value)
+        await self.config.write_async()
+        return HTTPServer.json_response({"updated": list(changes)})
+
+    @ROUTES.route("POST", "/update_time_sync_settings")
+    async def update_time_sync_settings(self, request):
+        post_data = self.parse_form_data(request.text())
+        self.settings.set("enable_time_sync", "enable_time_sync" in post_data)
+        self.settings.set("time_sync_server", post_data.get("time_sync_server", ""))
+        self.settings.set("time_sync_interval", post_data.get("time_sync_interval", ""))
+        await self.config.write_async()
+        return HTTPServer.redirect("/")
+
+# LocalPortalServer class
+class LocalPortalServer:
+    """Serves the captive portal request paths on localhost the way NetworkManager.handle_request does."""
+    ROUTES = HTTPServer.Router()
+
+    async def handle_request(self, reader, writer):
+        """Handles a single request per connection."""
+        try:
+            try:
+                request = await HTTPServer.read_request(reader)
+            except HTTPServer.RequestError as e:
+                await HTTPServer.send_error(writer, e)
+                return
+
+            if request is None:
+                return
+
+            handler, status = self.ROUTES.match(request.method, request.path)
+            response = await handler(self, request)
+            writer.write(response.encode())
+            await writer.drain()
+        except OSError:
+            pass
+        finally:
+            writer.close()
+            await writer.wait_closed()
+
+    @ROUTES.route("GET", "/generate_204")
+    async def serve_no_content(self, request):
+        return "HTTP/1.1 204 No Content\r\n\r\n"
+
+    @ROUTES.route("GET", "/hotspot-detect.html")
+    async def serve_hotspot_detect(self, request):
+        return "HTTP/1.1 200 OK\r\nContent-Type: text/html\r\n\r\n<HTML><BODY><H1>Success</H1></BODY></HTML>"
+
+    @ROUTES.route("GET", "/success.conf")
+    async def serve_connect_test(self, request):
+        return "HTTP/1.1 200 OK\r\nContent-Type: text/plain\r\n\r\nMicrosoft Connect Test"
+
+    @ROUTES.route("GET", "/ncsi.conf")
+    async def serve_ncsi(self, request):
+        return "HTTP/1.1 200 OK\r\nContent-Type: text/plain\r\n\r\nMicrosoft NCSI"
+
+    @ROUTES.fallback
+    async def serve_portal(self, request):
+        body = "<html><head><title>Goat - Captive Portal</title></head><body><h1>Goat - Captive Portal</h1>" + "<p>Select a wireless network to connect to.</p>" * 8 + "</body></html>"
+        return "HTTP/1.1 200 OK\r\nContent-Type: text/html\r\n\r\n" + body
+
+async def run(options):
+    """Runs the load test against the configured server, starting a local server if no host is given."""
+    local = options["host"] is None
+    server = None
+    address = options["host"] or "127.0.0.1"
+    port = options["port"] or (8000 if options["target"] == "web" else 80)
+
+    if local:
+        if options["target"] == "web":
+            target = LocalWebServer(options["password"])
+            await target.initialize()
+        else:
+            target = LocalPortalServer()
+        port = options["port"] or 8765
+        server = await asyncio.start_server(target.handle_request, address, port)
+
+    try:
+        test = LoadTest(options["target"], address, port, options["clients"], options["duration"], options["password"])
+        if local and not host.IS_MICROPYTHON:
+            import tracemalloc
+            tracemalloc.start()
+        results = await test.run(local)
+    finally:
+        if server is not None:
+            server.close()
+            await server.wait_closed()
+
+    return results
+
+def main():
+    """Prints the load test results."""
+    options = parse_arguments(sys.argv)
+    results = asyncio.run(run(options))
+
+    print(f"{results['target']}: {results['clients']} clients for {results['duration_s']}s")
+    for name, route in results["routes"].items():
+        print(f"  {name}: {route['requests']} requests, {route['rps']} rps, p50 {route['p50_ms']}ms, p99 {route['p99_ms']}ms, {route['error_rate']}% errors")
+    print(f"  total: {results['rps']} rps, {results['error_rate']}% errors")
+    if "peak_heap_bytes" in results:
+        print(f"  peak heap: {results['peak_heap_bytes']} bytes")
+    else:
+        free = results['min_mem_free_bytes']
+        print(f"  minimum free heap: {'not sampled' if free is None else f'{free} bytes'}")
+
+if __name__ == "__main__":
+    main()
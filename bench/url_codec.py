@@ -0,0 +1,138 @@
+# Goat - SecureMe URL codec benchmark
+# © (c) 2025 Goat Technologies
+# https://github.com/CodeGoat-dev/SecureMe
+# Description:
+# Compares the single pass percent codec in utils with the previous form decoding and encoding.
+# Reports time and allocations per call for web interface forms, captive portal credentials and notifications,
+# and whether the previous functions preserved each value.
+# The codec is compiled with the viper emitter on the device. Under CPython it runs as regular Python,
+# so only MicroPython timings show its speed.
+# Usage (from the repository root):
+#   python bench/url_codec.py
+#   micropython bench/url_codec.py
+
+# Imports
+import host
+import utils
+
+# Form bodies as sent by browsers, with the values they encode
+FORMS = (
+    ("settings form", {
+        "pushover_token": "a" * 30,
+        "pushover_key": "u" * 30,
+        "status_notifications": "on",
+        "general_notifications": "on",
+        "security_code_notifications": "on",
+    }),
+    ("time sync form", {
+        "enable_time_sync": "on",
+        "time_sync_server": "https://goatbot.org/api/time?zone=Europe/London",
+        "time_sync_interval": "360",
+    }),
+    ("portal credentials", {
+        "ssid": "Café Guest Wi-Fi",
+        "password": "p@ss w0rd+100%&more",
+    }),
+)
+
+# Notifications as sent to Pushover
+NOTIFICATION = {
+    "token": "a" * 30,
+    "user": "u" * 30,
+    "message": "Motion detected while armed & alarm raised (sensitivity = 80%).",
+    "priority": 1,
+    "title": "Security Alert",
+}
+
+def legacy_urlencode(data):
+    """Encodes a dictionary the way utils.urlencode previously did, without escaping."""
+    return "&".join(f"{key}={value}" for key, value in data.items())
+
+def legacy_urldecode(value):
+    """Decodes a value the way utils.urldecode previously did, a character at a time."""
+    result = []
+    i = 0
+    while i < len(value):
+        if value[i] == "%" and i + 2 < len(value):
+            hex_value = value[i+1:i+3]
+            try:
+                result.append(chr(int(hex_value, 16)))
+                i += 3
+            except ValueError:
+                result.append(value[i])
+                i += 1
+        else:
+            result.append(value[i])
+            i += 1
+    return "".join(result)
+
+def legacy_parse_form_data(content):
+    """Parses form data the way WebServer.parse_form_data previously did."""
+    post_data = {}
+    for pair in content.split("&"):
+        if "=" in pair:
+            key, value = pair.split("=", 1)
+            post_data[legacy_urldecode(key)] = legacy_urldecode(value)
+    return post_data
+
+def legacy_parse_portal(content):
+    """Parses form data the way the captive portal previously did."""
+    params = {}
+    for kv in content.split("&"):
+        if "=" in kv:
+            key, value = kv.split("=", 1)
+            params[key] = value.replace("+", " ").replace("%20", " ")
+    return params
+
+def run(iterations=500):
+    """Runs the URL codec benchmark and returns the results."""
+    results = {}
+
+    for name, form in FORMS:
+        body = utils.urlencode(form)
+        if utils.parse_form(body) != form:
+            raise AssertionError(f"Codec round trip mismatch for the {name}.")
+
+        legacy = legacy_parse_portal if name == "portal credentials" else legacy_parse_form_data
+        legacy_us, legacy_bytes = host.measure(lambda: legacy(body), iterations)
+        codec_us, codec_bytes = host.measure(lambda: utils.parse_form(body), iterations)
+
+        results[name] = {
+            "body_bytes": len(body),
+            "legacy_correct": legacy(body) == form,
+            "legacy_us": legacy_us,
+            "legacy_bytes": legacy_bytes,
+            "codec_us": codec_us,
+            "codec_bytes": codec_bytes,
+        }
+
+    expected = dict((key, str(value)) for key, value in NOTIFICATION.items())
+    body = utils.urlencode(NOTIFICATION)
+    if utils.parse_form(body) != expected:
+        raise AssertionError("Codec round trip mismatch for the notification.")
+
+    legacy_us, legacy_bytes = host.measure(lambda: legacy_urlencode(NOTIFICATION), iterations)
+    codec_us, codec_bytes = host.measure(lambda: utils.urlencode(NOTIFICATION), iterations)
+
+    results["notification"] = {
+        "body_bytes": len(body),
+        "legacy_correct": utils.parse_form(legacy_urlencode(NOTIFICATION)) == expected,
+        "legacy_us": legacy_us,
+        "legacy_bytes": legacy_bytes,
+        "codec_us": codec_us,
+        "codec_bytes": codec_bytes,
+    }
+
+    return results
+
+def main():
+    """Prints the URL codec benchmark results."""
+    results = run()
+
+    for name, result in results.items():
+        print(f"{name} ({result['body_bytes']} bytes)")
+        print(f"  previous: {result['legacy_us']:.1f}us, {result['legacy_bytes']} bytes{'' if result['legacy_correct'] else ' (values corrupted)'}")
+        print(f"  codec:    {result['codec_us']:.1f}us, {result['codec_bytes']} bytes")
+
+if __name__ == "__main__":
+    main()
@@ -6,15 +6,593 @@
 # Provides INI-style configuration file support for Micropython firmware.
 
 # Imports
-import re
+import gc
 import uos
+import ustruct
+import ubinascii
+import utime
 import uasyncio as asyncio
+from FlashScheduler import scheduler as flash_scheduler
+from Logger import get_logger
+from MemoryMonitor import monitor
+from Metrics import metrics
+
+# Logging
+log = get_logger("ConfigManager")
+
+# Byte values used by the parser
+_HASH = 35  # '#'
+_QUOTE = 34  # '"'
+_BANG = 33  # '!'
+_OPEN_BRACKET = 91  # '['
+_CLOSE_BRACKET = b']'
+_EQUALS = b'='
+_COMMA = b','
+
+def parse_value(value):
+    """Converts a raw configuration value to its typed representation.
+
+    Args:
+    - value: The stripped value bytes.
+
+    Quoted values are strings, true/false are booleans, digits are integers
+    and values prefixed with '!' are comma separated lists.
+    """
+    length = len(value)
+
+    if length >= 2 and value[0] == _QUOTE and value[-1] == _QUOTE:
+        return value[1:-1].decode()
+    if length == 4 or length == 5:
+        lowered = value.lower()
+        if lowered == b'true':
+            return True
+        if lowered == b'false':
+            return False
+    if length and value.isdigit():
+        return int(value)
+    if length and value[0] == _BANG:
+        return [item.strip().decode() for item in value[1:].split(_COMMA)]
+
+    return value.decode()
+
+def index_sections(lines):
+    """Builds a byte-offset index of section headers in a single scan.
+
+    Args:
+    - lines: An iterable of configuration lines as bytes, such as a file opened in binary mode.
+
+    Returns a tuple of (sections, index), where index maps each section name to the
+    (start, end) byte offsets of the section including its header.
+    """
+    sections = []
+    index = {}
+
+    current_section = None
+    start = 0
+    offset = 0
+
+    for line in lines:
+        if line and (line[0] == _OPEN_BRACKET or line[0] == 32 or line[0] == 9):
+            stripped = line.strip()
+            end = stripped.rfind(_CLOSE_BRACKET) if stripped and stripped[0] == _OPEN_BRACKET else -1
+            if end > 0:
+                if current_section is not None:
+                    index[current_section] = (start, offset)
+                current_section = stripped[1:end].decode()
+                if current_section not in sections:
+                    sections.append(current_section)
+                start = offset
+
+        offset += len(line)
+
+    if current_section is not None:
+        index[current_section] = (start, offset)
+
+    return sections, index
+
+def format_value(value):
+    """Converts a typed configuration value to its raw representation.
+
+    Args:
+    - value: The value to convert.
+    """
+    if isinstance(value, str):
+        return f'"{value}"'
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, list):
+        return f"!{','.join(map(str, value))}"
+
+    return str(value)
+
+def parse_lines(lines, config=None, sections=None):
+    """Parses INI-style configuration lines in a single pass.
+
+    Args:
+    - lines: An iterable of configuration lines as bytes, such as a file opened in binary mode.
+    - config: The dictionary to populate (default: a new dictionary).
+    - sections: The list of section names to populate (default: a new list).
+    """
+    if config is None:
+        config = {}
+    if sections is None:
+        sections = []
+
+    for _ in parse_steps(lines, config, sections):
+        pass
+
+    return config
+
+def parse_steps(lines, config, sections):
+    """Parses INI-style configuration lines, yielding before each section after the first.
+
+    Args:
+    - lines: An iterable of configuration lines as bytes, such as a file opened in binary mode.
+    - config: The dictionary to populate.
+    - sections: The list of section names to populate.
+    """
+    current_section = None
+    entries = None
+
+    for line in lines:
+        line = line.strip()
+        if not line or line[0] == _HASH:
+            continue
+
+        if line[0] == _OPEN_BRACKET:
+            end = line.rfind(_CLOSE_BRACKET)
+            if end > 0:
+                if current_section is not None:
+                    yield
+                current_section = line[1:end].decode()
+                if current_section not in sections:
+                    sections.append(current_section)
+                entries = {}
+                config[current_section] = entries
+                continue
+
+        separator = line.find(_EQUALS) if current_section else -1
+        if separator < 0:
+            raise ValueError(f"Invalid format in line: {line.decode()}")
+
+        entries[line[:separator].strip().decode()] = parse_value(line[separator + 1:].strip())
+
+def serialize_section(section, entries):
+    """Serializes a configuration section to INI-style text.
+
+    Args:
+    - section: The section name.
+    - entries: The dictionary of section entries.
+    """
+    lines = [f'[{section}]\n']
+    for key, value in entries.items():
+        lines.append(f'{key}={format_value(value)}\n')
+    lines.append('\n')
+
+    return ''.join(lines)
+
+def serialize_sections(config):
+    """Serializes a configuration to INI-style text one section at a time.
+
+    Args:
+    - config: The configuration dictionary to serialize.
+
+    Yields the text of each section.
+    """
+    for section, entries in config.items():
+        yield serialize_section(section, entries)
+
+def serialize(config):
+    """Serializes a configuration to INI-style text.
+
+    Args:
+    - config: The configuration dictionary to serialize.
+    """
+    return ''.join(serialize_sections(config))
+
+# Compiled snapshot format
+_SNAPSHOT_MAGIC = b'GSC1'
+_SNAPSHOT_HEADER = "<4sIIHH"  # Magic, source mtime, source size, string count, section count
+_SNAPSHOT_HEADER_SIZE = ustruct.calcsize(_SNAPSHOT_HEADER)
+_TYPE_FALSE = 0
+_TYPE_TRUE = 1
+_TYPE_INT = 2
+_TYPE_STR = 3
+_TYPE_LIST = 4
+_TYPE_LONG = 5
+
+def pack_snapshot(config, mtime, size):
+    """Compiles a configuration into a binary snapshot.
+
+    Args:
+    - config: The configuration dictionary to compile.
+    - mtime: The modification time of the source configuration file.
+    - size: The size in bytes of the source configuration file.
+
+    Section names, keys and string values are interned in a string table
+    so repeated names are stored and loaded once.
+    """
+    strings = {}
+    table = bytearray()
+    body = bytearray()
+
+    def intern(text):
+        index = strings.get(text)
+        if index is None:
+            index = len(strings)
+            strings[text] = index
+            data = text.encode()
+            table.extend(ustruct.pack("<H", len(data)))
+            table.extend(data)
+        return index
+
+    for section, entries in config.items():
+        body.extend(ustruct.pack("<HH", intern(section), len(entries)))
+        for key, value in entries.items():
+            if isinstance(value, bool):
+                body.extend(ustruct.pack("<HB", intern(key), _TYPE_TRUE if value else _TYPE_FALSE))
+            elif isinstance(value, int):
+                if -0x80000000 <= value <= 0x7fffffff:
+                    body.extend(ustruct.pack("<HBi", intern(key), _TYPE_INT, value))
+                else:
+                    body.extend(ustruct.pack("<HBq", intern(key), _TYPE_LONG, value))
+            elif isinstance(value, list):
+                body.extend(ustruct.pack("<HBH", intern(key), _TYPE_LIST, len(value)))
+                for item in value:
+                    body.extend(ustruct.pack("<H", intern(str(item))))
+            else:
+                body.extend(ustruct.pack("<HBH", intern(key), _TYPE_STR, intern(str(value))))
+
+    header = ustruct.pack(_SNAPSHOT_HEADER, _SNAPSHOT_MAGIC, mtime, size, len(strings), len(config))
+
+    return header + table + body
+
+def unpack_snapshot(data, mtime, size, config=None, sections=None):
+    """Loads a configuration from a binary snapshot without any text parsing.
+
+    Args:
+    - data: The snapshot bytes.
+    - mtime: The modification time of the source configuration file.
+    - size: The size in bytes of the source configuration file.
+    - config: The dictionary to populate (default: a new dictionary).
+    - sections: The list of section names to populate (default: a new list).
+
+    Returns the configuration dictionary, or None if the snapshot does not
+    match the source file.
+    """
+    if len(data) < _SNAPSHOT_HEADER_SIZE:
+        return None
+
+    magic, snapshot_mtime, snapshot_size, string_count, section_count = ustruct.unpack_from(_SNAPSHOT_HEADER, data, 0)
+    if magic != _SNAPSHOT_MAGIC or snapshot_mtime != mtime or snapshot_size != size:
+        return None
+
+    if config is None:
+        config = {}
+    if sections is None:
+        sections = []
+
+    offset = _SNAPSHOT_HEADER_SIZE
+
+    strings = []
+    for _ in range(string_count):
+        length = data[offset] | (data[offset + 1] << 8)
+        offset += 2
+        strings.append(data[offset:offset + length].decode())
+        offset += length
+
+    for _ in range(section_count):
+        name, count = ustruct.unpack_from("<HH", data, offset)
+        offset += 4
+
+        section = strings[name]
+        entries = {}
+
+        for _ in range(count):
+            key = strings[data[offset] | (data[offset + 1] << 8)]
+            value_type = data[offset + 2]
+            offset += 3
+
+            if value_type == _TYPE_TRUE:
+                value = True
+            elif value_type == _TYPE_FALSE:
+                value = False
+            elif value_type == _TYPE_INT:
+                value = ustruct.unpack_from("<i", data, offset)[0]
+                offset += 4
+            elif value_type == _TYPE_STR:
+                value = strings[data[offset] | (data[offset + 1] << 8)]
+                offset += 2
+            elif value_type == _TYPE_LONG:
+                value = ustruct.unpack_from("<q", data, offset)[0]
+                offset += 8
+            elif value_type == _TYPE_LIST:
+                length = data[offset] | (data[offset + 1] << 8)
+                offset += 2
+                value = []
+                for _ in range(length):
+                    value.append(strings[data[offset] | (data[offset + 1] << 8)])
+                    offset += 2
+            else:
+                raise ValueError(f"Invalid value type in snapshot: {value_type}")
+
+            entries[key] = value
+
+        if section not in sections:
+            sections.append(section)
+        config[section] = entries
+
+    return config
+
+# Journal record format
+_JOURNAL_HEADER = "<HI"  # Payload length, payload CRC32
+_JOURNAL_HEADER_SIZE = ustruct.calcsize(_JOURNAL_HEADER)
+_JOURNAL_SEPARATOR = b'\x00'
+_OP_SET_SECTION = 83  # 'S'
+_OP_SET_ENTRY = 69  # 'E'
+_OP_REMOVE_SECTION = 82  # 'R'
+_OP_REMOVE_ENTRY = 68  # 'D'
+_OP_GENERATION = 71  # 'G', the generation of the configuration file the journal applies to
+
+# Configuration files written by ConfigManager start with their generation, which is incremented by each compaction
+_GENERATION_PREFIX = b'# generation '
+
+def pack_journal_record(op, section, key=None, value=None):
+    """Encodes a configuration change as a CRC-protected journal record.
+
+    Args:
+    - op: The change operation.
+    - section: The section name.
+    - key: The key name, for entry operations.
+    - value: The new value, for set operations.
+    """
+    payload = bytes([op]) + section.encode()
+    if key is not None:
+        payload += _JOURNAL_SEPARATOR + key.encode()
+        if op == _OP_SET_ENTRY:
+            payload += _JOURNAL_SEPARATOR + format_value(value).encode()
+
+    return ustruct.pack(_JOURNAL_HEADER, len(payload), ubinascii.crc32(payload)) + payload
+
+def iter_journal(data):
+    """Iterates over the valid records of a journal.
+
+    Iteration stops at the first truncated or corrupt record, so a record torn
+    by a power loss is discarded along with anything after it.
+
+    Args:
+    - data: The journal bytes.
+
+    Yields (op, fields, offset) tuples, where fields are the raw section, key and
+    value bytes and offset is the end of the record.
+    """
+    offset = 0
+    end = len(data)
+
+    while offset + _JOURNAL_HEADER_SIZE <= end:
+        length, crc = ustruct.unpack_from(_JOURNAL_HEADER, data, offset)
+        start = offset + _JOURNAL_HEADER_SIZE
+        if not length or start + length > end:
+            return
+
+        payload = data[start:start + length]
+        if ubinascii.crc32(payload) != crc:
+            return
+
+        op = payload[0]
+        if op != _OP_SET_ENTRY and op != _OP_SET_SECTION and op != _OP_REMOVE_ENTRY and op != _OP_REMOVE_SECTION and op != _OP_GENERATION:
+            return
+
+        offset = start + length
+        yield op, payload[1:].split(_JOURNAL_SEPARATOR, 2), offset
+
+def journal_generation(data):
+    """Returns the configuration file generation a journal applies to.
+
+    Journals written before generations were recorded apply to generation 0.
+
+    Args:
+    - data: The journal bytes.
+    """
+    for op, fields, _ in iter_journal(data):
+        if op == _OP_GENERATION:
+            return int(fields[0])
+        break
+
+    return 0
+
+def replay_journal(data, config, sections):
+    """Applies journal records to a configuration.
+
+    Args:
+    - data: The journal bytes.
+    - config: The configuration dictionary to update.
+    - sections: The list of section names to update.
+
+    Returns the length in bytes of the valid records.
+    """
+    offset = 0
+
+    for op, fields, offset in iter_journal(data):
+        if op == _OP_GENERATION:
+            continue
+
+        section = fields[0].decode()
+
+        if op == _OP_REMOVE_SECTION:
+            if section in sections:
+                sections.remove(section)
+            config.pop(section, None)
+        elif op == _OP_REMOVE_ENTRY:
+            if section in config:
+                config[section].pop(fields[1].decode(), None)
+        else:
+            if section not in sections:
+                sections.append(section)
+            entries = config.get(section)
+            if entries is None:
+                entries = {}
+                config[section] = entries
+            if op == _OP_SET_ENTRY:
+                entries[fields[1].decode()] = parse_value(fields[2])
+
+    return offset
+
+def coerce_value(value, value_type):
+    """Converts a value to the given type, accepting form and API input.
+
+    Args:
+    - value: The value to convert.
+    - value_type: The type to convert to (bool, int, str or list).
+
+    Returns the converted value or None if the value cannot be converted.
+    """
+    if type(value) is value_type:
+        return value
+
+    if value_type is bool:
+        if isinstance(value, str):
+            lowered = value.lower()
+            if lowered in ("true", "on", "1", "yes"):
+                return True
+            if lowered in ("false", "off", "0", "no", ""):
+                return False
+        return None
+
+    if value_type is int:
+        if isinstance(value, str) and value.isdigit():
+            return int(value)
+        return None
+
+    if value_type is list and isinstance(value, str):
+        return [item.strip() for item in value.split(',')]
+
+    return None
+
+def check_value(entry, value):
+    """Checks a value against a schema entry.
+
+    Args:
+    - entry: The schema entry (name, section, key, type, default, minimum, maximum).
+    - value: The value to check.
+
+    Returns the value, clamped to range for integers, or None if the value is invalid.
+    """
+    value_type = entry[3]
+    minimum = entry[5]
+    maximum = entry[6]
+
+    if type(value) is not value_type:
+        return None
+
+    if value_type is int:
+        if minimum is not None and value < minimum:
+            return minimum
+        if maximum is not None and value > maximum:
+            return maximum
+    elif value_type is str:
+        if minimum is not None and len(value) < minimum:
+            return None
+        if maximum is not None and len(value) > maximum:
+            return None
+
+    return value
+
+# Settings class
+class Settings:
+    """Provides typed access to configuration entries described by a schema.
+
+    Schema entries are tuples of (name, section, key, type, default, minimum, maximum).
+    Minimum and maximum are value limits for integers and length limits for strings.
+    Entries with a default of None are optional and are never filled in.
+    """
+    def __init__(self, manager, schema):
+        self.manager = manager
+        self.schema = schema
+        self.index = {}
+        self.names = {}
+
+        for entry in schema:
+            self.index[entry[0]] = entry
+            self.names[(entry[1], entry[2])] = entry[0]
+
+    def get(self, name):
+        """Get the value of a setting by name."""
+        entry = self.index[name]
+        value = self.manager.get_entry(entry[1], entry[2])
+        return entry[4] if value is None else value
+
+    def check(self, name, value):
+        """Convert and check a value for a setting by name without setting it.
+
+        Returns the value to store, or None if the value is invalid.
+        """
+        entry = self.index[name]
+        return check_value(entry, coerce_value(value, entry[3]))
+
+    def set(self, name, value):
+        """Set the value of a setting by name, converting form and API input.
+
+        Returns True if the value was accepted.
+        """
+        value = self.check(name, value)
+
+        if value is None:
+            return False
+
+        entry = self.index[name]
+        self.manager.set_entry(entry[1], entry[2], value)
+        return True
+
+    def __getattr__(self, name):
+        """Get the value of a setting as an attribute."""
+        try:
+            return self.get(name)
+        except KeyError:
+            raise AttributeError(name)
+
+# Shared configuration managers keyed by file path
+_shared = {}
 
 # ConfigManager class
 class ConfigManager:
     """Provides configuration file management support for Micropython firmware."""
-    def __init__(self, directory, filename, auto_read=False, auto_save=False):
-        """Initialize the configuration manager."""
+    @classmethod
+    def shared(cls, directory, filename):
+        """Returns the shared configuration manager for a configuration file.
+
+        Args:
+        - directory: The directory containing the configuration file.
+        - filename: The name of the configuration file.
+        """
+        if directory is None:
+            directory = '/config'
+
+        path = "/".join([directory.rstrip('/'), filename])
+
+        manager = _shared.get(path)
+        if manager is None:
+            manager = cls(directory, filename)
+            _shared[path] = manager
+
+        return manager
+
+    def __init__(self, directory, filename, auto_read=False, auto_save=False, write_delay=2, snapshot=True, journal=True, journal_limit=2048, compact_interval=3600, lazy=False, evict_threshold=16384):
+        """Initialize the configuration manager.
+
+        Args:
+        - directory: The directory containing the configuration file.
+        - filename: The name of the configuration file.
+        - auto_read: Whether to read the configuration file on creation.
+        - auto_save: Whether to write the configuration file after every change.
+        - write_delay: Time in seconds to coalesce scheduled writes for.
+        - snapshot: Whether to keep a compiled binary snapshot alongside the configuration file.
+        - journal: Whether to append changes to a journal instead of rewriting the configuration file.
+        - journal_limit: The journal size in bytes at which the journal is compacted.
+        - compact_interval: Time in seconds after which a non-empty journal is compacted.
+        - lazy: Whether to parse each section only when it is first accessed.
+        - evict_threshold: Free heap in bytes below which unused sections are evicted in lazy mode.
+        """
         if directory is None:
             directory = '/config'
 
@@ -27,134 +605,795 @@ class ConfigManager:
         self.filename = "/".join([directory.rstrip('/'), filename])
         self.auto_read = auto_read
         self.auto_save = auto_save
+        self.write_delay = write_delay
+        self.snapshot = snapshot and not lazy
+        self.snapshot_filename = f"{self.filename}.bin"
+        self.journal = journal
+        self.journal_limit = journal_limit
+        self.compact_interval = compact_interval
+        self.journal_filename = f"{self.filename}.journal"
+        self.lazy = lazy
+        self.evict_threshold = evict_threshold
 
         self.sections = []
         self.config = {}
 
+        # Write tracking
+        self.dirty = False
+        self.write_count = 0
+        self.skipped_writes = 0
+        self.bytes_written = 0
+        self._write_task = None
+        self._write_lock = asyncio.Lock()
+
+        # Change notification
+        self.loaded = False
+        self.version = 0  # Incremented each time subscribers are notified of changes
+        self.subscribers = []
+        self._changes = {}
+        self._last_modified = None
+        self._watching = False
+
+        # Snapshot tracking
+        self.snapshot_loads = 0
+        self.snapshot_writes = 0
+
+        # Journal tracking
+        self.generation = 0  # Generation of the configuration file, which the journal must match
+        self.journal_size = 0
+        self.journal_appends = 0
+        self.compactions = 0
+        self._journal_records = []
+        self._compact = False
+        self._last_compaction = utime.time()
+
+        # Lazy loading
+        self.section_loads = 0
+        self.evictions = 0
+        self._index = None
+        self._section_access = {}
+        self._access_count = 0
+        self._modified_sections = set()
+
         if auto_read:
-            asyncio.run(self.read_async())
+            self.read()
 
-    async def read_async(self):
+    def _read_steps(self):
+        """Read and parse the configuration file, yielding between sections.
+
+        The compiled snapshot is loaded instead when the configuration file is unchanged.
+        In lazy mode only the section index is read.
+        """
+        file_info = self.get_file_info()
+        self.generation = self.read_generation()
+
+        if self.lazy:
+            self.read_index()
+        elif file_info and self.snapshot and self.read_snapshot(file_info):
+            self._last_modified = file_info[0]
+        else:
+            try:
+                with open(self.filename, 'rb') as configfile:
+                    yield from parse_steps(configfile, self.config, self.sections)
+                self._last_modified = self.get_last_modified_time()
+
+                if self.snapshot:
+                    yield
+                    self.write_snapshot()
+            except OSError as e:
+                log.error("Error reading configuration file: {}", e)
+
+        if self.journal:
+            yield
+            self.read_journal(self.config, self.sections, repair=True)
+
+        self.loaded = True
+
+    def read(self):
         """Read and parse the configuration file."""
+        for _ in self._read_steps():
+            pass
+
+    async def read_async(self):
+        """Read and parse the configuration file, yielding to the event loop between sections (async version)."""
+        for _ in self._read_steps():
+            await asyncio.sleep(0)  # Yield control to the event loop
+
+    def read_generation(self):
+        """Returns the generation recorded on the first line of the configuration file, or 0 if none is recorded."""
         try:
-            with open(self.filename, 'r') as configfile:
-                section_re = re.compile(r'\[(.*)\]')
-                entry_re = re.compile(r'(.*?)=(.*)')
-                string_re = re.compile(r'^"(.*)"$')
-                int_re = re.compile(r'^\d+$')
-                bool_re = re.compile(r'^(true|false)$')
-                comment_re = re.compile(r'^#.*')
-
-                current_section = None
-                for line in configfile:
-                    line = line.strip()
-                    if not line or comment_re.match(line):
-                        continue
-                    if section_re.match(line):
-                        current_section = section_re.match(line).group(1)
-                        if current_section not in self.sections:
-                            self.sections.append(current_section)
-                        self.config[current_section] = {}
-                    elif current_section and entry_re.match(line):
-                        entry = entry_re.match(line)
-                        key = entry.group(1).strip()
-                        value = entry.group(2).strip()
-                        if string_re.match(value):
-                            value = string_re.match(value).group(1)
-                        elif bool_re.match(value.lower()):
-                            value = value.lower() == "true"
-                        elif int_re.match(value):
-                            value = int(value)
-                        elif value.startswith('!'):
-                            value = [v.strip() for v in value[1:].split(',')]
-                        self.config[current_section][key] = value
-                    else:
-                        raise ValueError(f"Invalid format in line: {line}")
+            with open(self.filename, 'rb') as configfile:
+                line = configfile.readline()
+        except OSError:
+            return 0
+
+        if line.startswith(_GENERATION_PREFIX):
+            try:
+                return int(line[len(_GENERATION_PREFIX):])
+            except ValueError:
+                pass
+
+        return 0
+
+    def read_index(self):
+        """Index the sections of the configuration file for lazy loading."""
+        try:
+            with open(self.filename, 'rb') as configfile:
+                sections, self._index = index_sections(configfile)
+            self._last_modified = self.get_last_modified_time()
         except OSError as e:
-            print(f"Error reading configuration file: {e}")
+            log.error("Error reading configuration file: {}", e)
+            return
 
-    async def reload_async(self):
-        """Reload the configuration file."""
-        await self.read_async()
+        for section in sections:
+            if section not in self.sections:
+                self.sections.append(section)
+
+    def _parse_section(self, section):
+        """Parse a single section of the configuration file using the section index."""
+        start, end = self._index[section]
+
+        with open(self.filename, 'rb') as configfile:
+            configfile.seek(start)
+            data = configfile.read(end - start)
+
+        return parse_lines(data.split(b'\n')).get(section, {})
+
+    def _section(self, section):
+        """Get the entries of a section, parsing it first in lazy mode.
+
+        Returns None if the section does not exist.
+        """
+        entries = self.config.get(section)
+
+        if self._index is None:
+            return entries
+
+        if entries is None and section in self.sections and section in self._index:
+            if self.evict_threshold and gc.mem_free() < self.evict_threshold:
+                self.evict(len(self.config) // 2 or None)
+
+            try:
+                entries = self._parse_section(section)
+            except (OSError, ValueError) as e:
+                log.error("Error reading configuration section {}: {}", section, e)
+                return None
+
+            self.config[section] = entries
+            self.section_loads += 1
+
+        if entries is not None:
+            self._access_count += 1
+            self._section_access[section] = self._access_count
+
+        return entries
+
+    def evict(self, count=None):
+        """Evict the least recently used sections which have no unsaved changes.
+
+        Evicted sections are parsed again when next accessed. Section dictionaries are never handed out in lazy mode,
+        as get_section returns a copy and set_entry looks the section up by name, so no caller holds an evicted dictionary.
+
+        Args:
+        - count: The maximum number of sections to evict (default: all unused sections).
+
+        Returns the number of sections evicted.
+        """
+        if self._index is None:
+            return 0
+
+        candidates = []
+        for section in self.config:
+            if section in self._index and section not in self._modified_sections:
+                candidates.append((self._section_access.get(section, 0), section))
+        candidates.sort()
+
+        if count is not None:
+            candidates = candidates[:count]
+
+        for _, section in candidates:
+            del self.config[section]
+            self._section_access.pop(section, None)
+
+        self.evictions += len(candidates)
+        if candidates:
+            gc.collect()
+
+        return len(candidates)
+
+    def _section_texts(self):
+        """Serialize the sections in lazy mode, copying sections which are not loaded from the configuration file."""
+        configfile = None
+        try:
+            for section in self.sections:
+                entries = self.config.get(section)
+                if entries is not None:
+                    yield serialize_section(section, entries)
+                elif section in self._index:
+                    if configfile is None:
+                        configfile = open(self.filename, 'rb')
+                    start, end = self._index[section]
+                    configfile.seek(start)
+                    text = configfile.read(end - start).decode()
+                    yield text if text.endswith('\n') else text + '\n'
+        finally:
+            if configfile is not None:
+                configfile.close()
+
+    def read_snapshot(self, file_info):
+        """Load the compiled snapshot if it matches the configuration file.
+
+        Args:
+        - file_info: The (modification time, size) of the configuration file.
+
+        Returns True if the snapshot was loaded.
+        """
+        try:
+            with open(self.snapshot_filename, 'rb') as snapshotfile:
+                data = snapshotfile.read()
+        except OSError:
+            return False  # No snapshot yet
+
+        config = {}
+        sections = []
+        try:
+            if unpack_snapshot(data, file_info[0], file_info[1], config, sections) is None:
+                return False
+        except (ValueError, IndexError) as e:
+            log.error("Error reading configuration snapshot: {}", e)
+            return False
+
+        self.config.update(config)
+        for section in sections:
+            if section not in self.sections:
+                self.sections.append(section)
+
+        self.snapshot_loads += 1
+        return True
+
+    def read_journal(self, config, sections, repair=False):
+        """Replay the journal over a configuration.
+
+        Args:
+        - config: The configuration dictionary to update.
+        - sections: The list of section names to update.
+        - repair: Whether to discard a torn record at the end of the journal.
+        """
+        try:
+            with open(self.journal_filename, 'rb') as journalfile:
+                data = journalfile.read()
+        except OSError:
+            self.journal_size = 0
+            return  # No journal
+
+        if data and journal_generation(data) != self.generation:
+            # The configuration file was rewritten but the journal was not removed, such as after a power loss
+            log.warning("Discarding configuration journal for an earlier configuration file.")
+            try:
+                uos.remove(self.journal_filename)
+            except OSError as e:
+                log.error("Error removing configuration journal: {}", e)
+            self.journal_size = 0
+            return
+
+        if self._index is not None:
+            # Parse the sections changed by the journal, which are not in the configuration file
+            for op, fields, _ in iter_journal(data):
+                if op == _OP_GENERATION:
+                    continue
+                section = fields[0].decode()
+                if section not in config and section in self._index:
+                    try:
+                        config[section] = self._parse_section(section)
+                    except (OSError, ValueError) as e:
+                        log.error("Error reading configuration section {}: {}", section, e)
+                        continue
+                self._modified_sections.add(section)
+
+        valid = replay_journal(data, config, sections)
+        self.journal_size = valid
+
+        if repair and valid < len(data):
+            log.warning("Discarding incomplete configuration journal record.")
+            temp_file = f"{self.journal_filename}.tmp"
+            try:
+                with open(temp_file, 'wb') as journalfile:
+                    journalfile.write(data[:valid])
+                uos.rename(temp_file, self.journal_filename)
+            except OSError as e:
+                log.error("Error repairing configuration journal: {}", e)
+                self._compact = True
+                self.dirty = True
+
+    def _journal(self, op, section, key=None, value=None):
+        """Records a change to append to the journal on the next write."""
+        if not self.journal:
+            return
+
+        # Only the latest change to an entry needs to be journaled
+        records = self._journal_records
+        for i in range(len(records)):
+            record = records[i]
+            if record[0] == op and record[1] == section and record[2] == key:
+                records.pop(i)
+                break
+
+        records.append((op, section, key, value))
+
+    def _needs_compaction(self):
+        """Checks if the journal should be compacted into the configuration file."""
+        if self._compact or not self.journal or self._last_modified is None:
+            return True  # Journal disabled, compaction requested or no configuration file yet
+        if not self.journal_size:
+            return False
+
+        return self.journal_size >= self.journal_limit or utime.time() - self._last_compaction >= self.compact_interval
+
+    def _append_journal(self, records):
+        """Append change records to the journal, starting a new journal with the configuration file generation."""
+        data = b''.join([pack_journal_record(*record) for record in records])
+        if not self.journal_size:
+            data = pack_journal_record(_OP_GENERATION, str(self.generation)) + data
+
+        with monitor.track("config_journal"):
+            with open(self.journal_filename, 'ab') as journalfile:
+                journalfile.write(data)
+
+        self.journal_size += len(data)
+        self.journal_appends += 1
+        self.bytes_written += len(data)
+        metrics.increment("secureme_config_writes_total", 'kind="journal"')
+
+    def _remove_journal(self):
+        """Remove the journal once its changes are in the configuration file."""
+        if self.journal_size or self._compact:
+            try:
+                uos.remove(self.journal_filename)
+            except OSError:
+                pass  # No journal
+            self.compactions += 1
+
+        self.journal_size = 0
+        self._compact = False
+        self._last_compaction = utime.time()
+
+    async def compact_async(self):
+        """Compact the journal into the configuration file."""
+        self._compact = True
+        self.dirty = True
+
+        await self.flush_async()
+
+    def write_snapshot(self, config=None):
+        """Compile the configuration into a snapshot of the current configuration file.
+
+        The snapshot must hold the content of the configuration file only, as the journal is replayed over it when loaded.
+
+        Args:
+        - config: The configuration parsed from or written to the file (default: the managed configuration).
+        """
+        file_info = self.get_file_info()
+        if not file_info:
+            return
 
-    async def write_async(self, config=None, filename=None):
-        """Write the configuration to the file."""
         if config is None:
             config = self.config
-        if filename is None:
-            filename = self.filename
 
-        temp_file = f"{filename}.tmp"
+        temp_file = f"{self.snapshot_filename}.tmp"
         try:
-            with open(temp_file, 'w') as configfile:
-                for section, entries in config.items():
-                    await asyncio.sleep(0)  # Yield control to the event loop
-                    configfile.write(f'[{section}]\n')
-                    for key, value in entries.items():
-                        if isinstance(value, str):
-                            value = f'"{value}"'
-                        elif isinstance(value, list):
-                            value = f"!{','.join(map(str, value))}"
-                        elif isinstance(value, bool):
-                            value = "true" if value else "false"
-                        configfile.write(f'{key}={value}\n')
-                    configfile.write('\n')
-
-            # Safely replace the original file
-            uos.rename(temp_file, filename)
-        except OSError as e:
-            print(f"Error writing configuration file: {e}")
+            with monitor.track("config_snapshot"):
+                data = pack_snapshot(config, file_info[0], file_info[1])
+                with open(temp_file, 'wb') as snapshotfile:
+                    snapshotfile.write(data)
+                uos.rename(temp_file, self.snapshot_filename)
+
+            self.snapshot_writes += 1
+        except (OSError, ValueError, OverflowError) as e:
+            log.error("Error writing configuration snapshot: {}", e)
             try:
                 uos.remove(temp_file)
             except OSError:
                 pass
 
-    def read(self):
-        """Read and parse the configuration file (sync version)."""
-        asyncio.run(self.read_async())
+    async def load_async(self):
+        """Read the configuration file if it has not already been read."""
+        if not self.loaded:
+            await self.read_async()
+
+    def _reload_steps(self):
+        """Reload the configuration file, yielding between sections."""
+        config = {}
+        sections = []
+
+        self._last_modified = self.get_last_modified_time()
+        self.generation = self.read_generation()
+
+        try:
+            if self.lazy:
+                # Parse only the sections which are loaded
+                with open(self.filename, 'rb') as configfile:
+                    sections, self._index = index_sections(configfile)
+                for section in self.config:
+                    if section in self._index:
+                        config[section] = self._parse_section(section)
+            else:
+                with open(self.filename, 'rb') as configfile:
+                    yield from parse_steps(configfile, config, sections)
+        except (OSError, ValueError) as e:
+            log.error("Error reading configuration file: {}", e)
+            return
+
+        if self.snapshot:
+            self.write_snapshot(config)
+
+        if self.journal:
+            self.read_journal(config, sections)
+
+        for section in sections:
+            yield
+
+            if section not in config:
+                # Not loaded in lazy mode
+                if section not in self.sections:
+                    self.sections.append(section)
+                continue
+
+            entries = config[section]
+            current = self.config.get(section, {})
+
+            for key, value in entries.items():
+                if key not in current or type(current[key]) is not type(value) or current[key] != value:
+                    self._record_change(section, key, value)
+            for key in current:
+                if key not in entries:
+                    self._record_change(section, key, None)
+
+            if section not in self.sections:
+                self.sections.append(section)
+            self.config[section] = entries
+
+        self._notify()
 
     def reload(self):
-        """Reload the configuration file (sync version)."""
-        asyncio.run(self.reload_async())
+        """Reload the configuration file and notify subscribers of any changes."""
+        for _ in self._reload_steps():
+            pass
+
+    async def reload_async(self):
+        """Reload the configuration file and notify subscribers of any changes (async version)."""
+        for _ in self._reload_steps():
+            await asyncio.sleep(0)  # Yield control to the event loop
+
+    def _write_journal(self):
+        """Start a write of the managed configuration by appending changes to the journal.
+
+        Returns True if the changes were journaled, or False if the configuration file must be rewritten.
+        """
+        # Changes made while writing mark the configuration dirty again
+        self.dirty = False
+
+        records = self._journal_records
+        self._journal_records = []
+
+        if records and not self._needs_compaction():
+            try:
+                self._append_journal(records)
+                return True
+            except OSError as e:
+                log.error("Error writing configuration journal: {}", e)
+                # Fall back to rewriting the configuration file
+
+        return False
+
+    def _write_steps(self, config, filename, own_config):
+        """Write a configuration file, yielding between sections.
+
+        Rewrites of the managed configuration include the journal, so they record a new generation.
+        The rename is the commit point: a journal left behind by a power loss no longer matches and is discarded.
+        """
+        temp_file = f"{filename}.tmp"
+        written = 0
+        generation = self.generation + 1 if own_config else self.generation
+        try:
+            if own_config and self._index is not None:
+                texts = self._section_texts()
+            else:
+                texts = serialize_sections(config)
+
+            with monitor.track("config_write"):
+                with open(temp_file, 'w') as configfile:
+                    if filename == self.filename:
+                        written += configfile.write(f"{_GENERATION_PREFIX.decode()}{generation}\n")
+                    for text in texts:
+                        written += configfile.write(text)
+                        yield
+
+                # Safely replace the original file
+                uos.rename(temp_file, filename)
+
+            if filename == self.filename:
+                self.generation = generation
+
+            if own_config:
+                self._remove_journal()
+
+            if filename == self.filename:
+                self._last_modified = self.get_last_modified_time()
+
+                if self.snapshot:
+                    self.write_snapshot(config)
+
+                if own_config and self._index is not None:
+                    # Section offsets have changed and every section is now in the file
+                    self.read_index()
+                    self._modified_sections = set()
+
+            self.write_count += 1
+            self.bytes_written += written
+            metrics.increment("secureme_config_writes_total", 'kind="file"')
+        except OSError as e:
+            log.error("Error writing configuration file: {}", e)
+            if own_config:
+                self.dirty = True
+            try:
+                uos.remove(temp_file)
+            except OSError:
+                pass
 
     def write(self, config=None, filename=None):
-        """Write the configuration to the file (sync version)."""
-        asyncio.run(self.write_async(config, filename))
+        """Write the configuration to the file.
+
+        Writes of the managed configuration are skipped when nothing has changed.
+        Small changes are appended to the journal until it is due for compaction.
+        Unlike write_async, writes are not deferred by the flash scheduler.
+
+        Args:
+        - config: The configuration to write (default: the managed configuration).
+        - filename: The file to write to (default: the managed configuration file).
+        """
+        own_config = config is None and filename is None
+
+        if config is None:
+            config = self.config
+        if filename is None:
+            filename = self.filename
+
+        if own_config:
+            self._notify()
+
+            if not self.dirty:
+                self.skipped_writes += 1
+                return
+
+            if self._write_lock.locked():
+                # An asynchronous write is in progress, write once it completes
+                self.schedule_write()
+                return
+
+            if self._write_journal():
+                return
+
+        for _ in self._write_steps(config, filename, own_config):
+            pass
+
+    async def write_async(self, config=None, filename=None, critical=False):
+        """Write the configuration to the file (async version).
+
+        Non-critical writes are deferred by the flash scheduler while audio is playing.
+
+        Args:
+        - config: The configuration to write (default: the managed configuration).
+        - filename: The file to write to (default: the managed configuration file).
+        - critical: Whether to write immediately, such as before a reset.
+        """
+        own_config = config is None and filename is None
+
+        if config is None:
+            config = self.config
+        if filename is None:
+            filename = self.filename
+
+        if own_config:
+            self._notify()
+
+        async with self._write_lock:
+            if own_config and not self.dirty:
+                self.skipped_writes += 1
+                return
+
+            await flash_scheduler.wait_idle(critical)
+
+            if own_config and self._write_journal():
+                return
+
+            steps = self._write_steps(config, filename, own_config)
+            try:
+                for _ in steps:
+                    await asyncio.sleep(0)  # Yield control to the event loop
+            finally:
+                steps.close()
+
+    def schedule_write(self):
+        """Schedule a write of the configuration file.
+
+        Changes made within the write delay are coalesced into a single write.
+        """
+        self._notify()
+
+        if self._write_task is None:
+            self._write_task = asyncio.create_task(self._write_behind())
+
+    async def _write_behind(self):
+        """Write the configuration file once the write delay has elapsed."""
+        try:
+            await asyncio.sleep(self.write_delay)
+        finally:
+            self._write_task = None
+
+        await self.write_async()
+
+    async def flush_async(self, critical=False):
+        """Write any pending changes to the configuration file immediately.
+
+        Args:
+        - critical: Whether to bypass the flash scheduler, such as before a reset.
+        """
+        if self._write_task is not None:
+            self._write_task.cancel()
+            self._write_task = None
+
+        await self.write_async(critical=critical)
+
+    def subscribe(self, callback):
+        """Subscribe to configuration changes.
+
+        Args:
+        - callback: A function called with a dictionary of changed sections,
+          each mapping changed keys to their new values (None when removed).
+        """
+        if callback not in self.subscribers:
+            self.subscribers.append(callback)
+
+    def unsubscribe(self, callback):
+        """Unsubscribe from configuration changes."""
+        if callback in self.subscribers:
+            self.subscribers.remove(callback)
+
+    def _record_change(self, section, key, value):
+        """Records a changed entry for the next notification."""
+        changes = self._changes.get(section)
+        if changes is None:
+            changes = {}
+            self._changes[section] = changes
+        changes[key] = value
+
+    def _notify(self):
+        """Notifies subscribers of changes recorded since the last notification."""
+        if not self._changes:
+            return
+
+        changes = self._changes
+        self._changes = {}
+        self.version += 1
+
+        for callback in self.subscribers:
+            try:
+                callback(changes)
+            except Exception as e:
+                log.error("Error notifying configuration subscriber: {}", e)
+
+    async def validate_async(self, schema):
+        """Validate the configuration against a schema in a single pass.
+
+        Missing or invalid entries are replaced with their defaults and
+        written with at most one write.
+
+        Args:
+        - schema: A sequence of schema entries (name, section, key, type, default, minimum, maximum).
+
+        Returns a Settings object providing typed access to the validated entries.
+        """
+        for entry in schema:
+            section = entry[1]
+            key = entry[2]
+            default = entry[4]
+
+            value = self.get_entry(section, key)
+            checked = check_value(entry, value) if value is not None else None
+
+            if checked is None:
+                if default is None:
+                    continue  # Optional entry
+                checked = default
+
+            if checked is not value:
+                self.set_entry(section, key, checked)
+
+        await self.flush_async()
+
+        return Settings(self, schema)
+
+    def get_stats(self):
+        """Returns the configuration write statistics as a dictionary."""
+        return {
+            "writes": self.write_count,
+            "skipped_writes": self.skipped_writes,
+            "bytes_written": self.bytes_written,
+            "dirty": self.dirty,
+            "snapshot_loads": self.snapshot_loads,
+            "snapshot_writes": self.snapshot_writes,
+            "journal_size": self.journal_size,
+            "journal_appends": self.journal_appends,
+            "compactions": self.compactions,
+            "section_loads": self.section_loads,
+            "evictions": self.evictions,
+            "loaded_sections": len(self.config)
+        }
 
     def get_section(self, section):
-        """Get all key-value pairs in a section."""
+        """Get all key-value pairs in a section.
+
+        In lazy mode a copy is returned, as the section may be evicted and parsed again later.
+        Changes must be made with set_entry, which looks the section up by name.
+        """
         if not section:
             raise ValueError("Section name cannot be empty.")
-        
-        return self.config.get(section, {})
+
+        entries = self._section(section)
+        if entries is None:
+            return {}
+        return dict(entries) if self._index is not None else entries
 
     def get_entry(self, section, key):
         """Get a specific value by section and key."""
         if not section or not key:
             raise ValueError("Section and key names cannot be empty.")
-        
-        return self.config.get(section, {}).get(key, None)
+
+        entries = self._section(section)
+        return None if entries is None else entries.get(key, None)
+
+    def _add_section(self, section):
+        """Adds a new section without writing.
+
+        Returns True if the section was added.
+        """
+        if section in self.sections:
+            return False
+
+        self.sections.append(section)
+        self.config[section] = {}
+        self.dirty = True
+        self._modified_sections.add(section)
+        self._journal(_OP_SET_SECTION, section)
+
+        return True
 
     def set_section(self, section):
         """Add a new section."""
         if not section:
             raise ValueError("Section name cannot be empty.")
 
-        if section not in self.sections:
-            self.sections.append(section)
-            self.config[section] = {}
-
-            if self.auto_save:
-                self.write()
+        if self._add_section(section) and self.auto_save:
+            self.write()
 
     def set_entry(self, section, key, value):
         """Set a key-value pair in a section."""
         if not section:
             raise ValueError("Section name cannot be empty.")
 
-        if section not in self.sections:
-            self.set_section(section)
-        self.config[section][key] = value
+        self._add_section(section)
+
+        entries = self._section(section)
+        if key in entries:
+            current = entries[key]
+            if type(current) is type(value) and current == value:
+                return  # Unchanged
+
+        entries[key] = value
+        self.dirty = True
+        self._modified_sections.add(section)
+        self._record_change(section, key, value)
+        self._journal(_OP_SET_ENTRY, section, key, value)
 
         if self.auto_save:
             self.write()
@@ -165,8 +1404,15 @@ class ConfigManager:
             raise ValueError("Section name cannot be empty.")
 
         if section in self.sections:
+            self._section(section)  # Parse the section in lazy mode to notify its removal
             self.sections.remove(section)
-            self.config.pop(section, None)
+            entries = self.config.pop(section, None)
+            self._section_access.pop(section, None)
+            self.dirty = True
+            self._journal(_OP_REMOVE_SECTION, section)
+            if entries:
+                for key in entries:
+                    self._record_change(section, key, None)
 
             if self.auto_save:
                 self.write()
@@ -176,8 +1422,13 @@ class ConfigManager:
         if not section:
             raise ValueError("Section name cannot be empty.")
 
-        if section in self.config and key in self.config[section]:
-            self.config[section].pop(key, None)
+        entries = self._section(section)
+        if entries is not None and key in entries:
+            entries.pop(key, None)
+            self.dirty = True
+            self._modified_sections.add(section)
+            self._record_change(section, key, None)
+            self._journal(_OP_REMOVE_ENTRY, section, key)
 
             if self.auto_save:
                 self.write()
@@ -193,13 +1444,19 @@ class ConfigManager:
         try:
             if isinstance(conf, tuple) and len(conf) == 2:
                 section, key = conf
-                return self.config[section][key]
+                entries = self._section(section)
+                if entries is None:
+                    raise KeyError(section)
+                return entries[key]
             elif isinstance(conf, str):
-                return self.config[conf]
+                entries = self._section(conf)
+                if entries is None:
+                    raise KeyError(conf)
+                return entries
             else:
                 raise KeyError("Invalid key format. Use 'section' or ('section', 'key').")
         except KeyError as e:
-            print(f"Error accessing configuration: {e}")
+            log.error("Error accessing configuration: {}", e)
             raise
 
     def __setitem__(self, sec_key, entry_val):
@@ -207,30 +1464,50 @@ class ConfigManager:
         try:
             section, key = sec_key
             self.set_entry(section, key, entry_val)
-
-            if self.auto_save:
-                self.write()
         except ValueError:
-            print("Error setting value. Provide a tuple ('section', 'key') for the configuration key.")
+            log.error("Error setting value. Provide a tuple ('section', 'key') for the configuration key.")
             raise
 
-    async def start_watching(self, check_interval=3):
+    async def start_watching(self, check_interval=30):
         """
-        Start watching the configuration file for changes.
+        Start watching the configuration file for external changes.
+
+        Changes made through the configuration manager are notified directly,
+        so the file is polled only as a slow fallback for external edits.
+        Only one watcher runs for each configuration manager.
 
         Args:
             check_interval (int): Time in seconds between checks.
         """
-        last_modified = self.get_last_modified_time()
+        if self._watching:
+            return
 
-        while True:
-            await asyncio.sleep(check_interval)  # Yield control to other tasks
-            current_modified = self.get_last_modified_time()
+        self._watching = True
+
+        if self._last_modified is None:
+            self._last_modified = self.get_last_modified_time()
+
+        try:
+            while True:
+                await asyncio.sleep(check_interval)  # Yield control to other tasks
+                current_modified = self.get_last_modified_time()
 
-            if current_modified and current_modified != last_modified:
-                print(f"Configuration file {self.filename} has changed. Reloading...")
-                last_modified = current_modified
-                await self.reload_async()
+                if current_modified and current_modified != self._last_modified:
+                    log.info("Configuration file {} has changed. Reloading...", self.filename)
+                    await self.reload_async()
+
+                if self.journal_size and self._needs_compaction():
+                    await self.compact_async()
+        finally:
+            self._watching = False
+
+    def get_file_info(self):
+        """Get the (modification time, size) of the configuration file."""
+        try:
+            stat = uos.stat(self.filename)
+            return stat[8], stat[6]  # Index 8 is the modification time and index 6 the size
+        except OSError:
+            return None
 
     def get_last_modified_time(self):
         """Get the last modified time of the configuration file."""
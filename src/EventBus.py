@@ -0,0 +1,153 @@
+# Goat - Event Bus library
+# Version 1.0.0
+# © (c) 2025 Goat Technologies
+# https://github.com/CodeGoat-dev/SecureMe
+# Description:
+# Provides live device events for the Goat - SecureMe firmware.
+# Firmware subsystems publish events which are delivered to each subscriber through a small bounded buffer.
+# Slow subscribers lose their oldest events and count the drops instead of holding memory.
+
+# Imports
+import uasyncio as asyncio
+from Logger import get_logger
+
+# Logging
+log = get_logger("EventBus")
+
+# Subscription class
+class Subscription:
+    """Buffers published events for a single subscriber."""
+    def __init__(self, bus, buffer_size):
+        """Constructs the class and exposes properties.
+
+        Args:
+        - bus: The event bus the subscription belongs to.
+        - buffer_size: The maximum number of events held before the oldest is dropped.
+        """
+        self.bus = bus
+        self.buffer_size = buffer_size
+
+        self.events = []
+        self.dropped = 0
+        self._ready = asyncio.Event()
+
+    def push(self, event):
+        """Adds an event to the buffer, dropping the oldest event when full."""
+        if len(self.events) >= self.buffer_size:
+            self.events.pop(0)
+            self.dropped += 1
+            self.bus.dropped_events += 1
+        self.events.append(event)
+        self._ready.set()
+
+    async def wait(self, timeout):
+        """Waits for events and returns the buffered events as (id, event, data) tuples.
+
+        Args:
+        - timeout: The time in seconds to wait before returning an empty list.
+        """
+        if not self.events:
+            self._ready.clear()
+            try:
+                await asyncio.wait_for(self._ready.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+        events = self.events
+        self.events = []
+        return events
+
+    def close(self):
+        """Unsubscribes from the event bus."""
+        self.bus.unsubscribe(self)
+
+# EventBus class
+class EventBus:
+    """Delivers published events to bounded subscriber buffers."""
+    def __init__(self, buffer_size=8, max_subscribers=2):
+        """Constructs the class and exposes properties.
+
+        Args:
+        - buffer_size: The maximum number of events buffered for each subscriber.
+        - max_subscribers: The maximum number of concurrent subscribers.
+        """
+        self.buffer_size = buffer_size
+        self.max_subscribers = max_subscribers
+
+        self.subscribers = []
+        self.listeners = []
+
+        # Event tracking
+        self.event_id = 0
+        self.published_events = 0
+        self.dropped_events = 0
+        self.rejected_subscribers = 0
+
+    def subscribe(self):
+        """Returns a new Subscription, or None if the subscriber limit has been reached."""
+        if len(self.subscribers) >= self.max_subscribers:
+            self.rejected_subscribers += 1
+            return None
+
+        subscription = Subscription(self, self.buffer_size)
+        self.subscribers.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        """Removes a subscription from the event bus."""
+        if subscription in self.subscribers:
+            self.subscribers.remove(subscription)
+
+    def listen(self, callback):
+        """Registers a callback which is called as callback(event, data) for every published event."""
+        self.listeners.append(callback)
+
+    def publish(self, event, data=None):
+        """Publishes an event to all subscribers.
+
+        Args:
+        - event: The event name, such as "armed".
+        - data: A JSON serializable value describing the event.
+        """
+        self.event_id += 1
+        self.published_events += 1
+
+        for callback in self.listeners:
+            try:
+                callback(event, data)
+            except Exception as e:
+                log.error("Error in event listener: {}", e)
+
+        for subscription in self.subscribers:
+            subscription.push((self.event_id, event, data))
+
+    def get_stats(self):
+        """Returns the event statistics as a dictionary."""
+        return {
+            "subscribers": len(self.subscribers),
+            "published_events": self.published_events,
+            "dropped_events": self.dropped_events,
+            "rejected_subscribers": self.rejected_subscribers
+        }
+
+    def report(self):
+        """Prints the event statistics to the console."""
+        stats = self.get_stats()
+
+        print("Events")
+        print(f"Subscribers: {stats['subscribers']}")
+        print(f"Published: {stats['published_events']}")
+        print(f"Dropped: {stats['dropped_events']}")
+        print(f"Rejected subscribers: {stats['rejected_subscribers']}")
+
+# Shared event bus instance used by all firmware subsystems
+bus = EventBus()
+
+def report():
+    """Prints the shared event statistics to the console.
+
+    Intended for use from the REPL:
+    >>> import EventBus
+    >>> EventBus.report()
+    """
+    bus.report()
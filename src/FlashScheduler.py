@@ -0,0 +1,116 @@
+# Goat - Flash Scheduler library
+# Version 1.0.0
+# © (c) 2025 Goat Technologies
+# https://github.com/CodeGoat-dev/SecureMe
+# Description:
+# Provides a flash write policy for the Goat - SecureMe firmware.
+# Flash erase and program operations stall execute-in-place code on the RP2040.
+# Defers non-critical flash writes while audio is playing, up to a maximum delay.
+
+# Imports
+import utime
+import uasyncio as asyncio
+
+# FlashScheduler class
+class FlashScheduler:
+    """Provides scheduled flash writes for device firmware."""
+    def __init__(self, busy_check=None, poll_interval=0.1, max_delay=30):
+        """Constructs the class and exposes properties.
+
+        Args:
+        - busy_check: A callable returning True while flash writes should be deferred.
+        - poll_interval: Time in seconds between checks while a write is deferred.
+        - max_delay: Maximum time in seconds a write may be deferred.
+        """
+        self.busy_check = busy_check
+        self.poll_interval = poll_interval
+        self.max_delay = max_delay
+
+        self.immediate_writes = 0
+        self.deferred_writes = 0
+        self.forced_writes = 0
+        self.critical_writes = 0
+        self.max_wait = 0
+
+    def is_busy(self):
+        """Checks if flash writes should be deferred."""
+        if self.busy_check is None:
+            return False
+
+        try:
+            return bool(self.busy_check())
+        except Exception:
+            return False
+
+    async def wait_idle(self, critical=False):
+        """Waits until a flash write may proceed.
+
+        Args:
+        - critical: Whether the write must proceed immediately, such as before a reset.
+        """
+        if critical:
+            self.critical_writes += 1
+            return
+
+        if not self.is_busy():
+            self.immediate_writes += 1
+            return
+
+        start = utime.ticks_ms()
+        max_delay_ms = int(self.max_delay * 1000)
+
+        while self.is_busy():
+            if utime.ticks_diff(utime.ticks_ms(), start) >= max_delay_ms:
+                # Maximum delay reached, write anyway
+                self.forced_writes += 1
+                self.record_wait(start)
+                return
+
+            await asyncio.sleep(self.poll_interval)
+
+        self.deferred_writes += 1
+        self.record_wait(start)
+
+    def record_wait(self, start):
+        """Records the time a deferred write waited.
+
+        Args:
+        - start: The time in milliseconds the write was requested.
+        """
+        wait = utime.ticks_diff(utime.ticks_ms(), start)
+
+        if wait > self.max_wait:
+            self.max_wait = wait
+
+    def get_stats(self):
+        """Returns the flash write statistics as a dictionary."""
+        return {
+            "immediate_writes": self.immediate_writes,
+            "deferred_writes": self.deferred_writes,
+            "forced_writes": self.forced_writes,
+            "critical_writes": self.critical_writes,
+            "max_wait": self.max_wait
+        }
+
+    def report(self):
+        """Prints the flash write statistics to the console."""
+        stats = self.get_stats()
+
+        print("Flash Writes")
+        print(f"Immediate: {stats['immediate_writes']}")
+        print(f"Deferred: {stats['deferred_writes']}")
+        print(f"Forced: {stats['forced_writes']}")
+        print(f"Critical: {stats['critical_writes']}")
+        print(f"Maximum wait: {stats['max_wait']}ms")
+
+# Shared scheduler instance used by all flash writers
+scheduler = FlashScheduler()
+
+def report():
+    """Prints the shared flash write statistics to the console.
+
+    Intended for use from the REPL:
+    >>> import FlashScheduler
+    >>> FlashScheduler.report()
+    """
+    scheduler.report()
@@ -0,0 +1,205 @@
+# Goat - Garbage Collection Scheduler library
+# Version 1.0.0
+# © (c) 2025 Goat Technologies
+# https://github.com/CodeGoat-dev/SecureMe
+# Description:
+# Provides a garbage collection policy for the Goat - SecureMe firmware.
+# Collects proactively while the firmware is idle and holds off collection during latency-critical windows.
+# Records garbage collection pause durations as a histogram.
+
+# Imports
+import gc
+import utime
+import uasyncio as asyncio
+from Logger import get_logger
+
+# Logging
+log = get_logger("GCScheduler")
+
+# Constants
+PAUSE_BUCKETS = (1, 2, 5, 10, 20, 50, 100)  # Histogram bucket upper bounds in milliseconds
+
+# GCScheduler class
+class GCScheduler:
+    """Provides scheduled garbage collection for device firmware."""
+    def __init__(self, busy_check=None, poll_interval=0.1, idle_interval=5, max_hold_time=10, min_free=8192, threshold_fraction=0.25, min_threshold=4096):
+        """Constructs the class and exposes properties.
+
+        Args:
+        - busy_check: A callable returning True while a latency-critical window is active.
+        - poll_interval: Time in seconds between policy checks.
+        - idle_interval: Minimum time in seconds between proactive collections while idle.
+        - max_hold_time: Maximum time in seconds collection may be held off.
+        - min_free: Free heap in bytes below which collection is forced regardless of activity.
+        - threshold_fraction: The fraction of free heap to allow for allocation before an automatic collection.
+        - min_threshold: The smallest allocation threshold in bytes to configure.
+        """
+        self.busy_check = busy_check
+        self.poll_interval = poll_interval
+        self.idle_interval = idle_interval
+        self.max_hold_time = max_hold_time
+        self.min_free = min_free
+        self.threshold_fraction = threshold_fraction
+        self.min_threshold = min_threshold
+
+        self.threshold = None
+        self.holding = False
+        self.hold_start = 0
+        self.last_collection = utime.ticks_ms()
+
+        self.collections = 0
+        self.idle_collections = 0
+        self.forced_collections = 0
+        self.deferrals = 0
+        self.max_pause = 0
+        self.pause_histogram = [0] * (len(PAUSE_BUCKETS) + 1)
+
+    def is_busy(self):
+        """Checks if a latency-critical window is active."""
+        if self.busy_check is None:
+            return False
+
+        try:
+            return bool(self.busy_check())
+        except Exception:
+            return False
+
+    def collect(self, forced=False):
+        """Runs a garbage collection and records the pause duration.
+
+        Args:
+        - forced: Whether the collection was forced during a latency-critical window.
+        """
+        start = utime.ticks_us()
+        gc.collect()
+        pause = utime.ticks_diff(utime.ticks_us(), start) // 1000
+
+        self.record_pause(pause)
+        self.collections += 1
+        if forced:
+            self.forced_collections += 1
+        else:
+            self.idle_collections += 1
+
+        self.last_collection = utime.ticks_ms()
+
+        if not self.holding:
+            self.update_threshold()
+
+    def record_pause(self, pause):
+        """Records a garbage collection pause in the histogram.
+
+        Args:
+        - pause: The pause duration in milliseconds.
+        """
+        if pause > self.max_pause:
+            self.max_pause = pause
+
+        for i, bound in enumerate(PAUSE_BUCKETS):
+            if pause <= bound:
+                self.pause_histogram[i] += 1
+                return
+
+        self.pause_histogram[-1] += 1
+
+    def update_threshold(self):
+        """Sets the automatic collection threshold from the measured heap usage."""
+        threshold = max(self.min_threshold, int(gc.mem_free() * self.threshold_fraction))
+
+        gc.threshold(threshold)
+        self.threshold = threshold
+
+    def hold(self):
+        """Holds off threshold-triggered collection during a latency-critical window."""
+        if self.holding:
+            return
+
+        # Automatic collection remains enabled so allocation failures can still recover memory
+        gc.threshold(-1)
+        self.holding = True
+        self.hold_start = utime.ticks_ms()
+
+    def release(self):
+        """Releases a hold and restores the automatic collection threshold."""
+        if not self.holding:
+            return
+
+        self.holding = False
+        self.collect()
+
+    def get_stats(self):
+        """Returns the garbage collection statistics as a dictionary."""
+        histogram = {}
+        for i, bound in enumerate(PAUSE_BUCKETS):
+            histogram[f"<={bound}ms"] = self.pause_histogram[i]
+        histogram[f">{PAUSE_BUCKETS[-1]}ms"] = self.pause_histogram[-1]
+
+        return {
+            "collections": self.collections,
+            "idle_collections": self.idle_collections,
+            "forced_collections": self.forced_collections,
+            "deferrals": self.deferrals,
+            "threshold": self.threshold,
+            "max_pause": self.max_pause,
+            "pause_histogram": histogram
+        }
+
+    def report(self):
+        """Prints the garbage collection statistics to the console."""
+        stats = self.get_stats()
+
+        print("Garbage Collection")
+        print(f"Collections: {stats['collections']} (idle {stats['idle_collections']}, forced {stats['forced_collections']})")
+        print(f"Deferrals: {stats['deferrals']}")
+        print(f"Threshold: {stats['threshold']} bytes")
+        print(f"Maximum pause: {stats['max_pause']}ms")
+
+        for bucket, count in stats["pause_histogram"].items():
+            print(f"{bucket}: {count}")
+
+    async def run(self):
+        """Applies the garbage collection policy."""
+        log.info("Starting garbage collection scheduler...")
+
+        self.collect()
+
+        idle_interval_ms = int(self.idle_interval * 1000)
+        max_hold_time_ms = int(self.max_hold_time * 1000)
+
+        try:
+            while True:
+                now = utime.ticks_ms()
+
+                if self.is_busy():
+                    if not self.holding:
+                        self.hold()
+                        self.deferrals += 1
+                    elif utime.ticks_diff(now, self.hold_start) >= max_hold_time_ms or gc.mem_free() < self.min_free:
+                        # Hard ceiling reached, collect anyway
+                        self.collect(forced=True)
+                        self.hold_start = utime.ticks_ms()
+                else:
+                    if self.holding:
+                        self.release()
+                    elif utime.ticks_diff(now, self.last_collection) >= idle_interval_ms:
+                        self.collect()
+
+                await asyncio.sleep(self.poll_interval)
+        except Exception as e:
+            log.error("Error in garbage collection scheduler: {}", e)
+        finally:
+            if self.holding:
+                self.holding = False
+                self.update_threshold()
+
+# Shared scheduler instance used by the firmware
+scheduler = GCScheduler()
+
+def report():
+    """Prints the shared garbage collection statistics to the console.
+
+    Intended for use from the REPL:
+    >>> import GCScheduler
+    >>> GCScheduler.report()
+    """
+    scheduler.report()
@@ -13,9 +13,17 @@ import urequests
 import uos
 import mip
 from ConfigManager import ConfigManager
+from FlashScheduler import scheduler as flash_scheduler
+from config_schema import SCHEMA
+from Logger import get_logger
+from MemoryMonitor import monitor
+from Metrics import metrics
 import pushover
 import utils
 
+# Logging
+log = get_logger("GitHubUpdater")
+
 class GitHubUpdater:
     """Provides online update functionality for device firmware using MIP."""
     def __init__(self, current_version, repo_url, update_interval=3600, auto_reboot=False):
@@ -34,7 +42,8 @@ class GitHubUpdater:
         self.update_notifications = None
         self.enable_auto_update = None
         self.update_check_interval = None
-        self.default_update_check_interval = 30
+
+        self.settings = None
 
         self.headers = {"User-Agent": "GoatGitHubUpdater/1.1"}
         self.latest_version = None
@@ -42,31 +51,18 @@ class GitHubUpdater:
 
     async def initialize(self):
         """Initializes the server by loading configuration data."""
-        self.config = ConfigManager(self.config_directory, self.config_file)
-        await self.config.read_async()
+        self.config = ConfigManager.shared(self.config_directory, self.config_file)
+        await self.config.load_async()
 
-        self.pushover_app_token = self.config.get_entry("pushover", "app_token")
-        self.pushover_api_key = self.config.get_entry("pushover", "api_key")
-        self.system_status_notifications = self.config.get_entry("pushover", "system_status_notifications")
-        if not isinstance(self.system_status_notifications, bool):
-            self.system_status_notifications = True
-            self.config.set_entry("pushover", "system_status_notifications", self.system_status_notifications)
-            await self.config.write_async()
-        self.update_notifications = self.config.get_entry("pushover", "update_notifications")
-        if not isinstance(self.update_notifications, bool):
-            self.update_notifications = True
-            self.config.set_entry("pushover", "update_notifications", self.update_notifications)
-            await self.config.write_async()
-        self.enable_auto_update = self.config.get_entry("update", "enable_auto_update")
-        if not isinstance(self.enable_auto_update, bool):
-            self.enable_auto_update = True
-            self.config.set_entry("update", "enable_auto_update", self.enable_auto_update)
-            await self.config.write_async()
-        self.update_check_interval = self.config.get_entry("update", "update_check_interval")
-        if not isinstance(self.update_check_interval, int):
-            self.update_check_interval = self.default_update_check_interval
-            self.config.set_entry("update", "update_check_interval", self.update_check_interval)
-            await self.config.write_async()
+        # Validate and fill the configuration with at most one write
+        self.settings = await self.config.validate_async(SCHEMA)
+
+        self.pushover_app_token = self.settings.pushover_app_token
+        self.pushover_api_key = self.settings.pushover_api_key
+        self.system_status_notifications = self.settings.system_status_notifications
+        self.update_notifications = self.settings.update_notifications
+        self.enable_auto_update = self.settings.enable_auto_update
+        self.update_check_interval = self.settings.update_check_interval
 
         self.config_watcher = asyncio.create_task(self.config.start_watching())
 
@@ -84,19 +80,19 @@ class GitHubUpdater:
         self.pushover_app_token = self.config.get_entry("pushover", "app_token")
 
         if not self.pushover_app_token:
-            print("A Pushover app token is required to send push notifications.")
+            log.warning("A Pushover app token is required to send push notifications.")
             return
 
         self.pushover_api_key = self.config.get_entry("pushover", "api_key")
 
         if not self.pushover_api_key:
-            print("A Pushover API key is required to send push notifications.")
+            log.warning("A Pushover API key is required to send push notifications.")
             return
 
         try:
             asyncio.create_task(pushover.send_notification(app_token=self.pushover_app_token, api_key=self.pushover_api_key, title=title, message=message, priority=priority, timeout=timeout))
         except Exception as e:
-            print(f"Error sending notification: {e}")
+            log.error("Error sending notification: {}", e)
 
     async def send_system_status_notification(self, message_title, status_message):
         """Sends a system status notification via Pushover.
@@ -108,11 +104,11 @@ class GitHubUpdater:
         await asyncio.sleep(0)
 
         if not message_title:
-            print("A message title is required.")
+            log.warning("A message title is required.")
             return
 
         if not status_message:
-            print("A status message is required.")
+            log.warning("A status message is required.")
             return
 
         try:
@@ -121,28 +117,30 @@ class GitHubUpdater:
             if self.system_status_notifications:
                 asyncio.create_task(self.send_pushover_notification(title=message_title, message=status_message))
         except Exception as e:
-            print(f"Unable to send system status notification: {e}")
+            log.error("Unable to send system status notification: {}", e)
 
     async def check_for_update(self):
         """Checks for updates from GitHub with retry and error handling."""
         url = f"{self.repo_url}/releases/latest"
         attempts = 0
 
+        metrics.increment("secureme_update_checks_total")
+
         while attempts < 3:
             try:
-                print("Checking for firmware updates...")
+                log.info("Checking for firmware updates...")
                 response = urequests.get(url, headers=self.headers, timeout=10)
 
                 if response.status_code == 403:
-                    print("GitHub API rate limit reached. Try again later.")
+                    log.warning("GitHub API rate limit reached. Try again later.")
                     response.close()
                     return
                 
                 if response.status_code == 200:
                     release_data = response.json()
                     self.latest_version = release_data['tag_name']
-                    print(f"Current version: {self.current_version}")
-                    print(f"Latest version: {self.latest_version}")
+                    log.info("Current version: {}", self.current_version)
+                    log.info("Latest version: {}", self.latest_version)
                     response.close()
 
                     # Get file list from the 'build' directory
@@ -152,14 +150,14 @@ class GitHubUpdater:
                             utils.defragment_memory()
                         self.files_to_download = await self.get_files_in_directory(contents_url)
                     except Exception as e:
-                        print(f"Unable to fetch update contents: {e}")
+                        log.error("Unable to fetch update contents: {}", e)
 
                     return  # Success, exit retry loop
                 else:
-                    print(f"Failed to fetch firmware release info: {response.status_code}")
+                    log.error("Failed to fetch firmware release info: {}", response.status_code)
                     response.close()
             except Exception as e:
-                print(f"Attempt {attempts + 1}: Error checking for firmware updates: {e}")
+                log.error("Attempt {}: Error checking for firmware updates: {}", attempts + 1, e)
             finally:
                 if response:
                     response.close()
@@ -168,7 +166,7 @@ class GitHubUpdater:
 
             attempts += 1
 
-        print("All attempts to fetch firmware update information failed.")
+        log.error("All attempts to fetch firmware update information failed.")
 
     async def get_files_in_directory(self, url):
         """Fetch the list of files in a given directory recursively."""
@@ -191,10 +189,10 @@ class GitHubUpdater:
                     response.close()
                     return files  # Exit retry loop on success
                 else:
-                    print(f"Failed to fetch update contents: {response.status_code}")
+                    log.error("Failed to fetch update contents: {}", response.status_code)
                     response.close()
             except Exception as e:
-                print(f"Attempt {attempts + 1}: Error fetching update contents: {e}")
+                log.error("Attempt {}: Error fetching update contents: {}", attempts + 1, e)
             finally:
                 if response:
                     response.close()
@@ -202,37 +200,40 @@ class GitHubUpdater:
             await asyncio.sleep(2)  # Small delay before retry
             attempts += 1
 
-        print("Failed to retrieve update contents after multiple attempts.")
+        log.error("Failed to retrieve update contents after multiple attempts.")
         return files
 
     async def download_update(self):
         """Downloads and installs firmware files using MIP."""
         if not self.files_to_download:
-            print("No files to download.")
+            log.info("No files to download.")
             return
 
-        print(f"Installing firmware update...")
+        log.info("Installing firmware update...")
 
         for file_info in self.files_to_download:
             download_url = file_info["url"]
-            print(f"Installing dependency: {download_url}...")
+            log.info("Installing dependency: {}...", download_url)
+
+            # Avoid stalling audio playback while writing to flash
+            await flash_scheduler.wait_idle()
 
             attempts = 0
             while attempts < 3:
                 try:
                     mip.install(download_url, target="/")
-                    print(f"Successfully installed dependency: {download_url}")
+                    log.info("Successfully installed dependency: {}", download_url)
                     break  # Exit retry loop on success
                 except Exception as e:
                     attempts += 1
-                    print(f"Attempt {attempts}: Failed to install {download_url}: {e}")
+                    log.error("Attempt {}: Failed to install {}: {}", attempts, download_url, e)
 
                     if attempts == 3:
-                        print(f"Failed to install {download_url} after {attempts} attempts.")
+                        log.error("Failed to install {} after {} attempts.", download_url, attempts)
 
             await asyncio.sleep(1)  # Short delay before the next install
 
-        print("Firmware update process completed.")
+        log.info("Firmware update process completed.")
 
     async def is_update_available(self):
         """Check if a firmware update is available for download."""
@@ -255,7 +256,8 @@ class GitHubUpdater:
         if utils.isRP2040():
             utils.defragment_memory()
 
-        await self.check_for_update()
+        with monitor.track("update_check"):
+            await self.check_for_update()
 
         if await self.is_update_available():
             if self.system_status_notifications:
@@ -263,20 +265,20 @@ class GitHubUpdater:
                     asyncio.create_task(self.send_system_status_notification(message_title="Automatic Update", status_message=f"Firmware update available. Updating from {self.current_version} to {self.latest_version}"))
             await self.download_update()
             self.current_version = self.latest_version
-            print(f"Firmware update complete. Updated to version {self.current_version}")
+            log.info("Firmware update complete. Updated to version {}", self.current_version)
             if self.system_status_notifications:
                 if self.update_notifications:
                     asyncio.create_task(self.send_system_status_notification(message_title="Automatic Update", status_message=f"Firmware update complete. Updated to {self.latest_version}."))
             if self.auto_reboot:
-                print("Restarting system...")
+                log.info("Restarting system...")
                 await asyncio.sleep(10)  # Delay before rebooting
                 machine.reset()
         else:
-            print("No firmware updates available.")
+            log.info("No firmware updates available.")
 
     async def run_periodically(self):
         """Periodically update device firmware from GitHub."""
-        print("Initializing automatic update...")
+        log.info("Initializing automatic update...")
 
         await self.initialize()
 
@@ -284,11 +286,11 @@ class GitHubUpdater:
 
         while True:
             if not utils.isNetworkConnected():
-                print("The network is not currently connected. Retrying in 10 seconds.")
+                log.warning("The network is not currently connected. Retrying in 10 seconds.")
                 await asyncio.sleep(10)
 
-            self.enable_auto_update = self.config.get_entry("update", "enable_auto_update")
-            self.update_check_interval = self.config.get_entry("update", "update_check_interval")
+            self.enable_auto_update = self.settings.enable_auto_update
+            self.update_check_interval = self.settings.update_check_interval
 
             if self.enable_auto_update:
                 await self.update()
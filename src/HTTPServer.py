@@ -0,0 +1,880 @@
+# Goat - HTTP Server library
+# Version 1.0.0
+# © (c) 2025 Goat Technologies
+# https://github.com/CodeGoat-dev/SecureMe
+# Description:
+# Provides shared HTTP/1.1 support for the Goat - SecureMe web interface and captive portal.
+# Parses requests incrementally from a stream, reading headers line by line and the body by Content-Length.
+# Reads in bounded chunks and enforces header and body size limits before buffering, working on bytes.
+# Dispatches requests through exact (method, path) route tables.
+# Streams generated pages with chunked transfer encoding and drain() backpressure.
+# Caches rendered pages within a least recently used byte budget.
+# Serves gzip-compressed static assets from flash with strong ETags.
+# Limits concurrent persistent connections with queued admission.
+# Streams compact JSON responses.
+# Pushes live events to clients as Server-Sent Events.
+
+# Imports
+import gc
+import json
+import uasyncio as asyncio
+import uos
+from Logger import get_logger
+
+# Logging
+log = get_logger("HTTPServer")
+
+# Constants
+MAX_HEADER_SIZE = 2048  # Request line and headers in bytes
+MAX_HEADERS = 24
+MAX_BODY_SIZE = 4096
+CONNECTION_MEMORY = 8192  # Estimated heap used by each open connection in bytes
+RESERVE_MEMORY = 24576  # Free heap kept for the rest of the firmware in bytes
+CHUNK_SIZE = 512  # Response fragments are buffered up to this size before each write
+PAGE_CACHE_SIZE = 12288  # Rendered page cache budget in bytes
+
+# Headers used by the firmware, other headers are skipped without decoding
+KEPT_HEADERS = (
+    b"accept-encoding",
+    b"authorization",
+    b"connection",
+    b"content-length",
+    b"content-type",
+    b"cookie",
+    b"host",
+    b"if-none-match",
+    b"transfer-encoding"
+)
+
+# Reason phrases for the status codes used by the firmware
+STATUS_REASONS = {
+    200: "OK",
+    202: "Accepted",
+    204: "No Content",
+    303: "See Other",
+    304: "Not Modified",
+    400: "Bad Request",
+    401: "Unauthorized",
+    403: "Forbidden",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    406: "Not Acceptable",
+    408: "Request Timeout",
+    411: "Length Required",
+    413: "Payload Too Large",
+    429: "Too Many Requests",
+    431: "Request Header Fields Too Large",
+    500: "Internal Server Error",
+    501: "Not Implemented",
+    503: "Service Unavailable"
+}
+
+# RequestError class
+class RequestError(ValueError):
+    """Raised when a request cannot be parsed or exceeds a size limit."""
+    def __init__(self, status, message=None):
+        super().__init__(message or STATUS_REASONS.get(status, "Error"))
+        self.status = status
+
+# Request class
+class Request:
+    """Represents a parsed HTTP request."""
+    def __init__(self, method, target, version, headers, body):
+        """Constructs the class and exposes properties.
+
+        Args:
+        - method: The request method, such as "GET".
+        - target: The request target including any query string.
+        - version: The HTTP version, such as "HTTP/1.1".
+        - headers: A dictionary of headers with lowercase names.
+        - body: The request body as bytes.
+        """
+        self.method = method
+        self.version = version
+        self.headers = headers
+        self.body = body
+        self.client = None  # The client address, set by the server
+
+        separator = target.find("?")
+        if separator < 0:
+            self.path = target
+            self.query = ""
+        else:
+            self.path = target[:separator]
+            self.query = target[separator + 1:]
+
+    def header(self, name, default=None):
+        """Get a header value by its lowercase name."""
+        return self.headers.get(name, default)
+
+    def text(self):
+        """Get the request body as a string."""
+        return self.body.decode()
+
+    def __repr__(self):
+        return f"{self.method} {self.path}"
+
+# Response class
+class Response:
+    """Represents an HTTP response and sends it with the appropriate framing."""
+    def __init__(self, body=None, status=200, content_type="text/html", headers="", length=None):
+        """Constructs the class and exposes properties.
+
+        Args:
+        - body: The response body as a string, bytes or an iterable of fragments, or None for an empty body.
+        - status: The response status code.
+        - content_type: The Content-Type header value.
+        - headers: Additional header lines, each ending with CRLF.
+        - length: The body length in bytes when the body is an iterable of known size.
+        """
+        self.body = body
+        self.status = status
+        self.content_type = content_type
+        self.headers = headers
+        self.length = length
+
+    async def send(self, writer, chunked=True, keep_alive=False):
+        """Sends the response.
+
+        Args:
+        - writer: The stream to write to.
+        - chunked: Whether the client supports chunked transfer encoding.
+        - keep_alive: Whether the connection should remain open after the response.
+
+        Bodies of known length are sent with a Content-Length header, other iterables are streamed.
+        Returns True if the connection can be reused for another request.
+        """
+        body = self.body
+        streamed = body is not None and not isinstance(body, (str, bytes)) and self.length is None
+
+        # Streams without chunked encoding are delimited by closing the connection
+        keep_alive = keep_alive and (chunked or not streamed)
+        headers = self.headers
+        if not keep_alive and (chunked or not streamed):
+            headers += "Connection: close\r\n"
+
+        if body is None:
+            # 204 and 304 responses never have a body or Content-Length
+            length = "" if self.status in (204, 304) else "Content-Length: 0\r\n"
+            writer.write(f"{status_line(self.status)}{length}{headers}\r\n".encode())
+            await writer.drain()
+        elif isinstance(body, (str, bytes)):
+            send_response(writer, body, self.status, self.content_type, headers)
+            await writer.drain()
+        elif self.length is not None:
+            writer.write(f"{status_line(self.status)}Content-Type: {self.content_type}\r\nContent-Length: {self.length}\r\n{headers}\r\n".encode())
+            try:
+                for chunk in body:
+                    writer.write(chunk)
+                    await writer.drain()
+            finally:
+                if hasattr(body, "close"):
+                    body.close()
+        else:
+            await send_stream(writer, body, self.status, self.content_type, headers, chunked)
+
+        return keep_alive
+
+# EventStream class
+class EventStream:
+    """Represents a Server-Sent Events response which streams events until the client disconnects."""
+    def __init__(self, subscription, heartbeat=15, retry=3000):
+        """Constructs the class and exposes properties.
+
+        Args:
+        - subscription: An event source providing wait(timeout), which returns a list of (id, event, data) tuples,
+          a dropped event count and close().
+        - heartbeat: The time in seconds between heartbeat comments when no events are sent.
+        - retry: The client reconnection delay in milliseconds.
+        """
+        self.subscription = subscription
+        self.heartbeat = heartbeat
+        self.retry = retry
+        self.status = 200
+
+    async def send(self, writer, chunked=True, keep_alive=False):
+        """Sends events to the client until the connection fails.
+
+        Args:
+        - writer: The stream to write to.
+        - chunked: Unused, events are delimited by closing the connection.
+        - keep_alive: Unused, the connection is never reused.
+
+        Returns False as the connection cannot be reused.
+        """
+        subscription = self.subscription
+        dropped = 0
+
+        try:
+            writer.write(f"{status_line(200)}Content-Type: text/event-stream\r\nCache-Control: no-cache\r\nConnection: close\r\n\r\nretry: {self.retry}\n\n".encode())
+            await writer.drain()
+
+            while True:
+                events = await subscription.wait(self.heartbeat)
+
+                # Tell the client how many events it missed so it can resynchronise
+                if subscription.dropped != dropped:
+                    writer.write(f"event: dropped\ndata: {subscription.dropped - dropped}\n\n".encode())
+                    dropped = subscription.dropped
+
+                if not events:
+                    writer.write(b": heartbeat\n\n")
+                for event_id, event, data in events:
+                    writer.write(f"id: {event_id}\nevent: {event}\ndata: {json.dumps(data)}\n\n".encode())
+                await writer.drain()
+        except OSError:
+            pass
+        finally:
+            subscription.close()
+
+        return False
+
+# Router class
+class Router:
+    """Maps exact (method, path) pairs to request handlers.
+
+    Handlers are registered with decorators in a class body and called as handler(server, request).
+    They return either the complete response as a string or a Response.
+    Paths ending in "/*" match any path beginning with the prefix before the "*", after exact paths.
+    """
+    def __init__(self):
+        """Constructs the class and exposes properties."""
+        self.routes = {}
+        self.methods = {}
+        self.prefixes = []
+        self.fallback_handler = None
+
+    def add(self, method, path, handler):
+        """Registers a handler for a method and path.
+
+        Args:
+        - method: The request method, such as "GET".
+        - path: The exact request path, such as "/memory", or a prefix such as "/api/config/*".
+        - handler: The handler to call for matching requests.
+        """
+        if path.endswith("/*"):
+            path = path[:-1]
+            if path not in self.methods:
+                self.prefixes.append(path)
+
+        self.routes[(method, path)] = handler
+        methods = self.methods.setdefault(path, [])
+        if method not in methods:
+            methods.append(method)
+
+    def route(self, method, path):
+        """Decorator which registers a handler returning a complete response."""
+        def register(handler):
+            self.add(method, path, handler)
+            return handler
+        return register
+
+    def page(self, method, path):
+        """Decorator which registers a method returning a generator of HTML page fragments."""
+        def register(function):
+            async def handler(server, request):
+                return Response(function(server))
+            self.add(method, path, handler)
+            return function
+        return register
+
+    def fallback(self, handler):
+        """Decorator which registers the handler for requests matching no route."""
+        self.fallback_handler = handler
+        return handler
+
+    def match(self, method, path):
+        """Finds the handler for a request.
+
+        Args:
+        - method: The request method.
+        - path: The request path without a query string.
+
+        Returns a tuple of (handler, status).
+        The handler is None with a status of 404 for unknown paths and 405 for unsupported methods.
+        Unknown requests are passed to the fallback handler when one is registered.
+        """
+        handler = self.routes.get((method, path))
+        if handler is not None:
+            return handler, 200
+
+        known = path in self.methods
+        if not known:
+            prefix = self.prefix(path)
+            if prefix is not None:
+                handler = self.routes.get((method, prefix))
+                if handler is not None:
+                    return handler, 200
+                known = True
+
+        if self.fallback_handler is not None:
+            return self.fallback_handler, 200
+        if known:
+            return None, 405
+        return None, 404
+
+    def prefix(self, path):
+        """Returns the registered prefix matching a path, or None."""
+        for prefix in self.prefixes:
+            if path.startswith(prefix):
+                return prefix
+        return None
+
+    def pattern(self, path):
+        """Returns the registered path or prefix pattern matching a path, or None.
+
+        Suitable as a bounded label for per-route statistics.
+        """
+        if path in self.methods:
+            return path
+        prefix = self.prefix(path)
+        if prefix is not None:
+            return prefix + "*"
+        return None
+
+    def allowed(self, path):
+        """Returns the Allow header value for a path."""
+        if path not in self.methods:
+            path = self.prefix(path) or path
+        return ", ".join(self.methods.get(path, ()))
+
+# PageCache class
+class PageCache:
+    """Caches rendered pages within a least recently used byte budget.
+
+    Each entry records the version it was rendered for, such as a configuration version.
+    Looking up an entry with a different version is a miss and the entry is replaced when next stored.
+    """
+    def __init__(self, budget=PAGE_CACHE_SIZE):
+        """Constructs the class and exposes properties.
+
+        Args:
+        - budget: The maximum size in bytes of all cached pages.
+        """
+        self.budget = budget
+        self.size = 0
+        self.entries = {}
+
+        # Cache tracking
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.saved_us = 0
+        self._access = {}
+        self._access_count = 0
+
+    def get(self, key, version):
+        """Get a cached page.
+
+        Args:
+        - key: The page key, such as its route.
+        - version: The version the page must have been rendered for.
+
+        Returns a tuple of (data, split), or None if the page is not cached for the version.
+        """
+        entry = self.entries.get(key)
+        if entry is None or entry[0] != version:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self.saved_us += entry[3]
+        self._access_count += 1
+        self._access[key] = self._access_count
+        return entry[1], entry[2]
+
+    def put(self, key, version, data, split, render_us):
+        """Store a rendered page, evicting the least recently used pages to stay within the budget.
+
+        Args:
+        - key: The page key, such as its route.
+        - version: The version the page was rendered for.
+        - data: The rendered page as bytes.
+        - split: An offset into the data at which volatile content is inserted when served.
+        - render_us: The time taken to render the page, counted as saved on each hit.
+        """
+        self.remove(key)
+        if len(data) > self.budget:
+            return
+
+        while self.size + len(data) > self.budget:
+            self.evict()
+
+        self.entries[key] = (version, data, split, render_us)
+        self.size += len(data)
+        self._access_count += 1
+        self._access[key] = self._access_count
+
+    def remove(self, key):
+        """Remove a cached page."""
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self.size -= len(entry[1])
+            self._access.pop(key, None)
+
+    def evict(self):
+        """Evict the least recently used page."""
+        if not self.entries:
+            return
+
+        key = min(self._access, key=self._access.get)
+        self.remove(key)
+        self.evictions += 1
+
+    def clear(self):
+        """Remove all cached pages."""
+        self.entries = {}
+        self._access = {}
+        self.size = 0
+
+    def get_stats(self):
+        """Returns the page cache statistics as a dictionary."""
+        lookups = self.hits + self.misses
+        return {
+            "pages": len(self.entries),
+            "size": self.size,
+            "budget": self.budget,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits * 100 // lookups if lookups else 0,
+            "evictions": self.evictions,
+            "saved_ms": self.saved_us // 1000
+        }
+
+# ConnectionPool class
+class ConnectionPool:
+    """Limits concurrent connections, queuing connections beyond the limit.
+
+    The limit is reduced when free memory is low, so each admitted connection has room for its buffers.
+    """
+    def __init__(self, max_connections=4, idle_timeout=5, max_queued=8, queue_timeout=10, connection_memory=CONNECTION_MEMORY, reserve_memory=RESERVE_MEMORY):
+        """Constructs the class and exposes properties.
+
+        Args:
+        - max_connections: The maximum number of concurrent connections.
+        - idle_timeout: The time in seconds an idle persistent connection is kept open.
+        - max_queued: The maximum number of connections waiting for admission.
+        - queue_timeout: The time in seconds a connection waits for admission before being rejected.
+        - connection_memory: The estimated heap used by each connection in bytes.
+        - reserve_memory: The free heap kept for the rest of the firmware in bytes.
+        """
+        self.max_connections = max_connections
+        self.idle_timeout = idle_timeout
+        self.max_queued = max_queued
+        self.queue_timeout = queue_timeout
+        self.connection_memory = connection_memory
+        self.reserve_memory = reserve_memory
+
+        self.active = 0
+        self.queued = 0
+        self._released = asyncio.Event()
+
+        # Connection tracking
+        self.connections = 0
+        self.requests = 0
+        self.reused_requests = 0
+        self.queued_connections = 0
+        self.rejected_connections = 0
+        self.idle_timeouts = 0
+        self.peak_active = 0
+        self.min_mem_free = None
+
+    def limit(self):
+        """Returns the current connection limit for the free heap."""
+        available = (gc.mem_free() - self.reserve_memory) // self.connection_memory
+        return max(1, min(self.max_connections, available))
+
+    async def acquire(self):
+        """Admits a connection, waiting in the queue while the pool is full.
+
+        Returns True if the connection was admitted, or False if the queue is full or the wait timed out.
+        """
+        if self.active >= self.limit():
+            if self.queued >= self.max_queued:
+                self.rejected_connections += 1
+                return False
+
+            self.queued += 1
+            self.queued_connections += 1
+            try:
+                while self.active >= self.limit():
+                    self._released.clear()
+                    await asyncio.wait_for(self._released.wait(), self.queue_timeout)
+            except asyncio.TimeoutError:
+                self.rejected_connections += 1
+                return False
+            finally:
+                self.queued -= 1
+
+        self.active += 1
+        self.connections += 1
+        if self.active > self.peak_active:
+            self.peak_active = self.active
+        return True
+
+    def release(self):
+        """Releases an admitted connection and wakes queued connections."""
+        self.active -= 1
+        self._released.set()
+
+    def record_request(self, reused):
+        """Records a request and the free heap while serving it.
+
+        Args:
+        - reused: Whether the request arrived on a previously used connection.
+        """
+        self.requests += 1
+        if reused:
+            self.reused_requests += 1
+
+        mem_free = gc.mem_free()
+        if self.min_mem_free is None or mem_free < self.min_mem_free:
+            self.min_mem_free = mem_free
+
+    def get_stats(self):
+        """Returns the connection statistics as a dictionary."""
+        return {
+            "active": self.active,
+            "limit": self.limit(),
+            "peak_active": self.peak_active,
+            "connections": self.connections,
+            "requests": self.requests,
+            "reused_requests": self.reused_requests,
+            "reuse_rate": self.reused_requests * 100 // self.requests if self.requests else 0,
+            "queued_connections": self.queued_connections,
+            "rejected_connections": self.rejected_connections,
+            "idle_timeouts": self.idle_timeouts,
+            "min_mem_free": self.min_mem_free
+        }
+
+# RequestReader class
+class RequestReader:
+    """Reads request lines and bodies from a stream in bounded chunks.
+
+    Bytes read beyond the current line are kept for the next read, so a persistent connection can serve further requests.
+    """
+    def __init__(self, stream, chunk_size=256):
+        """Constructs the class and exposes properties.
+
+        Args:
+        - stream: The stream to read from.
+        - chunk_size: The maximum number of bytes read from the stream at a time.
+        """
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.buffer = b''
+        self.start = 0  # Offset of the first unread byte in the buffer
+
+    async def readline(self, limit):
+        """Reads a line including its terminator.
+
+        Args:
+        - limit: The maximum line length in bytes.
+
+        Returns the line, or the remaining bytes if the stream ends first.
+        Raises RequestError(431) as soon as the line exceeds the limit, without buffering the rest of it.
+        """
+        while True:
+            end = self.buffer.find(b'\n', self.start)
+            if end >= 0:
+                if end - self.start >= limit:
+                    raise RequestError(431)
+                line = self.buffer[self.start:end + 1]
+                self.start = end + 1
+                return line
+
+            pending = len(self.buffer) - self.start
+            if pending >= limit:
+                raise RequestError(431)
+
+            chunk = await self.stream.read(min(self.chunk_size, limit - pending))
+            if not chunk:
+                line = self.buffer[self.start:]
+                self.buffer = b''
+                self.start = 0
+                return line
+            self.buffer = self.buffer[self.start:] + chunk if pending else chunk
+            self.start = 0
+
+    async def readexactly(self, size):
+        """Reads exactly size bytes, raising EOFError if the stream ends first."""
+        data = self.buffer[self.start:self.start + size]
+        self.start += len(data)
+        if len(data) < size:
+            data += await self.stream.readexactly(size - len(data))
+        return data
+
+async def read_request(reader, max_header_size=MAX_HEADER_SIZE, max_headers=MAX_HEADERS, max_body_size=MAX_BODY_SIZE, kept_headers=KEPT_HEADERS):
+    """Reads and parses an HTTP request from a stream.
+
+    Args:
+    - reader: The RequestReader or stream to read from. Persistent connections should reuse one RequestReader.
+    - max_header_size: The maximum size in bytes of the request line and headers.
+    - max_headers: The maximum number of headers.
+    - max_body_size: The maximum size in bytes of the request body.
+    - kept_headers: The lowercase header names to keep as bytes, or None to keep all headers.
+
+    Returns a Request, or None if the connection closed before a request was received.
+    Raises RequestError if the request is malformed or exceeds a limit.
+    """
+    if not isinstance(reader, RequestReader):
+        reader = RequestReader(reader)
+
+    line = await reader.readline(max_header_size)
+    if not line:
+        return None
+
+    size = len(line)
+
+    parts = line.split()
+    if len(parts) != 3:
+        raise RequestError(400, "Invalid request line")
+
+    method = parts[0].decode()
+    target = parts[1].decode()
+    version = parts[2].decode()
+
+    headers = {}
+    count = 0
+    while True:
+        line = await reader.readline(max_header_size - size)
+        size += len(line)
+
+        if not line:
+            raise RequestError(400, "Incomplete headers")
+        if line == b'\r\n' or line == b'\n':
+            break
+
+        separator = line.find(b':')
+        if separator <= 0:
+            raise RequestError(400, "Invalid header")
+        count += 1
+        if count > max_headers:
+            raise RequestError(431)
+
+        name = line[:separator].strip().lower()
+        if kept_headers is None or name in kept_headers:
+            headers[name.decode()] = line[separator + 1:].strip().decode()
+
+    body = b''
+    if "transfer-encoding" in headers:
+        raise RequestError(501, "Transfer encodings are not supported")
+
+    length = headers.get("content-length")
+    if length:
+        if not length.isdigit():
+            raise RequestError(400, "Invalid Content-Length")
+        length = int(length)
+        if length > max_body_size:
+            raise RequestError(413)
+        if length:
+            try:
+                body = await reader.readexactly(length)
+            except EOFError:
+                raise RequestError(400, "Incomplete body")
+
+    return Request(method, target, version, headers, body)
+
+def status_line(status):
+    """Returns the HTTP/1.1 status line for a status code."""
+    return f"HTTP/1.1 {status} {STATUS_REASONS.get(status, 'Unknown')}\r\n"
+
+async def send_error(writer, error):
+    """Sends a minimal response for a request error.
+
+    Args:
+    - writer: The stream to write to.
+    - error: The RequestError to report.
+    """
+    writer.write(f"{status_line(error.status)}Content-Type: text/plain\r\nConnection: close\r\n\r\n{error}".encode())
+    await writer.drain()
+
+def read_chunks(filename, chunk_size=CHUNK_SIZE):
+    """Reads a file in fixed-size chunks.
+
+    Args:
+    - filename: The file to read.
+    - chunk_size: The chunk size in bytes.
+
+    Yields memoryview slices of a single reused buffer, so each chunk must be written before the next is read.
+    """
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+    with open(filename, "rb") as file:
+        while True:
+            count = file.readinto(buffer)
+            if not count:
+                break
+            yield view[:count]
+
+# StaticFiles class
+class StaticFiles:
+    """Serves gzip-compressed static assets from flash.
+
+    Assets are compressed at build time and listed in a manifest file,
+    one asset per line as: name etag content-type
+    """
+    def __init__(self, directory="/www", prefix="/static/"):
+        """Constructs the class and exposes properties.
+
+        Args:
+        - directory: The directory containing the compressed assets and manifest.
+        - prefix: The URL path prefix the assets are served under.
+        """
+        self.directory = directory
+        self.prefix = prefix
+        self.files = {}
+
+    def load(self):
+        """Loads the asset manifest.
+
+        Returns the number of assets available.
+        """
+        self.files = {}
+        try:
+            with open(f"{self.directory}/manifest") as manifest:
+                for line in manifest:
+                    parts = line.split()
+                    if len(parts) != 3:
+                        continue
+                    name, etag, content_type = parts
+                    filename = f"{self.directory}/{name}.gz"
+                    self.files[name] = (filename, etag, content_type, uos.stat(filename)[6])
+        except OSError as e:
+            log.error("Error loading static files: {}", e)
+
+        return len(self.files)
+
+    def register(self, router):
+        """Registers a route for each asset.
+
+        Args:
+        - router: The Router to register the routes with.
+        """
+        for name in self.files:
+            router.add("GET", self.prefix + name, self.handler(name))
+
+    def handler(self, name):
+        """Returns a route handler serving an asset."""
+        async def serve(server, request):
+            return self.response(request, name)
+        return serve
+
+    def response(self, request, name):
+        """Builds the response for an asset request.
+
+        Args:
+        - request: The Request for the asset.
+        - name: The asset name.
+
+        Returns a 304 response when the client holds the current version.
+        """
+        filename, etag, content_type, size = self.files[name]
+        headers = f"ETag: {etag}\r\nCache-Control: no-cache\r\n"
+
+        if etag in request.header("if-none-match", ""):
+            return Response(None, status=304, headers=headers)
+
+        if "gzip" not in request.header("accept-encoding", ""):
+            return Response("Compressed content is not accepted by the client.", status=406, content_type="text/plain")
+
+        return Response(read_chunks(filename), content_type=content_type, headers=headers + "Content-Encoding: gzip\r\n", length=size)
+
+def method_not_allowed(router, path):
+    """Returns a 405 Response listing the methods allowed for a path."""
+    return Response(STATUS_REASONS[405], status=405, content_type="text/plain", headers=f"Allow: {router.allowed(path)}\r\n")
+
+def json_fragments(value):
+    """Generates compact JSON for a value as fragments.
+
+    Dictionaries, lists and tuples are written an item at a time, other values are encoded whole.
+    """
+    if isinstance(value, dict):
+        separator = "{"
+        for key, item in value.items():
+            yield f"{separator}{json.dumps(str(key))}:"
+            yield from json_fragments(item)
+            separator = ","
+        yield "}" if separator == "," else "{}"
+    elif isinstance(value, (list, tuple)):
+        separator = "["
+        for item in value:
+            yield separator
+            yield from json_fragments(item)
+            separator = ","
+        yield "]" if separator == "," else "[]"
+    else:
+        yield json.dumps(value)
+
+def json_response(value, status=200):
+    """Returns a Response streaming a value as compact JSON."""
+    return Response(json_fragments(value), status=status, content_type="application/json")
+
+def redirect(location):
+    """Returns a 303 Response redirecting to a location."""
+    return Response(None, status=303, headers=f"Location: {location}\r\n")
+
+def send_response(writer, body, status=200, content_type="text/html", headers=""):
+    """Writes a complete response with a precomputed Content-Length.
+
+    Args:
+    - writer: The stream to write to.
+    - body: The response body as a string or bytes.
+    - status: The response status code.
+    - content_type: The Content-Type header value.
+    - headers: Additional header lines, each ending with CRLF.
+
+    The caller is responsible for draining the writer.
+    """
+    if isinstance(body, str):
+        body = body.encode()
+    writer.write(f"{status_line(status)}Content-Type: {content_type}\r\nContent-Length: {len(body)}\r\n{headers}\r\n".encode())
+    writer.write(body)
+
+async def send_stream(writer, fragments, status=200, content_type="text/html", headers="", chunked=True, chunk_size=CHUNK_SIZE):
+    """Streams a response body from an iterable of fragments.
+
+    Args:
+    - writer: The stream to write to.
+    - fragments: An iterable of string or bytes fragments, such as a template generator.
+    - status: The response status code.
+    - content_type: The Content-Type header value.
+    - headers: Additional header lines, each ending with CRLF.
+    - chunked: Whether to use chunked transfer encoding. HTTP/1.0 clients instead receive the body until the connection closes.
+    - chunk_size: The size in bytes at which buffered fragments are written.
+
+    Fragments are buffered up to chunk_size and each write is drained before the next fragment is rendered,
+    so only the current fragment and one chunk of the page are held in memory at once.
+    """
+    if chunked:
+        framing = "Transfer-Encoding: chunked\r\n"
+    else:
+        framing = "Connection: close\r\n"
+    writer.write(f"{status_line(status)}Content-Type: {content_type}\r\n{framing}{headers}\r\n".encode())
+
+    buffer = bytearray()
+    for fragment in fragments:
+        # Large fragments are encoded a slice at a time to avoid copying them whole
+        text = isinstance(fragment, str)
+        for start in range(0, len(fragment), chunk_size):
+            piece = fragment[start:start + chunk_size]
+            buffer.extend(piece.encode() if text else piece)
+            if len(buffer) >= chunk_size:
+                await _write_chunk(writer, buffer, chunked)
+                buffer = bytearray()
+
+    if buffer:
+        await _write_chunk(writer, buffer, chunked)
+    if chunked:
+        writer.write(b"0\r\n\r\n")
+        await writer.drain()
+
+async def _write_chunk(writer, data, chunked):
+    """Writes and drains a single body chunk."""
+    if chunked:
+        writer.write(f"{len(data):x}\r\n".encode())
+        writer.write(data)
+        writer.write(b"\r\n")
+    else:
+        writer.write(data)
+    await writer.drain()
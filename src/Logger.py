@@ -0,0 +1,312 @@
+# Goat - Logger library
+# Version 1.0.0
+# © (c) 2025 Goat Technologies
+# https://github.com/CodeGoat-dev/SecureMe
+# Description:
+# Provides leveled logging for the Goat - SecureMe firmware.
+# Messages are formatted only when their level is enabled and secrets are redacted before they are kept.
+# Recent records are kept in a fixed size ring buffer which can be viewed from the web interface.
+# Warnings and errors can optionally be written to a rotating log file through the flash scheduler.
+# Noisy modules can be sampled to keep only a fraction of their informational records.
+
+# Imports
+import uos
+import utime
+import uasyncio as asyncio
+from FlashScheduler import scheduler as flash_scheduler
+
+# Constants
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+
+LEVEL_NAMES = {
+    DEBUG: "DEBUG",
+    INFO: "INFO",
+    WARNING: "WARNING",
+    ERROR: "ERROR"
+}
+
+# Values following these names are replaced before a message is kept
+REDACTED_KEYS = (
+    "password",
+    "security_code",
+    "api_key",
+    "app_token",
+    "token",
+    "authorization",
+    "cookie"
+)
+
+def redact(message):
+    """Replaces the values of secret key=value and key: value pairs in a message.
+
+    Args:
+    - message: The formatted message.
+    """
+    lowered = message.lower()
+
+    for key in REDACTED_KEYS:
+        index = lowered.find(key)
+        while index >= 0:
+            start = index + len(key)
+            while start < len(message) and message[start] in "\"' ":
+                start += 1
+
+            # Only names followed by a separator are treated as secrets
+            if start >= len(message) or message[start] not in "=:":
+                index = lowered.find(key, start)
+                continue
+
+            start += 1
+            while start < len(message) and message[start] in "\"' ":
+                start += 1
+
+            end = start
+            while end < len(message) and message[end] not in "&,;\"'\r\n":
+                end += 1
+
+            message = message[:start] + "***" + message[end:]
+            lowered = lowered[:start] + "***" + lowered[end:]
+            index = lowered.find(key, start + 3)
+
+    return message
+
+# Logger class
+class Logger:
+    """Provides leveled logging for a firmware module."""
+    def __init__(self, manager, name):
+        """Constructs the class and exposes properties.
+
+        Args:
+        - manager: The log manager records are sent to.
+        - name: The module name included in each record.
+        """
+        self.manager = manager
+        self.name = name
+        self.level = None  # Uses the manager level when None
+        self.sample_rate = 1  # Keeps one in every sample_rate records below WARNING
+        self._sample_count = 0
+
+    def enabled(self, level):
+        """Checks if records of a level are kept."""
+        return level >= (self.manager.level if self.level is None else self.level)
+
+    def log(self, level, message, *args):
+        """Records a message.
+
+        Args:
+        - level: The record level, such as INFO.
+        - message: The message, formatted with str.format() using args only if the level is enabled.
+        - args: Values for the message placeholders.
+        """
+        if level >= (self.manager.level if self.level is None else self.level):
+            self._record(level, message, args)
+
+    def _record(self, level, message, args):
+        """Samples, formats and sends an enabled record to the manager."""
+        if level < WARNING and self.sample_rate > 1:
+            self._sample_count += 1
+            if self._sample_count < self.sample_rate:
+                self.manager.sampled_records += 1
+                return
+            self._sample_count = 0
+
+        self.manager.emit(level, self.name, message.format(*args) if args else message)
+
+    def debug(self, message, *args):
+        """Records a debug message."""
+        if DEBUG >= (self.manager.level if self.level is None else self.level):
+            self._record(DEBUG, message, args)
+
+    def info(self, message, *args):
+        """Records an informational message."""
+        if INFO >= (self.manager.level if self.level is None else self.level):
+            self._record(INFO, message, args)
+
+    def warning(self, message, *args):
+        """Records a warning message."""
+        if WARNING >= (self.manager.level if self.level is None else self.level):
+            self._record(WARNING, message, args)
+
+    def error(self, message, *args):
+        """Records an error message."""
+        if ERROR >= (self.manager.level if self.level is None else self.level):
+            self._record(ERROR, message, args)
+
+# LogManager class
+class LogManager:
+    """Collects log records from all firmware modules."""
+    def __init__(self, level=INFO, buffer_size=32, console=True, log_directory="/logs", log_file="secureme.log", flash_level=WARNING, max_file_size=8192, flush_interval=10):
+        """Constructs the class and exposes properties.
+
+        Args:
+        - level: The lowest level recorded by loggers without their own level.
+        - buffer_size: The number of recent records kept in memory.
+        - console: Whether records are also printed to the console, which costs a blocking write per record.
+        - log_directory: The directory containing the log file.
+        - log_file: The log file name.
+        - flash_level: The lowest level written to the log file.
+        - max_file_size: The size in bytes at which the log file is rotated.
+        - flush_interval: Time in seconds between log file writes.
+        """
+        self.level = level
+        self.buffer_size = buffer_size
+        self.console = console
+        self.log_directory = log_directory
+        self.log_file = log_file
+        self.flash_level = flash_level
+        self.max_file_size = max_file_size
+        self.flush_interval = flush_interval
+        self.flash_enabled = False
+
+        self.loggers = {}
+
+        # Ring buffer of (time, level, name, message) records
+        self.records = [None] * buffer_size
+        self.next_record = 0
+
+        # Records waiting to be written to the log file
+        self.pending = []
+
+        # Log tracking
+        self.total_records = 0
+        self.sampled_records = 0
+        self.dropped_records = 0
+        self.flash_writes = 0
+        self.rotations = 0
+
+    def get_logger(self, name):
+        """Returns the logger for a module, creating it if required."""
+        logger = self.loggers.get(name)
+        if logger is None:
+            logger = Logger(self, name)
+            self.loggers[name] = logger
+        return logger
+
+    def set_sampling(self, name, sample_rate):
+        """Keeps one in every sample_rate records below WARNING from a module."""
+        self.get_logger(name).sample_rate = max(1, sample_rate)
+
+    def emit(self, level, name, message, flash=True):
+        """Keeps a formatted record.
+
+        Args:
+        - level: The record level.
+        - name: The module name.
+        - message: The formatted message.
+        - flash: Whether the record may be written to the log file.
+        """
+        message = redact(message)
+        record = (utime.time(), level, name, message)
+
+        self.records[self.next_record] = record
+        self.next_record = (self.next_record + 1) % self.buffer_size
+        self.total_records += 1
+
+        if self.console:
+            print(message)
+
+        if flash and self.flash_enabled and level >= self.flash_level:
+            # Limit the memory held by records waiting for a write
+            if len(self.pending) >= self.buffer_size:
+                self.pending.pop(0)
+                self.dropped_records += 1
+            self.pending.append(record)
+
+    def recent(self):
+        """Returns the records in the ring buffer, oldest first."""
+        records = self.records[self.next_record:] + self.records[:self.next_record]
+        return [record for record in records if record is not None]
+
+    def format_record(self, record):
+        """Formats a record as a single line."""
+        timestamp, level, name, message = record
+        return f"{timestamp} {LEVEL_NAMES.get(level, level)} {name}: {message}"
+
+    async def flush(self, critical=False):
+        """Writes pending records to the log file, rotating it when full.
+
+        Args:
+        - critical: Whether the write must proceed immediately, such as before a reset.
+        """
+        if not self.pending:
+            return
+
+        await flash_scheduler.wait_idle(critical)
+
+        records = self.pending
+        self.pending = []
+
+        filename = f"{self.log_directory}/{self.log_file}"
+        try:
+            try:
+                uos.mkdir(self.log_directory)
+            except OSError:
+                pass
+
+            try:
+                size = uos.stat(filename)[6]
+            except OSError:
+                size = 0
+
+            if size >= self.max_file_size:
+                try:
+                    uos.remove(f"{filename}.1")
+                except OSError:
+                    pass
+                uos.rename(filename, f"{filename}.1")
+                self.rotations += 1
+
+            with open(filename, "a") as logfile:
+                for record in records:
+                    logfile.write(self.format_record(record) + "\n")
+            self.flash_writes += 1
+        except OSError as e:
+            self.flash_enabled = False
+            self.emit(ERROR, "Logger", f"Error writing log file, file logging disabled: {e}", flash=False)
+
+    async def run(self):
+        """Periodically writes pending records to the log file."""
+        try:
+            while True:
+                await asyncio.sleep(self.flush_interval)
+                await self.flush()
+        except Exception as e:
+            self.emit(ERROR, "Logger", f"Error in log writer: {e}", flash=False)
+
+    def get_stats(self):
+        """Returns the logging statistics as a dictionary."""
+        return {
+            "level": LEVEL_NAMES.get(self.level, self.level),
+            "records": self.total_records,
+            "sampled_records": self.sampled_records,
+            "dropped_records": self.dropped_records,
+            "pending_records": len(self.pending),
+            "console": self.console,
+            "flash_enabled": self.flash_enabled,
+            "flash_writes": self.flash_writes,
+            "rotations": self.rotations
+        }
+
+    def report(self):
+        """Prints the recent log records to the console."""
+        for record in self.recent():
+            print(self.format_record(record))
+
+# Shared log manager instance used by all firmware modules
+manager = LogManager()
+
+def get_logger(name):
+    """Returns the logger for a module from the shared log manager."""
+    return manager.get_logger(name)
+
+def report():
+    """Prints the recent log records to the console.
+
+    Intended for use from the REPL:
+    >>> import Logger
+    >>> Logger.report()
+    """
+    manager.report()
@@ -0,0 +1,208 @@
+# Goat - Memory Monitor library
+# Version 1.0.0
+# © (c) 2025 Goat Technologies
+# https://github.com/CodeGoat-dev/SecureMe
+# Description:
+# Provides heap and fragmentation telemetry for the Goat - SecureMe firmware.
+# Samples free and allocated heap periodically and estimates the largest allocatable block.
+# Records heap use sampled at the start and end of heavy operations performed by firmware subsystems.
+# Operation figures are lower bounds, as the heap is not sampled inside blocking calls such as network requests.
+
+# Imports
+import gc
+import utime
+import uasyncio as asyncio
+from Logger import get_logger
+
+# Logging
+log = get_logger("MemoryMonitor")
+
+# MemoryMonitor class
+class MemoryMonitor:
+    """Provides heap and fragmentation telemetry for device firmware."""
+    def __init__(self, sample_interval=60, probe_limit=131072, probe_resolution=256):
+        """Constructs the class and exposes properties.
+
+        Args:
+        - sample_interval: Time in seconds between heap samples.
+        - probe_limit: The largest block size in bytes to probe for.
+        - probe_resolution: The accuracy in bytes of the largest block estimate.
+        """
+        self.sample_interval = sample_interval
+        self.probe_limit = probe_limit
+        self.probe_resolution = probe_resolution
+
+        self.samples = 0
+        self.last_sample_time = None
+        self.mem_free = 0
+        self.mem_alloc = 0
+        self.min_mem_free = None
+        self.max_mem_alloc = 0
+        self.largest_block = 0
+        self.min_largest_block = None
+
+        # Operation name -> [count, peak_alloc, min_free, last_delta], sampled on entry, exit and by periodic samples
+        self.operations = {}
+        self.active_operations = []
+
+    def sample(self):
+        """Samples the current heap state."""
+        self.mem_free = gc.mem_free()
+        self.mem_alloc = gc.mem_alloc()
+
+        if self.min_mem_free is None or self.mem_free < self.min_mem_free:
+            self.min_mem_free = self.mem_free
+        if self.mem_alloc > self.max_mem_alloc:
+            self.max_mem_alloc = self.mem_alloc
+
+        # Feed the sample into any operations currently in progress
+        for operation in self.active_operations:
+            self._update_operation(operation, self.mem_free, self.mem_alloc)
+
+        self.samples += 1
+        self.last_sample_time = utime.time()
+
+    def largest_free_block(self):
+        """Estimates the largest allocatable block by probing the heap."""
+        low = 0
+        high = min(self.probe_limit, gc.mem_free())
+
+        # Binary search for the largest successful allocation
+        while high - low > self.probe_resolution:
+            size = (low + high) // 2
+            try:
+                block = bytearray(size)
+                del block
+                low = size
+            except MemoryError:
+                high = size
+
+        self.largest_block = low
+
+        if self.min_largest_block is None or low < self.min_largest_block:
+            self.min_largest_block = low
+
+        return low
+
+    def fragmentation(self):
+        """Returns the heap fragmentation as a percentage of free memory."""
+        if not self.mem_free or self.largest_block >= self.probe_limit:
+            return 0
+
+        return 100 - (self.largest_block * 100 // self.mem_free)
+
+    def track(self, operation):
+        """Returns a context manager which records the heap use of an operation.
+
+        The heap is sampled when the operation starts and ends, and by any periodic sample taken while it runs.
+        Peak allocation and minimum free heap are therefore lower bounds, since allocations released before the
+        operation ends are not seen, and blocking calls such as network requests prevent periodic samples.
+
+        Args:
+        - operation: The name of the operation to track.
+        """
+        return _OperationTracker(self, operation)
+
+    def _begin_operation(self, operation):
+        """Starts tracking an operation."""
+        if operation not in self.operations:
+            self.operations[operation] = [0, 0, None, 0]
+
+        self.active_operations.append(operation)
+        self._update_operation(operation, gc.mem_free(), gc.mem_alloc())
+
+        return gc.mem_alloc()
+
+    def _end_operation(self, operation, start_alloc):
+        """Stops tracking an operation."""
+        mem_free = gc.mem_free()
+        mem_alloc = gc.mem_alloc()
+
+        self._update_operation(operation, mem_free, mem_alloc)
+
+        stats = self.operations[operation]
+        stats[0] += 1
+        stats[3] = mem_alloc - start_alloc
+
+        if operation in self.active_operations:
+            self.active_operations.remove(operation)
+
+    def _update_operation(self, operation, mem_free, mem_alloc):
+        """Updates the high-water marks of an operation."""
+        stats = self.operations[operation]
+
+        if mem_alloc > stats[1]:
+            stats[1] = mem_alloc
+        if stats[2] is None or mem_free < stats[2]:
+            stats[2] = mem_free
+
+    def get_stats(self):
+        """Returns the collected memory telemetry as a dictionary."""
+        return {
+            "samples": self.samples,
+            "mem_free": self.mem_free,
+            "mem_alloc": self.mem_alloc,
+            "min_mem_free": self.min_mem_free,
+            "max_mem_alloc": self.max_mem_alloc,
+            "largest_block": self.largest_block,
+            "min_largest_block": self.min_largest_block,
+            "fragmentation": self.fragmentation(),
+            "operations": {
+                name: {"count": stats[0], "peak_alloc": stats[1], "min_free": stats[2], "last_delta": stats[3]}
+                for name, stats in self.operations.items()
+            }
+        }
+
+    def report(self):
+        """Prints the collected memory telemetry to the console."""
+        print("Memory Telemetry")
+        print(f"Free: {self.mem_free} bytes (minimum {self.min_mem_free} bytes)")
+        print(f"Allocated: {self.mem_alloc} bytes (maximum {self.max_mem_alloc} bytes)")
+        print(f"Largest block: {self.largest_block} bytes (minimum {self.min_largest_block} bytes)")
+        print(f"Fragmentation: {self.fragmentation()}%")
+
+        for name, stats in self.operations.items():
+            print(f"{name}: {stats[0]} runs, peak allocated {stats[1]} bytes, minimum free {stats[2]} bytes, last delta {stats[3]} bytes")
+
+    async def run(self):
+        """Periodically samples the heap state."""
+        log.info("Starting memory telemetry...")
+
+        try:
+            while True:
+                self.sample()
+                self.largest_free_block()
+
+                await asyncio.sleep(self.sample_interval)
+        except Exception as e:
+            log.error("Error in memory telemetry: {}", e)
+
+# _OperationTracker class
+class _OperationTracker:
+    """Context manager used to record the heap usage of an operation."""
+    def __init__(self, monitor, operation):
+        self.monitor = monitor
+        self.operation = operation
+        self.start_alloc = 0
+
+    def __enter__(self):
+        self.start_alloc = self.monitor._begin_operation(self.operation)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.monitor._end_operation(self.operation, self.start_alloc)
+        return False
+
+# Shared monitor instance used by all firmware subsystems
+monitor = MemoryMonitor()
+
+def report():
+    """Prints the shared memory telemetry to the console.
+
+    Intended for use from the REPL:
+    >>> import MemoryMonitor
+    >>> MemoryMonitor.report()
+    """
+    monitor.sample()
+    monitor.largest_free_block()
+    monitor.report()
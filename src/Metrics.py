@@ -0,0 +1,187 @@
+# Goat - Metrics library
+# Version 1.0.0
+# © (c) 2025 Goat Technologies
+# https://github.com/CodeGoat-dev/SecureMe
+# Description:
+# Provides operational metrics for the Goat - SecureMe firmware in the Prometheus text format.
+# Counters and histograms are plain integers updated in place so they can remain enabled in production.
+# Detections, alarms and notifications are counted from the event bus.
+# Measures event loop lag by timing a periodic sleep.
+
+# Imports
+import utime
+import uasyncio as asyncio
+from EventBus import bus as event_bus
+from Logger import get_logger
+
+# Logging
+log = get_logger("Metrics")
+
+# Constants
+LATENCY_BUCKETS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)  # Histogram bucket bounds in milliseconds
+
+# Metrics class
+class Metrics:
+    """Provides counters and latency histograms exported in the Prometheus text format."""
+    def __init__(self, lag_interval=1, buckets=LATENCY_BUCKETS):
+        """Constructs the class and exposes properties.
+
+        Args:
+        - lag_interval: Time in seconds between event loop lag measurements.
+        - buckets: The histogram bucket bounds in milliseconds.
+        """
+        self.lag_interval = lag_interval
+        self.buckets = buckets
+        self._bounds = tuple(str(bound / 1000) for bound in buckets)
+
+        # Metric name -> (type, help)
+        self.descriptions = {}
+        # Metric name -> {labels: value}
+        self.counters = {}
+        # Metric name -> {labels: [count per bucket..., count above all buckets, sum in milliseconds]}
+        self.histograms = {}
+
+        # Event loop lag in milliseconds
+        self.loop_lag = 0
+        self.max_loop_lag = 0
+
+        self.describe("secureme_detections_total", "counter", "Sensor detections while armed.")
+        self.describe("secureme_alarms_total", "counter", "Alarms raised.")
+        self.describe("secureme_notifications_total", "counter", "Pushover notifications by result.")
+        self.describe("secureme_http_requests_total", "counter", "Web interface requests by route and status.")
+        self.describe("secureme_http_request_duration_seconds", "histogram", "Web interface request duration by route.")
+        self.describe("secureme_wifi_reconnects_total", "counter", "Wi-Fi reconnection attempts.")
+        self.describe("secureme_config_writes_total", "counter", "Configuration writes to flash by kind.")
+        self.describe("secureme_update_checks_total", "counter", "Firmware update checks.")
+
+        # Start known series at zero so they are exported before the first event
+        for sensor in ("motion", "tilt", "sound"):
+            self.increment("secureme_detections_total", f'sensor="{sensor}"', 0)
+        self.increment("secureme_alarms_total", "", 0)
+        self.increment("secureme_notifications_total", 'result="sent"', 0)
+        self.increment("secureme_notifications_total", 'result="failed"', 0)
+        self.increment("secureme_wifi_reconnects_total", "", 0)
+        self.increment("secureme_config_writes_total", 'kind="file"', 0)
+        self.increment("secureme_config_writes_total", 'kind="journal"', 0)
+        self.increment("secureme_update_checks_total", "", 0)
+
+    def describe(self, name, metric_type, help_text):
+        """Declares a counter or histogram.
+
+        Args:
+        - name: The metric name.
+        - metric_type: Either "counter" or "histogram".
+        - help_text: The description exported with the metric.
+        """
+        self.descriptions[name] = (metric_type, help_text)
+        if metric_type == "histogram":
+            self.histograms.setdefault(name, {})
+        else:
+            self.counters.setdefault(name, {})
+
+    def increment(self, name, labels="", amount=1):
+        """Increments a counter.
+
+        Args:
+        - name: The counter name.
+        - labels: The formatted label pairs, such as 'sensor="motion"'.
+        - amount: The amount to add.
+        """
+        series = self.counters[name]
+        series[labels] = series.get(labels, 0) + amount
+
+    def observe(self, name, labels, value):
+        """Records a value in a histogram.
+
+        Args:
+        - name: The histogram name.
+        - labels: The formatted label pairs.
+        - value: The value in milliseconds.
+        """
+        series = self.histograms[name]
+        counts = series.get(labels)
+        if counts is None:
+            counts = [0] * (len(self.buckets) + 2)
+            series[labels] = counts
+
+        index = 0
+        for bound in self.buckets:
+            if value <= bound:
+                break
+            index += 1
+        counts[index] += 1
+        counts[-1] += value
+
+    def record_request(self, route, status, duration):
+        """Records a web interface request.
+
+        Args:
+        - route: The route pattern which served the request.
+        - status: The response status code.
+        - duration: The time taken to serve the request in milliseconds.
+        """
+        self.increment("secureme_http_requests_total", f'route="{route}",status="{status}"')
+        self.observe("secureme_http_request_duration_seconds", f'route="{route}"', duration)
+
+    def count_event(self, event, data):
+        """Counts detections, alarms and notifications published on the event bus."""
+        if event == "detection":
+            self.increment("secureme_detections_total", f'sensor="{data["sensor"]}"')
+        elif event == "alarm":
+            if data["active"]:
+                self.increment("secureme_alarms_total")
+        elif event == "notification":
+            self.increment("secureme_notifications_total", 'result="sent"' if data["sent"] else 'result="failed"')
+
+    def fragments(self, gauges=()):
+        """Generates the metrics in the Prometheus text format a series at a time.
+
+        Args:
+        - gauges: An iterable of (name, help, value) tuples sampled by the caller, value may be None to skip.
+        """
+        for name, help_text, value in gauges:
+            if value is not None:
+                yield f"# HELP {name} {help_text}\n# TYPE {name} gauge\n{name} {value}\n"
+
+        yield f"# HELP secureme_event_loop_lag_seconds Latest event loop lag.\n# TYPE secureme_event_loop_lag_seconds gauge\nsecureme_event_loop_lag_seconds {self.loop_lag / 1000}\n"
+        yield f"# HELP secureme_event_loop_lag_max_seconds Largest event loop lag.\n# TYPE secureme_event_loop_lag_max_seconds gauge\nsecureme_event_loop_lag_max_seconds {self.max_loop_lag / 1000}\n"
+
+        for name, series in self.counters.items():
+            yield f"# HELP {name} {self.descriptions[name][1]}\n# TYPE {name} counter\n"
+            for labels, value in series.items():
+                if labels:
+                    yield f"{name}{{{labels}}} {value}\n"
+                else:
+                    yield f"{name} {value}\n"
+
+        for name, series in self.histograms.items():
+            yield f"# HELP {name} {self.descriptions[name][1]}\n# TYPE {name} histogram\n"
+            for labels, counts in series.items():
+                total = 0
+                for index, bound in enumerate(self._bounds):
+                    total += counts[index]
+                    yield f'{name}_bucket{{{labels},le="{bound}"}} {total}\n'
+                total += counts[-2]
+                yield f'{name}_bucket{{{labels},le="+Inf"}} {total}\n{name}_sum{{{labels}}} {counts[-1] / 1000}\n{name}_count{{{labels}}} {total}\n'
+
+    async def run(self):
+        """Periodically measures how late the event loop resumes a sleeping task."""
+        log.info("Starting metrics...")
+
+        interval = self.lag_interval * 1000
+
+        try:
+            while True:
+                start = utime.ticks_ms()
+                await asyncio.sleep_ms(interval)
+                lag = max(0, utime.ticks_diff(utime.ticks_ms(), start) - interval)
+
+                self.loop_lag = lag
+                if lag > self.max_loop_lag:
+                    self.max_loop_lag = lag
+        except Exception as e:
+            log.error("Error in metrics: {}", e)
+
+# Shared metrics instance used by all firmware subsystems
+metrics = Metrics()
+event_bus.listen(metrics.count_event)
@@ -19,12 +19,24 @@ import uos
 import urequests
 import utime
 from ConfigManager import ConfigManager
+import HTTPServer
+from Logger import get_logger
+from Metrics import metrics
+import utils
+
+# Logging
+log = get_logger("NetworkManager")
+dns_log = get_logger("NetworkManagerDNS")
+dns_log.sample_rate = 10  # Captive portal clients send DNS queries continuously
 
 # NetworkManager class
 class NetworkManager:
     """Provides network management for device firmware.
     Responsible for maintaining network state and managing connection lifetime.
     """
+    # Route table, unknown requests are answered with the portal index
+    ROUTES = HTTPServer.Router()
+
     # Class constructor
     def __init__(self, ap_ssid="Goat - Captive Portal", ap_password="password", ap_dns_server=True, hostname="PicoW", time_sync=True, time_server="https://goatbot.org", time_sync_interval=360, sta_web_server=None):
         """Constructs the class and exposes properties."""
@@ -76,14 +88,14 @@ class NetworkManager:
         """Loads saved network configuration and connects to a saved network."""
         try:
             if self.config_file in uos.listdir(self.config_directory):
-                config = ConfigManager(self.config_directory, self.config_file)
-                await config.read_async()
+                config = ConfigManager.shared(self.config_directory, self.config_file)
+                await config.load_async()
 
                 ssid = config.get_entry("network", "ssid")
                 password = config.get_entry("network", "password")
 
                 if not ssid:
-                    print("No SSID provided in configuration. Cannot connect to a network.")
+                    log.error("No SSID provided in configuration. Cannot connect to a network.")
                     return
 
                 attempts = 0
@@ -91,7 +103,7 @@ class NetworkManager:
                 while attempts < 3:
                     self.sta_if.active(True)
                     self.sta_if.connect(ssid, password)
-                    print(f"Attempting to connect to {ssid}...")
+                    log.info("Attempting to connect to {}...", ssid)
 
                     timeout = utime.time() + self.network_connection_timeout
                     while not self.sta_if.isconnected() and utime.time() < timeout:
@@ -99,46 +111,46 @@ class NetworkManager:
 
                     if self.sta_if.isconnected():
                         self.ip_address = self.sta_if.ifconfig()[0]
-                        print(f"Connected to {ssid}. IP: {self.ip_address}")
+                        log.info("Connected to {}. IP: {}", ssid, self.ip_address)
                         # Set system date/time
                         try:
                             if self.time_sync:
                                 asyncio.create_task(self.start_time_sync())
                         except Exception as e:
-                            print(f"Unable to set the system date and time: {e}")
+                            log.error("Unable to set the system date and time: {}", e)
                         if self.sta_web_server:
                             try:
                                 self.server = await self.sta_web_server.run()
                             except Exception as e:
-                                print(f"Error starting web server: {e}")
+                                log.error("Error starting web server: {}", e)
                         break
                     else:
-                        print(f"Attempt {attempts + 1}: Failed to connect to Wi-Fi.")
+                        log.error("Attempt {}: Failed to connect to Wi-Fi.", attempts + 1)
                         attempts += 1
 
                 if not self.sta_if.isconnected():
                     self.sta_if.active(False)
-                    print("All connection attempts failed.")
+                    log.error("All connection attempts failed.")
             else:
-                print("No saved network configuration found.")
+                log.info("No saved network configuration found.")
         except Exception as e:
             self.sta_if.active(False)
-            print(f"Error loading network configuration: {e}")
+            log.error("Error loading network configuration: {}", e)
 
     async def save_config(self, ssid, password):
         """Saves network connection configuration to a file."""
         try:
-            config = ConfigManager(self.config_directory, self.config_file)
-            await config.read_async()
+            config = ConfigManager.shared(self.config_directory, self.config_file)
+            await config.load_async()
 
             config.set_entry("network", "ssid", ssid)
             config.set_entry("network", "password", password)
 
             await config.write_async()
 
-            print("Network configuration saved.")
+            log.info("Network configuration saved.")
         except Exception as e:
-            print(f"Error saving configuration: {e}")
+            log.error("Error saving configuration: {}", e)
 
     async def start_ap(self):
         """Starts the access point with WPA2 security and optional custom IP configuration."""
@@ -148,7 +160,7 @@ class NetworkManager:
         dns = self.ap_dns
 
         if len(self.ap_password) < 8:
-            print("Password must be at least 8 characters long.")
+            log.warning("Password must be at least 8 characters long.")
             return
 
         try:
@@ -160,14 +172,14 @@ class NetworkManager:
 
             self.ip_address = self.ap_if.ifconfig()[0]
 
-            print(f"Access point started. SSID: {self.ap_ssid}, IP: {self.ip_address}")
+            log.info("Access point started. SSID: {}, IP: {}", self.ap_ssid, self.ip_address)
         except Exception as e:
-            print(f"Error starting Access point: {e}")
+            log.error("Error starting Access point: {}", e)
 
     async def stop_ap(self):
         """Stops the access point."""
         if not self.ap_if.isconnected():
-            print("The access point is not currently enabled.")
+            log.info("The access point is not currently enabled.")
             return
 
         try:
@@ -177,25 +189,25 @@ class NetworkManager:
 
             self.ip_address = None
 
-            print("Access point stopped.")
+            log.info("Access point stopped.")
         except Exception as e:
-            print(f"Error stopping Access point: {e}")
+            log.error("Error stopping Access point: {}", e)
 
     async def start_captive_portal_server(self):
         """Starts the captive portal HTTP server asynchronously."""
         if not self.ip_address:
-            print("AP IP address not assigned. Cannot start server.")
+            log.error("AP IP address not assigned. Cannot start server.")
             return
 
         try:
             self.server = await asyncio.start_server(self.handle_request, self.ip_address, self.captive_portal_http_port)
-            print(f"Serving on {self.ip_address}:{self.captive_portal_http_port}")
+            log.info("Serving on {}:{}", self.ip_address, self.captive_portal_http_port)
 
             while True:
                 machine.idle()
                 await asyncio.sleep(1)  # Keep the server running
         except Exception as e:
-            print(f"Error starting the captive portal server: {e}")
+            log.error("Error starting the captive portal server: {}", e)
 
     async def stop_captive_portal_server(self):
         """Stops the captive portal HTTP server."""
@@ -203,11 +215,11 @@ class NetworkManager:
             if self.server:
                 self.server.close()
                 await self.server.wait_closed()
-                print("Server stopped.")
+                log.info("Server stopped.")
             else:
-                print("Server already stopped.")
+                log.info("Server already stopped.")
         except Exception as e:
-            print(f"Error stopping server: {e}")
+            log.error("Error stopping server: {}", e)
 
     def set_static_ip(self, ip: str, subnet: str, gateway: str, dns: str):
         """
@@ -220,18 +232,18 @@ class NetworkManager:
         - dns: DNS server address (e.g., "8.8.8.8")
         """
         if not self.sta_if.isconnected():
-            print("Error: Not connected to a network.")
+            log.error("Error: Not connected to a network.")
             return False
 
         self.sta_if.ifconfig((ip, subnet, gateway, dns))
 
         self.ip_address = self.sta_if.ifconfig()[0]
 
-        print("Static IP configuration applied:")
-        print(f"IP Address: {ip}")
-        print(f"Subnet Mask: {subnet}")
-        print(f"Gateway: {gateway}")
-        print(f"DNS Server: {dns}")
+        log.info("Static IP configuration applied:")
+        log.info("IP Address: {}", ip)
+        log.info("Subnet Mask: {}", subnet)
+        log.info("Gateway: {}", gateway)
+        log.info("DNS Server: {}", dns)
 
         return True
 
@@ -256,10 +268,10 @@ class NetworkManager:
         Instead of disconnecting, forces DHCP renewal.
         """
         if not self.sta_if.isconnected():
-            print("Error: Not connected to a network.")
+            log.error("Error: Not connected to a network.")
             return False
 
-        print("Resetting network configuration to DHCP...")
+        log.info("Resetting network configuration to DHCP...")
         try:
             self.sta_if.ifconfig(('0.0.0.0', '0.0.0.0', '0.0.0.0', '0.0.0.0'))  # Release IP
             time.sleep(2)  # Short wait before reconnecting
@@ -271,56 +283,84 @@ class NetworkManager:
                 utime.sleep(0.5)
 
             if self.sta_if.isconnected():
-                print("Reconnected with DHCP. New configuration:")
-                print(self.get_network_config())
+                log.info("Reconnected with DHCP. New configuration:")
+                log.info("{}", self.get_network_config())
                 return True
             else:
-                print("Failed to obtain DHCP lease.")
+                log.error("Failed to obtain DHCP lease.")
                 return False
         except Exception as e:
-            print(f"Error resetting DHCP: {e}")
+            log.error("Error resetting DHCP: {}", e)
             return False
 
     async def handle_request(self, reader, writer):
         """Handles incoming HTTP requests for the captive portal."""
         try:
-            request = await reader.read(1024)
-            request = request.decode()
-            print("Request:", request)
-
-            # Handle captive portal detection endpoints
-            if "GET /generate_204" in request:  # Android detection
-                response = "HTTP/1.1 204 No Content\r\n\r\n"
-            elif "GET /connectivity-check" in request:  # Chrome OS/Chromium-based browsers
-                response = "HTTP/1.1 204 No Content\r\n\r\n"
-            elif "GET /hotspot-detect.html" in request:  # macOS/iOS detection
-                response = "HTTP/1.1 200 OK\r\nContent-Type: text/html\r\n\r\n"
-                response += "<HTML><BODY><H1>Success</H1></BODY></HTML>"
-            elif "GET /success.conf" in request:  # Windows detection
-                response = "HTTP/1.1 200 OK\r\nContent-Type: text/plain\r\n\r\n"
-                response += "Microsoft Connect Test"
-            elif "GET /ncsi.conf" in request:  # Windows NCSI detection
-                response = "HTTP/1.1 200 OK\r\nContent-Type: text/plain\r\n\r\n"
-                response += "Microsoft NCSI"
-            elif "GET /scan" in request:  # Wireless network scan
-                response = "HTTP/1.1 200 OK\r\nContent-Type: text/html\r\n\r\n" + await self.scan_networks()
-            elif "POST /connect" in request:  # Wireless network connection
-                response = "HTTP/1.1 200 OK\r\nContent-Type: text/html\r\n\r\n" + await self.connect_to_wifi(request)
-            elif "POST /reconnect" in request:  # Saved wireless network reconnection
-                response = "HTTP/1.1 200 OK\r\nContent-Type: text/html\r\n\r\n" + await self.reconnect_to_wifi()
-            else:
-                # Default response or index page
-                response = "HTTP/1.1 200 OK\r\nContent-Type: text/html\r\n\r\n" + self.serve_index()
+            try:
+                request = await HTTPServer.read_request(reader)
+            except HTTPServer.RequestError as e:
+                log.warning("Invalid request: {}", e)
+                await HTTPServer.send_error(writer, e)
+                return
+
+            if request is None:
+                return
+
+            log.debug("Request: {}", request)
+            handler, status = self.ROUTES.match(request.method, request.path)
+            response = await handler(self, request)
 
             # Write the response
             writer.write(response.encode())
             await writer.drain()
         except Exception as e:
-            print(f"Error handling request: {e}")
+            log.error("Error handling request: {}", e)
         finally:
             writer.close()
             await writer.wait_closed()
 
+    # Handle captive portal detection endpoints
+    @ROUTES.route("GET", "/generate_204")  # Android detection
+    @ROUTES.route("GET", "/connectivity-check")  # Chrome OS/Chromium-based browsers
+    async def serve_no_content(self, request):
+        """Serves an empty response for connectivity checks."""
+        return "HTTP/1.1 204 No Content\r\n\r\n"
+
+    @ROUTES.route("GET", "/hotspot-detect.html")  # macOS/iOS detection
+    async def serve_hotspot_detect(self, request):
+        """Serves the macOS and iOS connectivity check page."""
+        return "HTTP/1.1 200 OK\r\nContent-Type: text/html\r\n\r\n<HTML><BODY><H1>Success</H1></BODY></HTML>"
+
+    @ROUTES.route("GET", "/success.conf")  # Windows detection
+    async def serve_connect_test(self, request):
+        """Serves the Windows connectivity check response."""
+        return "HTTP/1.1 200 OK\r\nContent-Type: text/plain\r\n\r\nMicrosoft Connect Test"
+
+    @ROUTES.route("GET", "/ncsi.conf")  # Windows NCSI detection
+    async def serve_ncsi(self, request):
+        """Serves the Windows NCSI connectivity check response."""
+        return "HTTP/1.1 200 OK\r\nContent-Type: text/plain\r\n\r\nMicrosoft NCSI"
+
+    @ROUTES.route("GET", "/scan")  # Wireless network scan
+    async def serve_scan(self, request):
+        """Serves the wireless network scan results."""
+        return "HTTP/1.1 200 OK\r\nContent-Type: text/html\r\n\r\n" + await self.scan_networks()
+
+    @ROUTES.route("POST", "/connect")  # Wireless network connection
+    async def serve_connect(self, request):
+        """Connects to the submitted wireless network."""
+        return "HTTP/1.1 200 OK\r\nContent-Type: text/html\r\n\r\n" + await self.connect_to_wifi(request)
+
+    @ROUTES.route("POST", "/reconnect")  # Saved wireless network reconnection
+    async def serve_reconnect(self, request):
+        """Reconnects to the saved wireless network."""
+        return "HTTP/1.1 200 OK\r\nContent-Type: text/html\r\n\r\n" + await self.reconnect_to_wifi(request)
+
+    @ROUTES.fallback
+    async def serve_portal(self, request):
+        """Serves the portal index for any other request."""
+        return "HTTP/1.1 200 OK\r\nContent-Type: text/html\r\n\r\n" + self.serve_index()
+
     def html_template(self, title, body):
         """Generates an HTML page template."""
         return f"""
@@ -369,13 +409,7 @@ class NetworkManager:
     async def connect_to_wifi(self, request):
         """Parses request for Wi-Fi credentials and connects to the network."""
         try:
-            body_start = request.find("\r\n\r\n") + 4
-            body = request[body_start:]
-            params = {}
-            for kv in body.split("&"):
-                if "=" in kv:
-                    key, value = kv.split("=", 1)
-                    params[key] = value.replace("+", " ").replace("%20", " ")
+            params = utils.parse_form(request.text())
 
             ssid = params.get("ssid", "")
             password = params.get("password", "")
@@ -415,7 +449,7 @@ class NetworkManager:
                 try:
                     await self.save_config(ssid, password)
                 except Exception as e:
-                    print(f"Error saving network configuration: {e}")
+                    log.error("Error saving network configuration: {}", e)
 
                 try:
                     await self.stop_captive_portal_server()
@@ -423,21 +457,21 @@ class NetworkManager:
                         await self.dns_server.stop_dns()
                     await self.stop_ap()
                 except Exception as e:
-                    print(f"Error stopping access point services: {e}")
+                    log.error("Error stopping access point services: {}", e)
 
                 # Set system date/time
                 try:
                     if self.time_sync:
                         asyncio.create_task(self.start_time_sync())
                 except Exception as e:
-                    print(f"Unable to set the system date and time: {e}")
+                    log.error("Unable to set the system date and time: {}", e)
 
                 # Start STA web server
                 if self.sta_web_server:
                     try:
                         self.server = await self.sta_web_server.run()
                     except Exception as e:
-                        print(f"Error starting station web server: {e}")
+                        log.error("Error starting station web server: {}", e)
 
     async def reconnect_to_wifi(self, request):
         """Reconnects to a saved Wi-Fi network."""
@@ -472,26 +506,26 @@ class NetworkManager:
                         await self.dns_server.stop_dns()
                     await self.stop_ap()
                 except Exception as e:
-                    print(f"Error stopping access point services: {e}")
+                    log.error("Error stopping access point services: {}", e)
 
                 # Set system date/time
                 try:
                     if self.time_sync:
                         asyncio.create_task(self.start_time_sync())
                 except Exception as e:
-                    print(f"Unable to set the system date and time: {e}")
+                    log.error("Unable to set the system date and time: {}", e)
 
                 # Start STA web server
                 if self.sta_web_server:
                     try:
                         self.server = await self.sta_web_server.run()
                     except Exception as e:
-                        print(f"Error starting station web server: {e}")
+                        log.error("Error starting station web server: {}", e)
 
     async def disconnect_from_wifi(self):
         """Disconnects from the currently connected wireless network."""
         if not self.sta_if.isconnected():
-            print("The network is not connected.")
+            log.info("The network is not connected.")
             return;
 
         try:
@@ -499,7 +533,7 @@ class NetworkManager:
             self.sta_if.deinit()
             self.ip_address = None
         except Exception as e:
-            print(f"Error disconnecting from wi-fi: {e}")
+            log.error("Error disconnecting from wi-fi: {}", e)
 
     def serve_index(self):
         """Serves the captive portal index page."""
@@ -537,7 +571,7 @@ class NetworkManager:
         url = f"{self.time_server}/api/time"
     
         try:
-            print("Fetching time from API...")
+            log.info("Fetching time from API...")
             response = urequests.get(url, timeout=5)
 
             if response.status_code == 200:
@@ -570,11 +604,11 @@ class NetworkManager:
                 # Update the system time
                 utime.mktime((rtc_now[0], rtc_now[1], rtc_now[2], rtc_now[4], rtc_now[5], rtc_now[6], 0, 0))
             
-                print("Date and time set to:", rtc_now)
+                log.info("Date and time set to: {}", rtc_now)
             else:
-                print(f"Failed to fetch time. Status code: {response.status_code}")
+                log.error("Failed to fetch time. Status code: {}", response.status_code)
         except Exception as e:
-            print(f"An error occurred: {e}")
+            log.error("An error occurred: {}", e)
         finally:
             if 'response' in locals():
                 response.close()
@@ -585,25 +619,25 @@ class NetworkManager:
             return
 
         try:
-            print("Starting automatic time synchronisation...")
+            log.info("Starting automatic time synchronisation...")
 
             while True:
                 if not self.sta_if.isconnected():
-                    print("Stopping automatic time synchronisation...")
+                    log.info("Stopping automatic time synchronisation...")
                     break
 
                 asyncio.create_task(self.get_ntp_time())
 
                 await asyncio.sleep(self.time_sync_interval*60)
         except Exception as e:
-            print(f"Unable to start time synchronisation: {e}")
+            log.error("Unable to start time synchronisation: {}", e)
 
     async def run(self):
         """Runs the network manager initialization process and maintains connectivity."""
-        print(f"Goat - Pico Network Manager Version {self.VERSION}")
+        log.info("Goat - Pico Network Manager Version {}", self.VERSION)
 
         try:
-            print("Preparing network interfaces...")
+            log.info("Preparing network interfaces...")
 
             try:
                 self.ap_if.deinit()
@@ -612,7 +646,7 @@ class NetworkManager:
                 self.sta_if.deinit()
                 self.sta_if.active(False)
             except Exception as e:
-                print(f"Unable to prepare network interfaces: {e}")
+                log.error("Unable to prepare network interfaces: {}", e)
 
             # Set the hostname for the device
             network.hostname(self.hostname)
@@ -621,11 +655,12 @@ class NetworkManager:
 
             while True:
                 if not self.sta_if.isconnected():
-                    print("Station disconnected, attempting reconnection...")
+                    log.warning("Station disconnected, attempting reconnection...")
+                    metrics.increment("secureme_wifi_reconnects_total")
                     await self.load_config()  # Reload saved configuration and reconnect
                     if not self.sta_if.isconnected():
                         # Start AP if STA fails to reconnect
-                        print("Switching to AP mode...")
+                        log.info("Switching to AP mode...")
                         await self.start_ap()
                         await self.start_captive_portal_server()
                         if self.ap_dns_server:
@@ -633,7 +668,7 @@ class NetworkManager:
 
                 # Check if both STA and AP are disconnected
                 if not self.sta_if.isconnected() and not self.ap_if.isconnected():
-                    print("No active connections. Rescanning...")
+                    log.warning("No active connections. Rescanning...")
                     await asyncio.sleep(3)  # Pause before rescanning
                     continue
 
@@ -641,24 +676,24 @@ class NetworkManager:
 
                 await asyncio.sleep(0.1)
         except Exception as e:
-            print(f"Error in network manager: {e}")
+            log.error("Error in network manager: {}", e)
         finally:
-            print("Cleaning up resources...")
+            log.info("Cleaning up resources...")
             try:
                 if self.sta_web_server:
-                    print("Stopping STA web server...")
+                    log.info("Stopping STA web server...")
                     await self.sta_web_server.stop_server()
                 if self.sta_if.isconnected():
-                    print("Disconnecting from WiFi...")
+                    log.info("Disconnecting from WiFi...")
                     await self.disconnect_from_wifi()
                 if self.ap_if.isconnected():
-                    print("Stopping access point services...")
+                    log.info("Stopping access point services...")
                     if self.ap_dns_server:
                         await self.dns_server.stop_dns()
                     await self.stop_captive_portal_server()
                     await self.stop_ap()
             except Exception as cleanup_error:
-                print(f"Error during cleanup: {cleanup_error}")
+                log.error("Error during cleanup: {}", cleanup_error)
             await asyncio.sleep(0)  # Yield control after cleanup
 
 
@@ -682,23 +717,23 @@ class NetworkManagerDNS:
             self.udp_server = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
             self.udp_server.setblocking(False)  # Non-blocking mode
             self.udp_server.bind((self.dns_ip, self.dns_port))
-            print(f"DNS server started listening on IP address {self.dns_ip} port {self.dns_port}.")
+            log.info("DNS server started listening on IP address {} port {}.", self.dns_ip, self.dns_port)
 
             while True:
                 try:
                     data, addr = await self._receive_from()
                     if data:
-                        print(f"DNS query received from {addr}")
+                        dns_log.info("DNS query received from {}", addr)
                         response = self.handle_dns_query(data)
                         await self._send_to(response, addr)
                 except Exception as e:
-                    print(f"Error handling DNS query: {e}")
+                    log.error("Error handling DNS query: {}", e)
         except Exception as e:
-            print(f"Error starting DNS server: {e}")
+            log.error("Error starting DNS server: {}", e)
         finally:
             if self.udp_server:
                 self.udp_server.close()
-                print("DNS server socket closed.")
+                log.info("DNS server socket closed.")
 
     async def _receive_from(self):
         """Non-blocking wrapper for receiving data."""
@@ -730,10 +765,10 @@ class NetworkManagerDNS:
 
             domain_name = self._decode_domain_name(query_section)
             if domain_name in self.query_cache:
-                print(f"Using cached DNS response for {domain_name}")
+                dns_log.debug("Using cached DNS response for {}", domain_name)
                 return self.query_cache[domain_name]
 
-            print(f"Handling DNS query for domain: {domain_name}")
+            dns_log.debug("Handling DNS query for domain: {}", domain_name)
 
             answer_name = b'\xc0\x0c'
             answer_ip = socket.inet_aton(self.dns_ip)
@@ -747,7 +782,7 @@ class NetworkManagerDNS:
             self.query_cache[domain_name] = dns_response  # Cache response
             return dns_response
         except Exception as e:
-            print(f"Error handling DNS query: {e}")
+            log.error("Error handling DNS query: {}", e)
             return b''
 
     def _decode_domain_name(self, query_section):
@@ -766,4 +801,4 @@ class NetworkManagerDNS:
         if self.udp_server:
             self.udp_server.close()
             self.udp_server = None
-            print("DNS server stopped.")
+            log.info("DNS server stopped.")
@@ -19,6 +19,13 @@ import utime
 import uasyncio as asyncio
 import uos
 from ConfigManager import ConfigManager
+from config_schema import SCHEMA
+from EventBus import bus as event_bus
+from FlashScheduler import scheduler as flash_scheduler
+from GCScheduler import scheduler as gc_scheduler
+from Logger import get_logger, manager as log_manager
+from MemoryMonitor import monitor
+from Metrics import metrics
 import utils
 
 # Conditional imports
@@ -29,6 +36,9 @@ if utils.isPicoW():
     from GitHubUpdater import GitHubUpdater
     import pushover
 
+# Logging
+log = get_logger("SecureMe")
+
 # Constants
 VERSION = "1.5.6"
 REPO_URL = "https://api.github.com/repos/CodeGoat-dev/SecureMe"
@@ -71,6 +81,7 @@ keypad_cols = None
 config_directory = "/config"
 config_file = "secureme.conf"
 network_config_file = "network_config.conf"
+settings = None
 
 tasks = []
 
@@ -188,7 +199,7 @@ async def play_dynamic_bell(frequency, initial_volume, loop_delay=0.05, times=5)
             if times > 1:
                 await asyncio.sleep(loop_delay)
     except Exception as e:
-        print(f"Error in play_dynamic_bell: {e}")
+        log.error("Error in play_dynamic_bell: {}", e)
     finally:
         buzzer.duty_u16(0)  # Turn off the buzzer
 
@@ -257,7 +268,7 @@ async def play_alarm(alarm_type="sweep", start_freq=500, end_freq=3000, cycles=1
         # Turn off the buzzer after the alarm
         buzzer.duty_u16(0)
     except Exception as e:
-        print(f"Error in play_alarm: {e}")
+        log.error("Error in play_alarm: {}", e)
     finally:
         # Ensure the buzzer is off
         buzzer.duty_u16(0)
@@ -283,6 +294,7 @@ async def alarm(message):
         return
 
     alarm_active = True
+    event_bus.publish("alarm", {"active": True, "message": message, "silent": silent_alarm})
 
     try:
         alarm_sound = config.get_entry("alarm", "alarm_sound")
@@ -290,7 +302,7 @@ async def alarm(message):
         if not alarm_sound == 0 and not alarm_sound == 1 and not alarm_sound == 2 and not alarm_sound == 3 and not alarm_sound == 4:
             alarm_sound = 0
             config.set_entry("alarm", "alarm_sound", alarm_sound)
-            await config.write_async()
+            config.schedule_write()
 
         if buzzer_volume is None or buzzer_volume == 0:
             raise ValueError("Invalid buzzer volume.")
@@ -354,10 +366,11 @@ async def alarm(message):
 
         alarm_active = False
     except Exception as e:
-        print(f"Error in alarm: {e}") 
+        log.error("Error in alarm: {}", e) 
     finally:
         alarm_active = False
         led.value(0)
+        event_bus.publish("alarm", {"active": False})
 
 # Arming handler
 async def handle_arming():
@@ -370,14 +383,14 @@ async def handle_arming():
         if not security_code:
             security_code = default_security_code
             config.set_entry("security", "security_code", security_code)
-            await config.write_async()
+            config.schedule_write()
 
         arming_cooldown = config.get_entry("security", "arming_cooldown")
 
         if not arming_cooldown:
             arming_cooldown = default_arming_cooldown
             config.set_entry("security", "arming_cooldown", arming_cooldown)
-            await config.write_async()
+            config.schedule_write()
 
         while True:
             if not utils.pin_is_input(arm_button):
@@ -386,25 +399,25 @@ async def handle_arming():
             if arm_button.value() == 1:  # Button pressed
                 arm_button.init(Pin.OUT)
                 if alarm_active:
-                    print("Stopping alarm...")
+                    log.info("Stopping alarm...")
                     alarm_active = False
                     buzzer.duty_u16(0)  # Stop the buzzer immediately
                 security_code = config.get_entry("security", "security_code")
                 if not security_code:
                     security_code = default_security_code
                     config.set_entry("security", "security_code", security_code)
-                    await config.write_async()
+                    config.schedule_write()
                 arming_cooldown = config.get_entry("security", "arming_cooldown")
                 if not arming_cooldown:
                     arming_cooldown = default_arming_cooldown
                     config.set_entry("security", "arming_cooldown", arming_cooldown)
-                    await config.write_async()
+                    config.schedule_write()
 
                 if is_armed:
                     if security_code:
                         entering_security_code = True
                         await play_dynamic_bell(150, buzzer_volume, 0.05, 1)
-                        print("Waiting for security code")
+                        log.info("Waiting for security code")
                         result = await enter_security_code(security_code, security_code_max_entry_attempts, security_code_min_length, security_code_max_length)
                         entering_security_code = False
                         if result is None:  # User cancelled
@@ -414,7 +427,7 @@ async def handle_arming():
                             await play_dynamic_bell(100, buzzer_volume, 0.05, 1)
                             continue
                     await play_dynamic_bell(300, buzzer_volume, 0.05, 1)
-                    print("Disarming")
+                    log.info("Disarming")
                     is_armed = False
                     await play_dynamic_bell(250, buzzer_volume, 0.05, arming_cooldown)
                     if system_status_notifications:
@@ -424,7 +437,7 @@ async def handle_arming():
                     if security_code:
                         entering_security_code = True
                         await play_dynamic_bell(150, buzzer_volume, 0.05, 1)
-                        print("Waiting for security code")
+                        log.info("Waiting for security code")
                         result = await enter_security_code(security_code, security_code_max_entry_attempts, security_code_min_length, security_code_max_length)
                         entering_security_code = False
                         if result is None:  # User cancelled
@@ -434,20 +447,67 @@ async def handle_arming():
                             await play_dynamic_bell(100, buzzer_volume, 0.05, 1)
                             continue
                     await play_dynamic_bell(300, buzzer_volume, 0.05, 1)
-                    print("Arming")
+                    log.info("Arming")
                     await play_dynamic_bell(250, buzzer_volume, 0.05, arming_cooldown)
                     is_armed = True
                     if system_status_notifications:
                         if general_notifications:
                             asyncio.create_task(send_system_status_notification(message_title="Security", status_message="System armed."))
 
+                event_bus.publish("armed", {"armed": is_armed, "source": "button"})
                 asyncio.create_task(indicator_signal("system_ready", state=is_armed))
 
             idle()
 
             await asyncio.sleep(0.05)  # Polling interval
     except Exception as e:
-        print(f"Error in handle_arming: {e}")
+        log.error("Error in handle_arming: {}", e)
+
+# Remote arming handler
+async def set_armed(armed):
+    """Arms or disarms the system from the web interface.
+
+    Args:
+    - armed: True to arm the system, False to disarm it.
+    """
+    global is_armed, alarm_active
+
+    try:
+        if armed == is_armed:
+            return
+
+        if armed:
+            log.info("Arming")
+            await play_dynamic_bell(250, buzzer_volume, 0.05, arming_cooldown)
+            is_armed = True
+            status_message = "System armed."
+        else:
+            if alarm_active:
+                log.info("Stopping alarm...")
+                alarm_active = False
+                buzzer.duty_u16(0)  # Stop the buzzer immediately
+            log.info("Disarming")
+            is_armed = False
+            await play_dynamic_bell(250, buzzer_volume, 0.05, arming_cooldown)
+            status_message = "System disarmed."
+
+        if system_status_notifications:
+            if general_notifications:
+                asyncio.create_task(send_system_status_notification(message_title="Security", status_message=status_message))
+
+        event_bus.publish("armed", {"armed": is_armed, "source": "web"})
+        asyncio.create_task(indicator_signal("system_ready", state=is_armed))
+    except Exception as e:
+        log.error("Error in set_armed: {}", e)
+
+# System status for the web interface
+def get_system_status():
+    """Returns the security system state."""
+    return {
+        "armed": is_armed,
+        "alarm": alarm_active,
+        "silent_alarm": silent_alarm
+    }
 
 # Alarm test handler
 async def handle_alarm_testing():
@@ -461,14 +521,14 @@ async def handle_alarm_testing():
                 alarm_test_button.init(Pin.OUT)
                 if alarm_active:
                     continue
-                print("Testing alarm...")
+                log.info("Testing alarm...")
                 asyncio.create_task(alarm("Testing Alarm."))
 
             idle()
 
             await asyncio.sleep(0.05)  # Polling interval
     except Exception as e:
-        print(f"Error in handle_alarm_testing: {e}")
+        log.error("Error in handle_alarm_testing: {}", e)
 
 # Alarm sound switching handler
 async def handle_alarm_sound_switching():
@@ -485,7 +545,7 @@ async def handle_alarm_sound_switching():
 
             if alarm_sound_button.value() == 1:  # Button pressed
                 alarm_sound_button.init(Pin.OUT)
-                print("Switching alarm sound")
+                log.info("Switching alarm sound")
                 if alarm_sound == 0:
                     alarm_sound = 1
                     await play_alarm("sweep_up", 300, 4000, 1)
@@ -504,13 +564,13 @@ async def handle_alarm_sound_switching():
 
                 # Save the updated alarm sound
                 config.set_entry("alarm", "alarm_sound", alarm_sound)
-                await config.write_async()
+                config.schedule_write()
 
             idle()
 
             await asyncio.sleep(0.05)  # Polling interval
     except Exception as e:
-        print(f"Error in handle_alarm_sound_switching: {e}")
+        log.error("Error in handle_alarm_sound_switching: {}", e)
 
 # Buzzer volume handler
 async def handle_buzzer_volume():
@@ -528,7 +588,7 @@ async def handle_buzzer_volume():
                 volume_down_button.init(Pin.OUT)
                 if alarm_active:
                     continue
-                print("Turning down volume.")
+                log.info("Turning down volume.")
                 await decrease_buzzer_volume()
                 await asyncio.sleep(0.1)
 
@@ -536,7 +596,7 @@ async def handle_buzzer_volume():
                 volume_up_button.init(Pin.OUT)
                 if alarm_active:
                     continue
-                print("Turning up volume.")
+                log.info("Turning up volume.")
                 await increase_buzzer_volume()
                 await asyncio.sleep(0.1)
 
@@ -544,7 +604,7 @@ async def handle_buzzer_volume():
 
             await asyncio.sleep(0.05)  # Polling interval
     except Exception as e:
-        print(f"Error in handle_buzzer_volume: {e}")
+        log.error("Error in handle_buzzer_volume: {}", e)
 
 # Motion detection
 async def detect_motion():
@@ -552,7 +612,7 @@ async def detect_motion():
     global enable_detect_motion, sensor_cooldown, pir_timeout
 
     try:
-        print("Detecting movement...")
+        log.info("Detecting movement...")
 
         while True:
             enable_detect_motion = config.get_entry("security", "detect_motion")
@@ -574,16 +634,17 @@ async def detect_motion():
                 if alarm_active:
                     await asyncio.sleep(0.05)
                     continue
-                print("Movement Detected.")
+                log.info("Movement Detected.")
+                event_bus.publish("detection", {"sensor": "motion"})
                 asyncio.create_task(alarm("Movement Detected."))
                 pir_timeout = utime.time() + sensor_cooldown
-                print("Detecting movement...")
+                log.info("Detecting movement...")
 
             idle()
 
             await asyncio.sleep(0.05)  # Polling interval
     except Exception as e:
-        print(f"Error in detect_motion: {e}")
+        log.error("Error in detect_motion: {}", e)
 
 # Tilt detection
 async def detect_tilt():
@@ -591,7 +652,7 @@ async def detect_tilt():
     global enable_detect_tilt, sensor_cooldown, tilt_timeout
 
     try:
-        print("Detecting tilt...")
+        log.info("Detecting tilt...")
 
         while True:
             enable_detect_tilt = config.get_entry("security", "detect_tilt")
@@ -617,16 +678,17 @@ async def detect_tilt():
                 if alarm_active:
                     await asyncio.sleep(0.05)
                     continue
-                print("Tilt Detected.")
+                log.info("Tilt Detected.")
+                event_bus.publish("detection", {"sensor": "tilt"})
                 asyncio.create_task(alarm("Tilt Detected"))
                 tilt_timeout = utime.time() + sensor_cooldown
-                print("Detecting tilt...")
+                log.info("Detecting tilt...")
 
             idle()
 
             await asyncio.sleep(0.05)  # Polling interval
     except Exception as e:
-        print(f"Error in detect_tilt: {e}")
+        log.error("Error in detect_tilt: {}", e)
 
 # Sound detection
 async def detect_sound():
@@ -634,7 +696,7 @@ async def detect_sound():
     global enable_detect_sound, sensor_cooldown, mic_timeout
 
     try:
-        print("Detecting sound...")
+        log.info("Detecting sound...")
 
         while True:
             enable_detect_sound = config.get_entry("security", "detect_sound")
@@ -660,16 +722,17 @@ async def detect_sound():
                 if alarm_active:
                     await asyncio.sleep(0.05)
                     continue
-                print("Sound Detected.")
+                log.info("Sound Detected.")
+                event_bus.publish("detection", {"sensor": "sound"})
                 asyncio.create_task(alarm("Sound Detected."))
                 mic_timeout = utime.time() + sensor_cooldown
-                print("Detecting sound...")
+                log.info("Detecting sound...")
 
             idle()
 
             await asyncio.sleep(0.05)  # Polling interval
     except Exception as e:
-        print(f"Error in detect_sound: {e}")
+        log.error("Error in detect_sound: {}", e)
 
 # Arming indicator handler
 async def handle_arming_indicator():
@@ -689,7 +752,7 @@ async def handle_arming_indicator():
 
             await asyncio.sleep(1)  # Polling interval
     except Exception as e:
-        print(f"Error in handle_arming_indicator: {e}")
+        log.error("Error in handle_arming_indicator: {}", e)
     finally:
         led.value(0)
 
@@ -697,7 +760,7 @@ async def handle_arming_indicator():
 async def detect_keypad_keys():
     """Detect matrix keypad key commands."""
     try:
-        print("Detecting keypad keys...")
+        log.info("Detecting keypad keys...")
 
         while True:
             if entering_security_code:
@@ -710,26 +773,26 @@ async def detect_keypad_keys():
                     await asyncio.sleep(0.05)
                     continue
                 if key == "A":
-                    print("Initiating keypad_lock.")
+                    log.info("Initiating keypad_lock.")
                     await keypad_lock()
                     await asyncio.sleep(0.1)
                 elif key == "B":
-                    print("Initiating alarm_mode_switch.")
+                    log.info("Initiating alarm_mode_switch.")
                     await alarm_mode_switch()
                 elif key == "C":
-                    print("Initiating change_security_code.")
+                    log.info("Initiating change_security_code.")
                     await change_security_code()
                 elif key == "D":
-                    print("Initiating reset_firmware_config.")
+                    log.info("Initiating reset_firmware_config.")
                     await reset_firmware_config()
                 else:
-                    print(f"Unhandled key press detected: {key}")
+                    log.debug("Unhandled key press detected: {}", key)
 
             idle()
 
             await asyncio.sleep(0.05)  # Polling interval
     except Exception as e:
-        print(f"Error in detect_keypad_keys: {e}")
+        log.error("Error in detect_keypad_keys: {}", e)
 
 # Method to increase buzzer volume by 10%
 async def increase_buzzer_volume():
@@ -739,8 +802,8 @@ async def increase_buzzer_volume():
     step = int(6144 * 0.1)  # Calculate 10% step
     buzzer_volume = min(buzzer_volume + step, 6144)
     config.set_entry("buzzer", "buzzer_volume", buzzer_volume)
-    await config.write_async()
-    print(f"Buzzer volume increased to: {buzzer_volume}")
+    config.schedule_write()
+    log.info("Buzzer volume increased to: {}", buzzer_volume)
     asyncio.create_task(indicator_signal("buzzer_volume"))
 
 # Method to decrease buzzer volume by 10%
@@ -751,8 +814,8 @@ async def decrease_buzzer_volume():
     step = int(6144 * 0.1)  # Calculate 10% step
     buzzer_volume = max(buzzer_volume - step, 0)
     config.set_entry("buzzer", "buzzer_volume", buzzer_volume)
-    await config.write_async()
-    print(f"Buzzer volume decreased to: {buzzer_volume}")
+    config.schedule_write()
+    log.info("Buzzer volume decreased to: {}", buzzer_volume)
     asyncio.create_task(indicator_signal("buzzer_volume"))
 
 # Read a single key from the keypad
@@ -771,7 +834,7 @@ def read_keypad_key():
             row.low()
         return None
     except Exception as e:
-        print(f"Error in read_keypad_key: {e}")
+        log.error("Error in read_keypad_key: {}", e)
     finally:
         for i, row in enumerate(keypad_rows):
             row.low()
@@ -792,23 +855,23 @@ async def send_pushover_notification(title="Goat - SecureMe", message="Testing",
     await asyncio.sleep(0)
 
     if not utils.isPicoW():
-        print("Unsupported device.")
+        log.warning("Unsupported device.")
         return
 
     if not utils.isNetworkConnected():
-        print("No internet connection available.")
+        log.warning("No internet connection available.")
         return
 
     pushover_app_token = config.get_entry("pushover", "app_token")
 
     if not pushover_app_token:
-        print("A Pushover app token is required to send push notifications.")
+        log.warning("A Pushover app token is required to send push notifications.")
         return
 
     pushover_api_key = config.get_entry("pushover", "api_key")
 
     if not pushover_api_key:
-        print("A Pushover API key is required to send push notifications.")
+        log.warning("A Pushover API key is required to send push notifications.")
         return
 
     try:
@@ -828,7 +891,7 @@ async def send_pushover_notification(title="Goat - SecureMe", message="Testing",
 
         asyncio.create_task(pushover.send_notification(app_token=pushover_app_token, api_key=pushover_api_key, title=title, message=message, priority=priority, timeout=timeout))
     except Exception as e:
-        print(f"Error sending notification: {e}")
+        log.error("Error sending notification: {}", e)
     finally:
         sending_pushover_notification = False
 
@@ -844,11 +907,11 @@ async def send_system_status_notification(message_title, status_message):
     await asyncio.sleep(0)
 
     if not message_title:
-        print("A message title is required.")
+        log.warning("A message title is required.")
         return
 
     if not status_message:
-        print("A status message is required.")
+        log.warning("A status message is required.")
         return
 
     if utils.isPicoW():
@@ -859,7 +922,7 @@ async def send_system_status_notification(message_title, status_message):
                         await asyncio.sleep(0.1)
                 asyncio.create_task(send_pushover_notification(title=message_title, message=status_message))
         except Exception as e:
-            print(f"Unable to send system status notification: {e}")
+            log.error("Unable to send system status notification: {}", e)
 
 async def indicator_signal(indicator_type, state=None):
     """Play the specified indicator signal.
@@ -933,7 +996,7 @@ async def indicator_signal(indicator_type, state=None):
         led.value(0)
 
     except Exception as e:
-        print(f"Error in indicator_signal({indicator_type}): {e}")
+        log.error("Error in indicator_signal({}): {}", indicator_type, e)
     finally:
         buzzer.duty_u16(0)  # Ensure buzzer is off
         led.value(0)
@@ -945,15 +1008,15 @@ async def keypad_lock():
 
     try:
         if keypad_locked:
-            print("Keypad unlocked.")
+            log.info("Keypad unlocked.")
             keypad_locked = False
             asyncio.create_task(indicator_signal("keypad_lock", state=keypad_locked))
         else:
-            print("Keypad locked.")
+            log.info("Keypad locked.")
             keypad_locked = True
             asyncio.create_task(indicator_signal("keypad_lock", state=keypad_locked))
     except Exception as e:
-        print(f"Error in keypad_lock: {e}")
+        log.error("Error in keypad_lock: {}", e)
 
 # Alarm mode switch
 async def alarm_mode_switch():
@@ -961,12 +1024,12 @@ async def alarm_mode_switch():
     global silent_alarm, pushover_app_token, pushover_api_key, alarm_active, security_code, entering_security_code
 
     if not utils.isPicoW():
-        print("Unsupported device.")
+        log.warning("Unsupported device.")
         await play_dynamic_bell(100, buzzer_volume, 0.05, 1)
         return
 
     if not utils.isNetworkConnected():
-        print("No internet connection available.")
+        log.warning("No internet connection available.")
         await play_dynamic_bell(100, buzzer_volume, 0.05, 1)
         return
 
@@ -978,31 +1041,31 @@ async def alarm_mode_switch():
         if not security_code:
             security_code = default_security_code
             config.set_entry("security", "security_code", security_code)
-            await config.write_async()
+            config.schedule_write()
 
         pushover_app_token = config.get_entry("pushover", "app_token")
 
         if not pushover_app_token:
-            print("A Pushover app token is required for silent alarms.")
+            log.warning("A Pushover app token is required for silent alarms.")
             await play_dynamic_bell(100, buzzer_volume, 0.05, 1)
             return
 
         pushover_api_key = config.get_entry("pushover", "api_key")
 
         if not pushover_api_key:
-            print("A Pushover API key is required for silent alarms.")
+            log.warning("A Pushover API key is required for silent alarms.")
             await play_dynamic_bell(100, buzzer_volume, 0.05, 1)
             return
 
         if alarm_active:
-            print("Stopping alarm...")
+            log.info("Stopping alarm...")
             alarm_active = False
             buzzer.duty_u16(0)  # Stop the buzzer immediately
 
         if security_code:
             entering_security_code = True
             await play_dynamic_bell(150, buzzer_volume, 0.05, 1)
-            print("Waiting for security code")
+            log.info("Waiting for security code")
             result = await enter_security_code(security_code, security_code_max_entry_attempts, security_code_min_length, security_code_max_length)
             entering_security_code = False
             if result is None:  # User cancelled
@@ -1016,26 +1079,26 @@ async def alarm_mode_switch():
         if not silent_alarm:
             key_is_valid = await pushover.validate_api_key(app_token=pushover_app_token, api_key=pushover_api_key)
             if not key_is_valid:
-                print("The configured Pushover API key is invalid.")
+                log.warning("The configured Pushover API key is invalid.")
                 await play_dynamic_bell(100, buzzer_volume, 0.05, 1)
                 return
 
         if silent_alarm:
-            print("Alarm mode set to audible.")
+            log.info("Alarm mode set to audible.")
             silent_alarm = False
             asyncio.create_task(indicator_signal("alarm_mode_switch", state=silent_alarm))
             if system_status_notifications:
                 if general_notifications:
                     asyncio.create_task(send_system_status_notification(message_title="Alarm", status_message="Alarm mode set to audible."))
         else:
-            print("Alarm mode set to silent.")
+            log.info("Alarm mode set to silent.")
             silent_alarm = True
             asyncio.create_task(indicator_signal("alarm_mode_switch", state=silent_alarm))
             if system_status_notifications:
                 if general_notifications:
                     asyncio.create_task(send_system_status_notification(message_title="Alarm", status_message="Alarm mode set to silent."))
     except Exception as e:
-        print(f"Error in alarm_mode_switch: {e}")
+        log.error("Error in alarm_mode_switch: {}", e)
 
 # Change security code
 async def change_security_code():
@@ -1048,23 +1111,23 @@ async def change_security_code():
         if not security_code:
             security_code = "0000"
             config.set_entry("security", "security_code", security_code)
-            await config.write_async()
+            config.schedule_write()
 
         if security_code:
             entering_security_code = True
             await play_dynamic_bell(150, buzzer_volume, 0.05, 1)
             await play_dynamic_bell(200, buzzer_volume, 0.05, 1)
 
-            print("Waiting for current security code")
+            log.info("Waiting for current security code")
             result = await enter_security_code(security_code, security_code_max_entry_attempts, security_code_min_length, security_code_max_length)
 
             if result is None:  # User cancelled
-                print("User cancelled the security code entry.")
+                log.info("User cancelled the security code entry.")
                 entering_security_code = False
                 await play_dynamic_bell(100, buzzer_volume, 0.05, 1)
                 return
             elif not result:  # Max attempts reached or incorrect
-                print("Max attempts reached or incorrect code entered.")
+                log.warning("Max attempts reached or incorrect code entered.")
                 entering_security_code = False
                 await play_dynamic_bell(100, buzzer_volume, 0.05, 1)
                 return
@@ -1073,26 +1136,26 @@ async def change_security_code():
 
             # Helper function for entering and confirming the code
             async def enter_code(prompt):
-                print(prompt)
+                log.info(prompt)
                 code = ""
                 while len(code) < security_code_max_length:
                     key = read_keypad_key()
                     if key:
                         if key == "#":
                             if code < security_code_min_length:
-                                print(f"Code too short: {code}")
+                                log.warning("Code too short.")
                                 return None
-                            print(f"Code entered: {code}")
+                            log.debug("Code entered.")
                             break
                         elif key == "*":
                             if len(code) == 0:
-                                print("Code entry cancelled.")
+                                log.info("Code entry cancelled.")
                                 return None
-                            print("Code cleared!")
+                            log.info("Code cleared!")
                             code = ""
                         else:
                             code += key
-                            print(f"Key pressed: {key}")
+                            log.debug("Key pressed.")
                     await asyncio.sleep(0.1)  # Slight delay to avoid multiple detections
                 return code
 
@@ -1113,7 +1176,7 @@ async def change_security_code():
                 return
 
             if new_code != new_code_confirmation:
-                print("Confirmation code does not match.")
+                log.warning("Confirmation code does not match.")
                 entering_security_code = False
                 await play_dynamic_bell(100, buzzer_volume, 0.05, 1)
                 return
@@ -1121,17 +1184,17 @@ async def change_security_code():
             # Update the security code
             security_code = new_code
             config.set_entry("security", "security_code", security_code)
-            await config.write_async()
+            await config.flush_async()
             await play_dynamic_bell(150, buzzer_volume, 0.05, 1)
             await play_dynamic_bell(200, buzzer_volume, 0.05, 1)
-            print(f"Security code updated. New code: {security_code}")
+            log.info("Security code updated.")
             if system_status_notifications:
                 if general_notifications:
                     asyncio.create_task(send_system_status_notification(message_title="Security", status_message=f"System security code updated. New code: {security_code}"))
 
         entering_security_code = False
     except Exception as e:
-        print(f"Error in change_security_code: {e}")
+        log.error("Error in change_security_code: {}", e)
     finally:
         entering_security_code = False
 
@@ -1146,10 +1209,10 @@ async def reset_firmware_config():
         if not security_code:
             security_code = "0000"
             config.set_entry("security", "security_code", security_code)
-            await config.write_async()
+            config.schedule_write()
 
         if alarm_active:
-            print("Stopping alarm...")
+            log.info("Stopping alarm...")
             alarm_active = False
             buzzer.duty_u16(0)
 
@@ -1157,7 +1220,7 @@ async def reset_firmware_config():
 
         await play_dynamic_bell(50, buzzer_volume, 0.05, 3)
 
-        print("Waiting for security code")
+        log.info("Waiting for security code")
 
         result = await enter_security_code(security_code, security_code_max_entry_attempts, security_code_min_length, security_code_max_length)
 
@@ -1172,7 +1235,7 @@ async def reset_firmware_config():
 
         await play_dynamic_bell(300, buzzer_volume, 0.05, 1)
 
-        print("Waiting for second security code")
+        log.info("Waiting for second security code")
 
         final_result = await enter_security_code(security_code, security_code_max_entry_attempts, security_code_min_length, security_code_max_length)
 
@@ -1187,7 +1250,7 @@ async def reset_firmware_config():
 
         await play_dynamic_bell(300, buzzer_volume, 0.05, 1)
 
-        print("Resetting firmware configuration...")
+        log.info("Resetting firmware configuration...")
 
         if system_status_notifications:
             if general_notifications:
@@ -1195,10 +1258,9 @@ async def reset_firmware_config():
 
         await play_dynamic_bell(50, buzzer_volume, 0.05, 5)
 
-        if config_file in uos.listdir(config_directory):
-            uos.remove(f"{config_directory}/{config_file}")
-        if network_config_file in uos.listdir(config_directory):
-            uos.remove(f"{config_directory}/{network_config_file}")
+        # Remove the configuration files and their snapshots
+        for filename in uos.listdir(config_directory):
+            uos.remove(f"{config_directory}/{filename}")
 
         uos.rmdir(config_directory)
 
@@ -1206,7 +1268,7 @@ async def reset_firmware_config():
 
         entering_security_code = False
     except Exception as e:
-        print(f"Error in reset_firmware_config: {e}")
+        log.error("Error in reset_firmware_config: {}", e)
 
 # Security code entry
 async def enter_security_code(security_code, max_attempts, min_length, max_length):
@@ -1226,37 +1288,37 @@ async def enter_security_code(security_code, max_attempts, min_length, max_lengt
             if key:
                 if key == "#":  # Submit code
                     if len(code) < min_length:
-                        print(f"Code too short: {code}")
+                        log.warning("Code too short.")
                         await play_dynamic_bell(50, buzzer_volume, 0.05, 1)
                         if system_status_notifications:
                             if security_code_notifications:
                                 asyncio.create_task(send_system_status_notification(message_title="Security", status_message="The provided security code is too short."))
                         return None  # Cancellation
-                    print(f"Code entered: {code}")
+                    log.debug("Code entered.")
                     break
                 elif key == "*":  # Cancel or clear code
                     if len(code) == 0:
-                        print("Code entry cancelled.")
+                        log.info("Code entry cancelled.")
                         if system_status_notifications:
                             if security_code_notifications:
                                 asyncio.create_task(send_system_status_notification(message_title="Security", status_message="Security code entry cancelled."))
                         return None  # Cancellation
-                    print("Code cleared!")
+                    log.info("Code cleared!")
                     code = ""  # Reset
                 else:
                     code += key
-                    print(f"Key pressed: {key}")
+                    log.debug("Key pressed.")
             await asyncio.sleep(0.1)  # Slight delay to avoid multiple detections
 
         if len(code) == 0:  # Code entry cancelled
-            print("Code entry cancelled.")
+            log.info("Code entry cancelled.")
             if system_status_notifications:
                 if security_code_notifications:
                     asyncio.create_task(send_system_status_notification(message_title="Security", status_message="Security code entry cancelled."))
             return None
 
         if len(code) < min_length:  # Code too short
-            print(f"Security code too short: {code}")
+            log.warning("Security code too short.")
             await play_dynamic_bell(50, buzzer_volume, 0.05, 1)
             if system_status_notifications:
                 if security_code_notifications:
@@ -1265,20 +1327,20 @@ async def enter_security_code(security_code, max_attempts, min_length, max_lengt
 
         if code != security_code:  # Incorrect code
             attempts += 1
-            print(f"Invalid security code provided. Attempt {attempts}/{max_attempts}.")
+            log.warning("Invalid security code provided. Attempt {}/{}.", attempts, max_attempts)
             await play_dynamic_bell(50, buzzer_volume, 0.05, 1)
             if system_status_notifications:
                 if security_code_notifications:
                     asyncio.create_task(send_system_status_notification(message_title="Security", status_message="Invalid security code provided."))
             if attempts >= max_attempts:
-                print("Maximum attempts reached. Triggering alarm.")
+                log.warning("Maximum attempts reached. Triggering alarm.")
                 asyncio.create_task(alarm("Invalid Security Code Provided."))  # Trigger the alarm after too many attempts
                 return False  # Return False to indicate max attempts exceeded
             asyncio.create_task(alarm("Invalid Security Code Provided."))
             continue
 
         # Correct code
-        print("Access granted.")
+        log.info("Access granted.")
         return True  # Success
     return False  # Max attempts exceeded
 
@@ -1288,16 +1350,16 @@ async def check_config():
     try:
         # Check if the configuration directory exists
         uos.listdir(config_directory)
-        print("Configuration directory exists.")
+        log.info("Configuration directory exists.")
     except OSError as e:
-        print(f"Configuration directory does not exist. Error: {e}")
+        log.error("Configuration directory does not exist. Error: {}", e)
         try:
-            print("Attempting to create configuration directory...")
+            log.info("Attempting to create configuration directory...")
             uos.mkdir(config_directory)
-            print("Configuration directory created successfully.")
+            log.info("Configuration directory created successfully.")
         except OSError as e:
-            print(f"Failed to create configuration directory. Error: {e}")
-            print("Rebooting...")
+            log.error("Failed to create configuration directory. Error: {}", e)
+            log.info("Rebooting...")
             reset()
 
 # System start-up
@@ -1317,175 +1379,56 @@ async def system_startup():
 
         await indicator_signal("system_ready", state=is_armed)
 
-        print("System ready.")
+        log.info("System ready.")
 
         # Send system ready notification
         asyncio.create_task(send_system_status_notification(message_title="System", status_message="System ready."))
     except Exception as e:
-        print(f"Error in system_startup: {e}")
+        log.error("Error in system_startup: {}", e)
 
 # Configuration validation
 async def validate_config():
     """Validates the firmware configuration."""
-    global hostname, ip_address, subnet_mask, gateway, dns, enable_detect_motion, enable_detect_tilt, enable_detect_sound, sensor_cooldown, arming_cooldown, pir_warmup_time, alarm_sound, buzzer_volume, security_code, system_status_notifications, general_notifications, security_code_notifications, web_interface_notifications, update_notifications, web_server_address, web_server_http_port, admin_password, enable_auto_update, update_check_interval, enable_time_sync, time_sync_server
+    global settings, hostname, ip_address, subnet_mask, gateway, dns, enable_detect_motion, enable_detect_tilt, enable_detect_sound, sensor_cooldown, arming_cooldown, pir_warmup_time, alarm_sound, buzzer_volume, security_code, pushover_app_token, pushover_api_key, system_status_notifications, general_notifications, security_code_notifications, web_interface_notifications, update_notifications, web_server_address, web_server_http_port, admin_password, enable_auto_update, update_check_interval, enable_time_sync, time_sync_server, time_sync_interval
 
-    print("Validating firmware configuration...")
+    log.info("Validating firmware configuration...")
 
     try:
-        enable_detect_motion = config.get_entry("security", "detect_motion")
-
-        if not isinstance(enable_detect_motion, bool):
-            enable_detect_motion = True
-            config.set_entry("security", "detect_motion", enable_detect_motion)
-            await config.write_async()
-
-        enable_detect_tilt = config.get_entry("security", "detect_tilt")
-
-        if not isinstance(enable_detect_tilt, bool):
-            enable_detect_tilt = True
-            config.set_entry("security", "detect_tilt", enable_detect_tilt)
-            await config.write_async()
-
-        enable_detect_sound = config.get_entry("security", "detect_sound")
-
-        if not isinstance(enable_detect_sound, bool):
-            enable_detect_sound = True
-            config.set_entry("security", "detect_sound", enable_detect_sound)
-            await config.write_async()
-
-        sensor_cooldown = config.get_entry("security", "sensor_cooldown")
-
-        if not isinstance(sensor_cooldown, int):
-            sensor_cooldown = default_sensor_cooldown
-            config.set_entry("security", "sensor_cooldown", sensor_cooldown)
-            await config.write_async()
-
-        arming_cooldown = config.get_entry("security", "arming_cooldown")
-
-        if not isinstance(arming_cooldown, int):
-            arming_cooldown = default_arming_cooldown
-            config.set_entry("security", "arming_cooldown", arming_cooldown)
-            await config.write_async()
-
-        pir_warmup_time = config.get_entry("security", "pir_warmup_time")
-
-        if not isinstance(pir_warmup_time, int):
-            pir_warmup_time = default_pir_warmup_time
-            config.set_entry("security", "pir_warmup_time", pir_warmup_time)
-            await config.write_async()
-
-        alarm_sound = config.get_entry("alarm", "alarm_sound")
-
-        if not isinstance(alarm_sound, int):
-            alarm_sound = default_alarm_sound
-            config.set_entry("alarm", "alarm_sound", alarm_sound)
-            await config.write_async()
-
-        buzzer_volume = config.get_entry("buzzer", "buzzer_volume")
-
-        if not isinstance(buzzer_volume, int):
-            buzzer_volume = default_buzzer_volume
-            config.set_entry("buzzer", "buzzer_volume", buzzer_volume)
-            await config.write_async()
-
-        security_code = config.get_entry("security", "security_code")
-
-        if not isinstance(security_code, str):
-            security_code = default_security_code
-            config.set_entry("security", "security_code", security_code)
-            await config.write_async()
-
-        if utils.isPicoW():
-            hostname = config.get_entry("network", "hostname")
-            if not isinstance(hostname, str):
-                hostname = default_hostname
-                config.set_entry("network", "hostname", hostname)
-                await config.write_async()
-            ip_address = config.get_entry("network", "ip_address")
-            if not isinstance(ip_address, str):
-                ip_address = default_ip_address
-                config.set_entry("network", "ip_address", ip_address)
-                await config.write_async()
-            subnet_mask = config.get_entry("network", "subnet_mask")
-            if not isinstance(subnet_mask, str):
-                subnet_mask = default_subnet_mask
-                config.set_entry("network", "subnet_mask", subnet_mask)
-                await config.write_async()
-            gateway = config.get_entry("network", "gateway")
-            if not isinstance(gateway, str):
-                gateway = default_gateway
-                config.set_entry("network", "gateway", gateway)
-                await config.write_async()
-            dns = config.get_entry("network", "dns")
-            if not isinstance(dns, str):
-                dns = default_dns
-                config.set_entry("network", "dns", dns)
-                await config.write_async()
-            system_status_notifications = config.get_entry("pushover", "system_status_notifications")
-            if not isinstance(system_status_notifications, bool):
-                system_status_notifications = True
-                config.set_entry("pushover", "system_status_notifications", system_status_notifications)
-                await config.write_async()
-            general_notifications = config.get_entry("pushover", "general_notifications")
-            if not isinstance(general_notifications, bool):
-                general_notifications = True
-                config.set_entry("pushover", "general_notifications", general_notifications)
-                await config.write_async()
-            security_code_notifications = config.get_entry("pushover", "security_code_notifications")
-            if not isinstance(security_code_notifications, bool):
-                security_code_notifications = True
-                config.set_entry("pushover", "security_code_notifications", security_code_notifications)
-                await config.write_async()
-            web_interface_notifications = config.get_entry("pushover", "web_interface_notifications")
-            if not isinstance(web_interface_notifications, bool):
-                web_interface_notifications = True
-                config.set_entry("pushover", "web_interface_notifications", web_interface_notifications)
-                await config.write_async()
-            update_notifications = config.get_entry("pushover", "update_notifications")
-            if not isinstance(update_notifications, bool):
-                update_notifications = True
-                config.set_entry("pushover", "update_notifications", update_notifications)
-                await config.write_async()
-            web_server_address = config.get_entry("server", "address")
-            if not isinstance(web_server_address, str):
-                web_server_address = default_web_server_address
-                config.set_entry("server", "address", web_server_address)
-                await config.write_async()
-            web_server_http_port = config.get_entry("server", "http_port")
-            if not isinstance(web_server_http_port, int):
-                web_server_http_port = default_web_server_http_port
-                config.set_entry("server", "http_port", web_server_http_port)
-                await config.write_async()
-            admin_password = config.get_entry("server", "admin_password")
-            if not isinstance(admin_password, str):
-                admin_password = default_admin_password
-                config.set_entry("server", "admin_password", admin_password)
-                await config.write_async()
-            enable_auto_update = config.get_entry("update", "enable_auto_update")
-            if not isinstance(enable_auto_update, bool):
-                enable_auto_update = True
-                config.set_entry("update", "enable_auto_update", enable_auto_update)
-                await config.write_async()
-            update_check_interval = config.get_entry("update", "update_check_interval")
-            if not isinstance(update_check_interval, int):
-                update_check_interval = default_update_check_interval
-                config.set_entry("update", "update_check_interval", update_check_interval)
-                await config.write_async()
-            enable_time_sync = config.get_entry("time", "enable_time_sync")
-            if not isinstance(enable_time_sync, bool):
-                enable_time_sync = True
-                config.set_entry("time", "enable_time_sync", enable_time_sync)
-                await config.write_async()
-            time_sync_server = config.get_entry("time", "time_sync_server")
-            if not isinstance(time_sync_server, str):
-                time_sync_server = default_time_sync_server
-                config.set_entry("time", "time_sync_server", time_sync_server)
-                await config.write_async()
-            time_sync_interval = config.get_entry("time", "time_sync_interval")
-            if not isinstance(time_sync_interval, int):
-                time_sync_interval = default_time_sync_interval
-                config.set_entry("time", "time_sync_interval", time_sync_interval)
-                await config.write_async()
+        # Validate and fill the whole configuration with at most one write
+        settings = await config.validate_async(SCHEMA)
+
+        enable_detect_motion = settings.detect_motion
+        enable_detect_tilt = settings.detect_tilt
+        enable_detect_sound = settings.detect_sound
+        sensor_cooldown = settings.sensor_cooldown
+        arming_cooldown = settings.arming_cooldown
+        pir_warmup_time = settings.pir_warmup_time
+        alarm_sound = settings.alarm_sound
+        buzzer_volume = settings.buzzer_volume
+        security_code = settings.security_code
+
+        hostname = settings.hostname
+        ip_address = settings.ip_address
+        subnet_mask = settings.subnet_mask
+        gateway = settings.gateway
+        dns = settings.dns
+        system_status_notifications = settings.system_status_notifications
+        general_notifications = settings.general_notifications
+        security_code_notifications = settings.security_code_notifications
+        web_interface_notifications = settings.web_interface_notifications
+        update_notifications = settings.update_notifications
+        web_server_address = settings.web_server_address
+        web_server_http_port = settings.web_server_http_port
+        admin_password = settings.admin_password
+        enable_auto_update = settings.enable_auto_update
+        update_check_interval = settings.update_check_interval
+        enable_time_sync = settings.enable_time_sync
+        time_sync_server = settings.time_sync_server
+        time_sync_interval = settings.time_sync_interval
+
+        log_manager.level = settings.log_level
+        log_manager.flash_enabled = settings.flash_logging
+        log_manager.console = settings.console_logging
 
         # Conditionally disable settings which require internet access
         if not utils.isPicoW():
@@ -1509,21 +1452,58 @@ async def validate_config():
             time_sync_server = default_time_sync_server
             time_sync_interval = default_time_sync_interval
     except Exception as e:
-        print(f"Error in validate_config: {e}")
+        log.error("Error in validate_config: {}", e)
+
+# Configuration change handler
+def handle_config_changes(changes):
+    """Applies configuration changes made by other firmware components.
+
+    Args:
+    - changes: A dictionary of changed sections mapping keys to their new values.
+    """
+    global alarm_sound, buzzer_volume, system_status_notifications, general_notifications, security_code_notifications, web_interface_notifications, update_notifications
+
+    alarm = changes.get("alarm", {})
+    if isinstance(alarm.get("alarm_sound"), int):
+        alarm_sound = alarm["alarm_sound"]
+
+    buzzer_settings = changes.get("buzzer", {})
+    if isinstance(buzzer_settings.get("buzzer_volume"), int):
+        buzzer_volume = buzzer_settings["buzzer_volume"]
+
+    pushover_settings = changes.get("pushover", {})
+    if isinstance(pushover_settings.get("system_status_notifications"), bool):
+        system_status_notifications = pushover_settings["system_status_notifications"]
+    if isinstance(pushover_settings.get("general_notifications"), bool):
+        general_notifications = pushover_settings["general_notifications"]
+    if isinstance(pushover_settings.get("security_code_notifications"), bool):
+        security_code_notifications = pushover_settings["security_code_notifications"]
+    if isinstance(pushover_settings.get("web_interface_notifications"), bool):
+        web_interface_notifications = pushover_settings["web_interface_notifications"]
+    if isinstance(pushover_settings.get("update_notifications"), bool):
+        update_notifications = pushover_settings["update_notifications"]
+
+    logging_settings = changes.get("logging", {})
+    if isinstance(logging_settings.get("log_level"), int):
+        log_manager.level = logging_settings["log_level"]
+    if isinstance(logging_settings.get("flash_logging"), bool):
+        log_manager.flash_enabled = logging_settings["flash_logging"]
+    if isinstance(logging_settings.get("console_logging"), bool):
+        log_manager.console = logging_settings["console_logging"]
 
 # PIR sensor warmup
 async def warmup_pir_sensor():
     """Waits for the configured PIR sensor warmup time to let the PIR sensor warm up."""
-    print("Warming up PIR sensor...")
+    log.info("Warming up PIR sensor...")
 
     try:
         for i in range(pir_warmup_time, 0, -1):
-            print(f"warming up... {i}s remaining.")
+            log.info("warming up... {}s remaining.", i)
             await play_dynamic_bell(250, buzzer_volume, 0.1, 1)
 
-        print("PIR sensor ready!")
+        log.info("PIR sensor ready!")
     except Exception as e:
-        print(f"Error in warmup_pir_sensor: {e}")
+        log.error("Error in warmup_pir_sensor: {}", e)
 
 async def configure_network_settings():
     if not utils.isPicoW():
@@ -1536,25 +1516,50 @@ async def configure_network_settings():
         if not ip_address == "0.0.0.0":
             network_manager.set_static_ip(ip=ip_address, subnet=subnet_mask, gateway=gateway, dns=dns)
     except Exception as e:
-        print(f"Unable to configure network settings: {e}")
+        log.error("Unable to configure network settings: {}", e)
 
 async def system_shutdown():
     """System firmware shutdown."""
     global tasks
 
-    print("Shutting down...")
+    log.info("Shutting down...")
 
     for task in tasks:
         task.cancel()
     await asyncio.sleep(0)  # Allow tasks to finish cleanup
 
+    # Write any pending configuration changes
+    try:
+        await config.flush_async(critical=True)
+    except Exception as e:
+        log.error("Unable to write configuration: {}", e)
+
+    # Write any pending log records
+    await log_manager.flush(critical=True)
+
     await utils.deinitialize_pins()
 
+# Latency-critical window check
+def is_latency_critical():
+    """Checks if an alarm or security code entry is in progress."""
+    return alarm_active or entering_security_code
+
+# Audio activity check
+def is_audio_active():
+    """Checks if an alarm or indicator sound is playing."""
+    return alarm_active or buzzer.duty_u16() != 0
+
 # Firmware entry point
 async def main():
     """Main coroutine to handle firmware services"""
     global tasks
 
+    # Hold off garbage collection while alarms or code entry are active
+    gc_scheduler.busy_check = is_latency_critical
+
+    # Defer flash writes while alarms or indicator sounds are playing
+    flash_scheduler.busy_check = is_audio_active
+
     # Create task list
     tasks = [
         asyncio.create_task(config.start_watching()),
@@ -1566,26 +1571,34 @@ async def main():
         asyncio.create_task(detect_motion()),
         asyncio.create_task(detect_tilt()),
         asyncio.create_task(detect_sound()),
-        asyncio.create_task(detect_keypad_keys())
+        asyncio.create_task(detect_keypad_keys()),
+        asyncio.create_task(monitor.run()),
+        asyncio.create_task(gc_scheduler.run()),
+        asyncio.create_task(log_manager.run())
     ]
 
     if utils.isPicoW():
+        # Expose the security system state and arming to the JSON API
+        web_server.system_status = get_system_status
+        web_server.arm_handler = set_armed
+
         tasks.append(asyncio.create_task(network_manager.run()))
         tasks.append(asyncio.create_task(configure_network_settings()))
         tasks.append(asyncio.create_task(updater.run_periodically()))
+        tasks.append(asyncio.create_task(metrics.run()))
 
     # Run all tasks concurrently
     await asyncio.gather(*tasks)
 
 # Startup and run
 try:
-    print(f"Welcome to Goat - SecureMe version {VERSION}.")
+    log.info("Welcome to Goat - SecureMe version {}.", VERSION)
 
-    print("Initializing firmware...")
+    log.info("Initializing firmware...")
 
     # Configure required pins
     try:
-        print("Configuring hardware...")
+        log.info("Configuring hardware...")
 
         led = Pin(LED_PIN, Pin.OUT)
         buzzer = PWM(Pin(BUZZER_PIN))
@@ -1603,15 +1616,16 @@ try:
         # Initialize keypad column pins as inputs
         keypad_cols = [Pin(pin, Pin.IN, Pin.PULL_DOWN) for pin in keypad_col_pins]
     except Exception as e:
-        print(f"Unable to configure system hardware: {e}")
+        log.error("Unable to configure system hardware: {}", e)
         reset()
 
     asyncio.run(check_config())
 
-    print("Loading firmware configuration...")
+    log.info("Loading firmware configuration...")
 
-    config = ConfigManager(config_directory, config_file)
-    asyncio.run(config.read_async())
+    config = ConfigManager.shared(config_directory, config_file)
+    asyncio.run(config.load_async())
+    config.subscribe(handle_config_changes)
 
     asyncio.run(system_startup())
 
@@ -1625,15 +1639,15 @@ try:
         if utils.isRP2040():
             utils.defragment_memory()
     except Exception as e:
-        print(f"Unable to defragment memory: {e}")
+        log.error("Unable to defragment memory: {}", e)
 
     asyncio.run(main())
 except KeyboardInterrupt:
-    print("Keyboard interupt detected.")
+    log.info("Keyboard interupt detected.")
 except Exception as e:
-    print(f"Unable to start: {e}")
+    log.error("Unable to start: {}", e)
 finally:
     buzzer.duty_u16(0)
     led.value(0)
     asyncio.run(system_shutdown())
-    print("Firmware shutdown complete.")
+    log.info("Firmware shutdown complete.")
@@ -0,0 +1,194 @@
+# Goat - Session Manager library
+# Version 1.0.0
+# © (c) 2025 Goat Technologies
+# https://github.com/CodeGoat-dev/SecureMe
+# Description:
+# Provides login sessions for the Goat - SecureMe web interface.
+# Sessions are HMAC-SHA256 signed tokens which are verified in constant time without server-side storage.
+# Failed logins are rate limited per client with a temporary lockout.
+
+# Imports
+import hashlib
+import ubinascii
+import uos
+import utime
+
+# Constants
+BLOCK_SIZE = 64  # SHA-256 block size in bytes
+
+def compare_digest(a, b):
+    """Compares two byte strings in constant time for their length.
+
+    Args:
+    - a: The first byte string.
+    - b: The second byte string.
+    """
+    if len(a) != len(b):
+        return False
+
+    result = 0
+    for index in range(len(a)):
+        result |= a[index] ^ b[index]
+    return result == 0
+
+def pad_key(key):
+    """Returns the inner and outer HMAC-SHA256 keys for a secret key."""
+    if len(key) > BLOCK_SIZE:
+        key = hashlib.sha256(key).digest()
+    key = key + bytes(BLOCK_SIZE - len(key))
+    return bytes(byte ^ 0x36 for byte in key), bytes(byte ^ 0x5C for byte in key)
+
+def hmac_sha256(keys, message):
+    """Computes an HMAC-SHA256 digest.
+
+    Args:
+    - keys: The inner and outer keys returned by pad_key.
+    - message: The message as bytes.
+    """
+    inner = hashlib.sha256(keys[0])
+    inner.update(message)
+    outer = hashlib.sha256(keys[1])
+    outer.update(inner.digest())
+    return outer.digest()
+
+# SessionManager class
+class SessionManager:
+    """Provides signed login sessions and login rate limiting."""
+    def __init__(self, lifetime=3600, max_failures=5, lockout_time=60, max_clients=16):
+        """Constructs the class and exposes properties.
+
+        Args:
+        - lifetime: The time in seconds a session remains valid.
+        - max_failures: The number of failed logins from a client before it is locked out.
+        - lockout_time: The time in seconds a client is locked out for.
+        - max_clients: The maximum number of clients tracked for failed logins.
+        """
+        self.lifetime = lifetime
+        self.max_failures = max_failures
+        self.lockout_time = lockout_time
+        self.max_clients = max_clients
+
+        self._keys = None
+        self._clients = {}
+
+        # Session tracking
+        self.logins = 0
+        self.failed_logins = 0
+        self.lockouts = 0
+        self.rejected_sessions = 0
+        self.untracked_failures = 0
+
+        self.rotate()
+
+    def rotate(self):
+        """Replaces the signing key, ending all existing sessions."""
+        self._keys = pad_key(uos.urandom(32))
+
+    def sign(self, payload):
+        """Returns the hexadecimal signature for a payload."""
+        return ubinascii.hexlify(hmac_sha256(self._keys, payload))
+
+    def create(self):
+        """Creates a session token.
+
+        Tokens are formatted as expiry.nonce.signature.
+        """
+        payload = f"{utime.time() + self.lifetime}.{ubinascii.hexlify(uos.urandom(8)).decode()}".encode()
+        self.logins += 1
+        return (payload + b"." + self.sign(payload)).decode()
+
+    def verify(self, token):
+        """Checks a session token is authentic and unexpired.
+
+        Args:
+        - token: The session token, or None.
+        """
+        if not token:
+            return False
+
+        separator = token.rfind(".")
+        if separator < 0:
+            self.rejected_sessions += 1
+            return False
+
+        payload = token[:separator].encode()
+        if not compare_digest(token[separator + 1:].encode(), self.sign(payload)):
+            self.rejected_sessions += 1
+            return False
+
+        try:
+            expiry = int(token[:token.find(".")])
+        except ValueError:
+            return False
+
+        return expiry > utime.time()
+
+    def check_password(self, password, expected):
+        """Compares a password in constant time.
+
+        Both passwords are signed first so the comparison does not depend on their length.
+        """
+        return compare_digest(hmac_sha256(self._keys, password.encode()), hmac_sha256(self._keys, expected.encode()))
+
+    def lockout_remaining(self, client):
+        """Returns the time in seconds a client remains locked out, or 0."""
+        entry = self._clients.get(client)
+        if entry is None or not entry[1]:
+            return 0
+
+        remaining = entry[1] - utime.time()
+        if remaining <= 0:
+            del self._clients[client]
+            return 0
+        return remaining
+
+    def record_failure(self, client):
+        """Records a failed login from a client.
+
+        Returns True if the client is now locked out.
+        When the client table is full and every tracked client is locked out, the failure is not tracked.
+        """
+        self.failed_logins += 1
+
+        entry = self._clients.get(client)
+        if entry is None:
+            if len(self._clients) >= self.max_clients and not self._evict():
+                self.untracked_failures += 1
+                return False
+            entry = [0, 0]
+            self._clients[client] = entry
+
+        entry[0] += 1
+        if entry[0] >= self.max_failures:
+            entry[0] = 0
+            entry[1] = utime.time() + self.lockout_time
+            self.lockouts += 1
+            return True
+        return False
+
+    def _evict(self):
+        """Removes the oldest client which is not locked out.
+
+        Returns False if every tracked client is locked out.
+        """
+        now = utime.time()
+        for client, entry in self._clients.items():
+            if entry[1] <= now:
+                del self._clients[client]
+                return True
+        return False
+
+    def record_success(self, client):
+        """Clears the failed logins recorded for a client."""
+        self._clients.pop(client, None)
+
+    def get_stats(self):
+        """Returns the session statistics as a dictionary."""
+        return {
+            "logins": self.logins,
+            "failed_logins": self.failed_logins,
+            "lockouts": self.lockouts,
+            "rejected_sessions": self.rejected_sessions,
+            "untracked_failures": self.untracked_failures,
+            "locked_clients": sum(1 for entry in self._clients.values() if entry[1])
+        }
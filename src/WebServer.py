@@ -6,6 +6,8 @@
 # Provides the web server for the Goat - SecureMe firmware.
 
 # Imports
+import gc
+import json
 import machine
 import network
 import time
@@ -13,20 +15,52 @@ import uasyncio as asyncio
 import uos
 import urequests
 import utime
-import ubinascii
 from ConfigManager import ConfigManager
+from config_schema import SCHEMA
+from EventBus import bus as event_bus
+from FlashScheduler import scheduler as flash_scheduler
+from GCScheduler import scheduler as gc_scheduler
+import HTTPServer
+from Logger import LEVEL_NAMES, get_logger, manager as log_manager
+from MemoryMonitor import monitor
+from Metrics import metrics
 import pushover
+from SessionManager import SessionManager
 import utils
 
+# Logging
+log = get_logger("WebServer")
+
+def cached_page(function):
+    """Decorator which serves a page from the render cache while the configuration is unchanged.
+
+    The decorated function returns a tuple of (title, body) and must only depend on the configuration.
+    """
+    def serve(self):
+        return self.serve_cached(function)
+    return serve
+
 # WebServer class
 class WebServer:
     """Provides the web server for the Goat - SecureMe firmware."""
-    
-    def __init__(self, ip_address="0.0.0.0", http_port=8000):
-        """Constructs the class and exposes properties."""
+    # Route table, handlers are registered by the decorators below
+    ROUTES = HTTPServer.Router()
+
+    def __init__(self, ip_address="0.0.0.0", http_port=8000, max_connections=4, keep_alive_timeout=5):
+        """Constructs the class and exposes properties.
+
+        Args:
+        - ip_address: The address to listen on.
+        - http_port: The port to listen on.
+        - max_connections: The maximum number of concurrent connections, reduced when free memory is low.
+        - keep_alive_timeout: The time in seconds an idle connection is kept open for further requests.
+        """
         # Constants
         self.VERSION = "1.5.6"
         self.REPO_URL = "https://github.com/CodeGoat-dev/SecureMe"
+        self.SESSION_COOKIE = "secureme_session"
+        self.LOGIN_ALERT_WINDOW = 300  # Failed logins are reported at most once in this time in seconds
+        self.API_HIDDEN_ENTRIES = (("server", "admin_password"), ("server", "metrics_token"), ("security", "security_code"))
 
         self.default_ip_address = "0.0.0.0"
         self.default_http_port = 8000
@@ -86,141 +120,60 @@ class WebServer:
 
         self.alert_text = None
 
+        self.settings = None
+
+        # Rendered pages, keyed by page and configuration version
+        self.page_cache = HTTPServer.PageCache()
+
+        # Persistent connections, admitted up to a limit sized to free memory
+        self.connections = HTTPServer.ConnectionPool(max_connections=max_connections, idle_timeout=keep_alive_timeout)
+
+        # Security system callbacks for the JSON API
+        self.system_status = None  # Returns a dictionary of the security system state
+        self.arm_handler = None  # Coroutine function arming (True) or disarming (False) the system
+
+        # Uptime, accumulated from ticks so it survives tick wrap-around
+        self.uptime_ms = utime.ticks_ms()
+        self._uptime_ticks = self.uptime_ms
+
+        # Login sessions
+        self.sessions = SessionManager()
+        self.unreported_login_failures = 0
+        self._login_alert_task = None
+
+        # Compressed static assets
+        self.static_files = HTTPServer.StaticFiles("/www")
+
     async def initialize(self):
         """Initializes the server by loading configuration data."""
-        self.config = ConfigManager(self.config_directory, self.config_file)
-        await self.config.read_async()
+        self.config = ConfigManager.shared(self.config_directory, self.config_file)
+        await self.config.load_async()
 
-        self.hostname = self.config.get_entry("network", "hostname")
-        if not isinstance(self.hostname, str):
-            self.hostname = self.default_hostname
-            self.config.set_entry("network", "hostname", self.hostname)
-            await self.config.write_async()
-        self.ip_address = self.config.get_entry("network", "ip_address")
-        if not isinstance(self.ip_address, str):
-            self.ip_address = self.default_ip_address
-            self.config.set_entry("network", "ip_address", self.ip_address)
-            await self.config.write_async()
-        self.subnet_mask = self.config.get_entry("network", "subnet_mask")
-        if not isinstance(self.subnet_mask, str):
-            self.subnet_mask = self.default_subnet_mask
-            self.config.set_entry("network", "subnet_mask", self.subnet_mask)
-            await self.config.write_async()
-        self.gateway = self.config.get_entry("network", "gateway")
-        if not isinstance(self.gateway, str):
-            self.gateway = self.default_gateway
-            self.config.set_entry("network", "gateway", self.gateway)
-            await self.config.write_async()
-        self.dns = self.config.get_entry("network", "dns")
-        if not isinstance(self.dns, str):
-            self.dns = self.default_dns
-            self.config.set_entry("network", "dns", self.dns)
-            await self.config.write_async()
-        self.detect_motion = self.config.get_entry("security", "detect_motion")
-        if not isinstance(self.detect_motion, bool):
-            self.detect_motion = True
-            self.config.set_entry("security", "detect_motion", self.detect_motion)
-            await self.config.write_async()
-        self.detect_tilt = self.config.get_entry("security", "detect_tilt")
-        if not isinstance(self.detect_tilt, bool):
-            self.detect_tilt = True
-            self.config.set_entry("security", "detect_tilt", self.detect_tilt)
-            await self.config.write_async()
-        self.detect_sound = self.config.get_entry("security", "detect_sound")
-        if not isinstance(self.detect_sound, bool):
-            self.detect_sound = True
-            self.config.set_entry("security", "detect_sound", self.detect_sound)
-            await self.config.write_async()
-        self.sensor_cooldown = self.config.get_entry("security", "sensor_cooldown")
-        if not isinstance(self.sensor_cooldown, int):
-            self.sensor_cooldown = self.default_sensor_cooldown
-            self.config.set_entry("security", "sensor_cooldown", self.sensor_cooldown)
-            await self.config.write_async()
-        self.arming_cooldown = self.config.get_entry("security", "arming_cooldown")
-        if not isinstance(self.arming_cooldown, int):
-            self.arming_cooldown = self.default_arming_cooldown
-            self.config.set_entry("security", "arming_cooldown", self.arming_cooldown)
-            await self.config.write_async()
-        self.pir_warmup_time = self.config.get_entry("security", "pir_warmup_time")
-        if not isinstance(self.pir_warmup_time, int):
-            self.pir_warmup_time = self.default_pir_warmup_time
-            self.config.set_entry("security", "pir_warmup_time", self.pir_warmup_time)
-            await self.config.write_async()
-        self.pushover_app_token = self.config.get_entry("pushover", "app_token")
-        self.pushover_api_key = self.config.get_entry("pushover", "api_key")
-        self.system_status_notifications = self.config.get_entry("pushover", "system_status_notifications")
-        if not isinstance(self.system_status_notifications, bool):
-            self.system_status_notifications = True
-            self.config.set_entry("pushover", "system_status_notifications", self.system_status_notifications)
-            await self.config.write_async()
-        self.general_notifications = self.config.get_entry("pushover", "general_notifications")
-        if not isinstance(self.general_notifications, bool):
-            self.general_notifications = True
-            self.config.set_entry("pushover", "general_notifications", self.general_notifications)
-            await self.config.write_async()
-        self.security_code_notifications = self.config.get_entry("pushover", "security_code_notifications")
-        if not isinstance(self.security_code_notifications, bool):
-            self.security_code_notifications = True
-            self.config.set_entry("pushover", "security_code_notifications", self.security_code_notifications)
-            await self.config.write_async()
-        self.web_interface_notifications = self.config.get_entry("pushover", "web_interface_notifications")
-        if not isinstance(self.web_interface_notifications, bool):
-            self.web_interface_notifications = True
-            self.config.set_entry("pushover", "web_interface_notifications", self.web_interface_notifications)
-            await self.config.write_async()
-        self.update_notifications = self.config.get_entry("pushover", "update_notifications")
-        if not isinstance(self.update_notifications, bool):
-            self.update_notifications = True
-            self.config.set_entry("pushover", "update_notifications", self.update_notifications)
-            await self.config.write_async()
-        self.security_code = self.config.get_entry("security", "security_code")
-        if not isinstance(self.security_code, str):
-            self.security_code = self.default_security_code
-            self.config.set_entry("security", "security_code", self.security_code)
-            await self.config.write_async()
-        self.web_server_address = self.config.get_entry("server", "address")
-        if not isinstance(self.web_server_address, str):
-            self.web_server_address = self.default_web_server_address
-            self.config.set_entry("server", "address", self.web_server_address)
-            await self.config.write_async()
-        self.web_server_http_port = self.config.get_entry("server", "http_port")
-        if not isinstance(self.web_server_http_port, int):
-            self.web_server_http_port = self.default_web_server_http_port
-            self.config.set_entry("server", "http_port", self.web_server_http_port)
-            await self.config.write_async()
-        self.admin_password = self.config.get_entry("server", "admin_password")
-        if not isinstance(self.admin_password, str):
-            self.admin_password = self.default_admin_password
-            self.config.set_entry("server", "admin_password", self.admin_password)
-            await self.config.write_async()
-        self.enable_auto_update = self.config.get_entry("update", "enable_auto_update")
-        if not isinstance(self.enable_auto_update, bool):
-            self.enable_auto_update = True
-            self.config.set_entry("update", "enable_auto_update", self.enable_auto_update)
-            await self.config.write_async()
-        self.update_check_interval = self.config.get_entry("update", "update_check_interval")
-        if not isinstance(self.update_check_interval, int):
-            self.update_check_interval = self.default_update_check_interval
-            self.config.set_entry("update", "update_check_interval", self.update_check_interval)
-            await self.config.write_async()
-        self.enable_time_sync = self.config.get_entry("time", "enable_time_sync")
-        if not isinstance(self.enable_time_sync, bool):
-            self.enable_time_sync = True
-            self.config.set_entry("time", "enable_time_sync", self.enable_time_sync)
-            await self.config.write_async()
-        self.time_sync_server = self.config.get_entry("time", "time_sync_server")
-        if not isinstance(self.time_sync_server, str):
-            self.time_sync_server = self.default_time_sync_server
-            self.config.set_entry("time", "time_sync_server", self.time_sync_server)
-            await self.config.write_async()
-        self.time_sync_interval = self.config.get_entry("time", "time_sync_interval")
-        if not isinstance(self.time_sync_interval, int):
-            self.time_sync_interval = self.default_time_sync_interval
-            self.config.set_entry("time", "time_sync_interval", self.time_sync_interval)
-            await self.config.write_async()
+        # Validate and fill the configuration with at most one write
+        self.settings = await self.config.validate_async(SCHEMA)
+
+        for entry in SCHEMA:
+            setattr(self, entry[0], self.settings.get(entry[0]))
+
+        self.config.subscribe(self.handle_config_changes)
+
+        if self.static_files.load():
+            self.static_files.register(self.ROUTES)
 
         self.config_watcher = asyncio.create_task(self.config.start_watching())
 
+    def handle_config_changes(self, changes):
+        """Updates the cached settings when the configuration changes.
+
+        Args:
+        - changes: A dictionary of changed sections mapping keys to their new values.
+        """
+        for section, entries in changes.items():
+            for key, value in entries.items():
+                name = self.settings.names.get((section, key))
+                if name and value is not None:
+                    setattr(self, name, value)
+
     async def send_pushover_notification(self, title="Goat - SecureMe", message="Testing", priority=0, timeout=5):
         """Send push notifications using Pushover.
 
@@ -235,19 +188,19 @@ class WebServer:
         self.pushover_app_token = self.config.get_entry("pushover", "app_token")
 
         if not self.pushover_app_token:
-            print("A Pushover app token is required to send push notifications.")
+            log.warning("A Pushover app token is required to send push notifications.")
             return
 
         self.pushover_api_key = self.config.get_entry("pushover", "api_key")
 
         if not self.pushover_api_key:
-            print("A Pushover API key is required to send push notifications.")
+            log.warning("A Pushover API key is required to send push notifications.")
             return
 
         try:
             asyncio.create_task(pushover.send_notification(app_token=self.pushover_app_token, api_key=self.pushover_api_key, title=title, message=message, priority=priority, timeout=timeout))
         except Exception as e:
-            print(f"Error sending notification: {e}")
+            log.error("Error sending notification: {}", e)
 
     async def send_system_status_notification(self, message_title, status_message):
         """Sends a system status notification via Pushover.
@@ -259,11 +212,11 @@ class WebServer:
         await asyncio.sleep(0)
 
         if not message_title:
-            print("A message title is required.")
+            log.warning("A message title is required.")
             return
 
         if not status_message:
-            print("A status message is required.")
+            log.warning("A status message is required.")
             return
 
         try:
@@ -272,33 +225,59 @@ class WebServer:
             if self.system_status_notifications:
                 asyncio.create_task(self.send_pushover_notification(title=message_title, message=status_message))
         except Exception as e:
-            print(f"Unable to send system status notification: {e}")
+            log.error("Unable to send system status notification: {}", e)
 
     def html_template(self, title, body):
-        """Generates an HTML page template."""
-        now = time.localtime()
+        """Generates an HTML page template.
 
-        current_date = f"{now[1]:02d}/{now[2]:02d}/{now[0]}"
-        current_time = f"{now[3]:02d}:{now[4]:02d}"
+        Args:
+        - title: The page title.
+        - body: The page body as a string or a generator of fragments.
 
-        template = f"""<html>
-        <head><title>{title}</title></head>
+        Returns a generator of page fragments so the page can be streamed without being assembled in memory.
+        """
+        return self.render_page(self.page_header(title), body)
+
+    def page_header(self, title):
+        """Generates the page header for a title."""
+        return f"""<html>
+        <head><title>{title}</title>
+        <link rel="stylesheet" href="/static/style.css">
+        <link rel="icon" href="/static/favicon.svg">
+        <script src="/static/app.js" defer></script></head>
         <body>
         <h1>{title}</h1>
         <p>Welcome to Goat - SecureMe.</p>
         <p><a href="/">Home</a></p>
         """
 
+    def render_page(self, header, body):
+        """Generates a page from its header and body, inserting the alert banner and footer.
+
+        Args:
+        - header: The rendered page header.
+        - body: The page body as a string, bytes or a generator of fragments.
+        """
+        yield header
+
         if self.alert_text:
-            template += f"""
+            yield f"""
             <h2>Alert</h2>
             <p><b>{self.escape_html(self.alert_text)}</b></p>
             """
             self.alert_text = None
 
-        template += body
+        if isinstance(body, (str, bytes, memoryview)):
+            yield body
+        else:
+            yield from body
 
-        template += f"""<h1>Information</h1>
+        now = time.localtime()
+
+        current_date = f"{now[1]:02d}/{now[2]:02d}/{now[0]}"
+        current_time = f"{now[3]:02d}:{now[4]:02d}"
+
+        yield f"""<h1>Information</h1>
         <p>Date: {current_date}<br>
         time: {current_time}</p>
         <p>Check out other Goat Technologies offerings at <a href="https://goatbot.org/">Goatbot.org</a></p>
@@ -308,249 +287,519 @@ class WebServer:
         </body>
         </html>"""
 
-        return template
+    def serve_cached(self, function):
+        """Serves a page from the render cache, rendering it again when the configuration has changed.
+
+        Args:
+        - function: The page function, returning a tuple of (title, body).
+
+        The alert banner and footer are not cached and are inserted when the page is served.
+        """
+        version = self.config.version
+        entry = self.page_cache.get(function, version)
+
+        if entry is None:
+            start = utime.ticks_us()
+            title, body = function(self)
+            header = self.page_header(title).encode()
+            data = header + body.encode()
+            split = len(header)
+            self.page_cache.put(function, version, data, split, utime.ticks_diff(utime.ticks_us(), start))
+        else:
+            data, split = entry
+
+        data = memoryview(data)
+        return self.render_page(data[:split], data[split:])
+
+    def uptime(self):
+        """Returns the system uptime in milliseconds."""
+        now = utime.ticks_ms()
+        self.uptime_ms += utime.ticks_diff(now, self._uptime_ticks)
+        self._uptime_ticks = now
+        return self.uptime_ms
 
     def authenticate(self, request):
-        """Performs basic HTTP authentication."""
-        try:
-            if "Authorization: Basic" not in request:
-                return False
-            # Extract and decode credentials
-            auth_header = request.split("Authorization: Basic ")[1].split("\r\n")[0]
-            credentials = ubinascii.a2b_base64(auth_header).decode()
-            username, password = credentials.split(":")
+        """Checks the request carries a valid session cookie, or the metrics scrape token for /metrics."""
+        if request.path == "/metrics" and self.authenticate_scrape(request):
+            return True
 
-            # Perform plain-text password comparison
-            if username == "admin" and password == self.admin_password:
-                return True
+        cookies = request.header("cookie")
+        if not cookies:
+            return False
 
-            print("Incorrect credentials.")
+        name = self.SESSION_COOKIE + "="
+        for cookie in cookies.split(";"):
+            cookie = cookie.strip()
+            if cookie.startswith(name):
+                return self.sessions.verify(cookie[len(name):])
 
-            if self.system_status_notifications:
-                if self.web_interface_notifications:
-                    asyncio.create_task(self.send_system_status_notification(message_title="Web Interface", status_message="Web interface authorisation error."))
+        return False
 
-            return False
-        except Exception as e:
-            print(f"Authentication error: {e}")
+    def authenticate_scrape(self, request):
+        """Checks the request carries the metrics scrape token as a bearer token.
+
+        Scraping with a token is disabled until a token is set in the configuration.
+        """
+        token = self.settings.get("metrics_token") if self.settings else None
+        authorization = request.header("authorization", "")
+        if not token or not authorization.startswith("Bearer "):
             return False
 
-    async def handle_request(self, reader, writer):
-        """Handles incoming HTTP requests for the web server."""
+        return self.sessions.check_password(authorization[7:], token)
+
+    def is_public(self, path):
+        """Checks if a path is served without a session."""
+        return path == "/login" or path.startswith(self.static_files.prefix)
+
+    def report_login_failure(self):
+        """Reports a failed login, coalescing failures into at most one notification per window."""
+        self.unreported_login_failures += 1
+
+        if self._login_alert_task is None:
+            self._login_alert_task = asyncio.create_task(self.send_login_failure_notification())
+
+    async def send_login_failure_notification(self):
+        """Sends a single notification for the failed logins in the current window."""
         try:
-            request = await reader.read(1024)
-            request = request.decode()
-            print("Request:", request)
-
-            # Handle authentication
-            if not self.authenticate(request):
-                response = "HTTP/1.1 401 Unauthorized\r\nWWW-Authenticate: Basic realm=\"SecureMe\"\r\n\r\n" + self.serve_unauthorized()
-                writer.write(response.encode())
-                await writer.drain()
-                return
-
-            # Serve the appropriate pages based on the request
-            if "GET /network_settings" in request:
-                response = "HTTP/1.1 200 OK\r\nContent-Type: text/html\r\n\r\n" + self.serve_network_settings_form()
-            elif "GET /web_interface_settings" in request:
-                response = "HTTP/1.1 200 OK\r\nContent-Type: text/html\r\n\r\n" + self.serve_web_interface_settings_form()
-            elif "GET /detection_settings" in request:
-                response = "HTTP/1.1 200 OK\r\nContent-Type: text/html\r\n\r\n" + self.serve_detection_settings_form()
-            elif "GET /change_password" in request:
-                response = "HTTP/1.1 200 OK\r\nContent-Type: text/html\r\n\r\n" + self.serve_change_password_form()
-            elif "GET /pushover_settings" in request:
-                response = "HTTP/1.1 200 OK\r\nContent-Type: text/html\r\n\r\n" + self.serve_pushover_settings_form()
-            elif "GET /change_security_code" in request:
-                response = "HTTP/1.1 200 OK\r\nContent-Type: text/html\r\n\r\n" + self.serve_change_security_code_form()
-            elif "GET /auto_update_settings" in request:
-                response = "HTTP/1.1 200 OK\r\nContent-Type: text/html\r\n\r\n" + self.serve_auto_update_settings_form()
-            elif "GET /time_sync_settings" in request:
-                response = "HTTP/1.1 200 OK\r\nContent-Type: text/html\r\n\r\n" + self.serve_time_sync_settings_form()
-            elif "GET /reset_firmware" in request:
-                response = "HTTP/1.1 200 OK\r\nContent-Type: text/html\r\n\r\n" + self.serve_reset_firmware_form()
-            elif "GET /reboot_device" in request:
-                response = "HTTP/1.1 200 OK\r\nContent-Type: text/html\r\n\r\n" + self.serve_reboot_device_form()
-            elif "GET /" in request:
-                response = "HTTP/1.1 200 OK\r\nContent-Type: text/html\r\n\r\n" + self.serve_index()
-            elif "POST /update_network_settings" in request:
-                content = request.split("\r\n\r\n")[1]
-                post_data = self.parse_form_data(content)  # Parse the form data manually
-                hostname = post_data.get('hostname', self.hostname)
-                dhcp = post_data.get('dhcp', True)
-                ip_address = f"{post_data.get('ip1', '0')}.{post_data.get('ip2', '0')}.{post_data.get('ip3', '0')}.{post_data.get('ip4', '0')}"
-                subnet_mask = f"{post_data.get('subnet1', '0')}.{post_data.get('subnet2', '0')}.{post_data.get('subnet3', '0')}.{post_data.get('subnet4', '0')}"
-                gateway = f"{post_data.get('gateway1', '0')}.{post_data.get('gateway2', '0')}.{post_data.get('gateway3', '0')}.{post_data.get('gateway4', '0')}"
-                dns = f"{post_data.get('dns1', '0')}.{post_data.get('dns2', '0')}.{post_data.get('dns3', '0')}.{post_data.get('dns4', '0')}"
-                if dhcp:
-                    ip_address = "0.0.0.0"
-                    subnet_mask = "0.0.0.0"
-                    gateway = "0.0.0.0"
-                    dns = "0.0.0.0"
-                self.hostname = hostname
-                self.ip_address = ip_address
-                self.subnet_mask = subnet_mask
-                self.gateway = gateway
-                self.dns = dns
-                self.config.set_entry("network", "hostname", self.hostname)
-                self.config.set_entry("network", "ip_address", self.ip_address)
-                self.config.set_entry("network", "subnet_mask", self.subnet_mask)
-                self.config.set_entry("network", "gateway", self.gateway)
-                self.config.set_entry("network", "dns", self.dns)
-                await self.config.write_async()
-                self.alert_text = "Network settings updated."
-                response = "HTTP/1.1 303 See Other\r\nLocation: /network_settings\r\n\r\n"
-            elif "POST /update_web_interface_settings" in request:
-                content = request.split("\r\n\r\n")[1]
-                post_data = self.parse_form_data(content)  # Parse the form data manually
-                address = 'address' in post_data
-                http_port = 'http_port' in post_data
-                self.web_server_address = address
-                self.web_server_http_port = http_port
-                self.config.set_entry("server", "address", self.web_server_address)
-                self.config.set_entry("server", "http_port", self.web_server_http_port)
-                await self.config.write_async()
-                self.alert_text = "Web interface settings updated."
-                if self.system_status_notifications:
-                    if self.web_interface_notifications:
-                        asyncio.create_task(self.send_system_status_notification(message_title="Configuration", status_message="Web interface settings updated."))
-                response = "HTTP/1.1 303 See Other\r\nLocation: /\r\n\r\n"
-            elif "POST /update_detection_settings" in request:
-                content = request.split("\r\n\r\n")[1]
-                post_data = self.parse_form_data(content)  # Parse the form data manually
-                detect_motion = 'detect_motion' in post_data
-                detect_tilt = 'detect_tilt' in post_data
-                detect_sound = 'detect_sound' in post_data
-                sensor_cooldown = 'sensor_cooldown' in post_data
-                arming_cooldown = 'arming_cooldown' in post_data
-                pir_warmup_time = 'pir_warmup_time' in post_data
-                self.detect_motion = detect_motion
-                self.detect_tilt = detect_tilt
-                self.detect_sound = detect_sound
-                self.sensor_cooldown = sensor_cooldown
-                self.arming_cooldown = arming_cooldown
-                self.pir_warmup_time = pir_warmup_time
-                self.config.set_entry("security", "detect_motion", self.detect_motion)
-                self.config.set_entry("security", "detect_tilt", self.detect_tilt)
-                self.config.set_entry("security", "detect_sound", self.detect_sound)
-                self.config.set_entry("security", "sensor_cooldown", self.sensor_cooldown)
-                self.config.set_entry("security", "arming_cooldown", self.arming_cooldown)
-                self.config.set_entry("security", "pir_warmup_time", self.pir_warmup_time)
-                await self.config.write_async()
-                self.alert_text = "Detection settings updated."
-                if self.system_status_notifications:
-                    if self.web_interface_notifications:
-                        asyncio.create_task(self.send_system_status_notification(message_title="Configuration", status_message="Detection settings updated."))
-                response = "HTTP/1.1 303 See Other\r\nLocation: /\r\n\r\n"
-            elif "POST /update_pushover_settings" in request:
-                content = request.split("\r\n\r\n")[1]
-                post_data = self.parse_form_data(content)  # Parse the form data manually
-                self.pushover_app_token = post_data.get('pushover_token', None)
-                self.pushover_api_key = post_data.get('pushover_key', None)
-                self.system_status_notifications = post_data.get('status_notifications', True)
-                self.general_notifications = post_data.get('general_notifications', True)
-                self.security_code_notifications = post_data.get('security_code_notifications', True)
-                self.web_interface_notifications = post_data.get('web_interface_notifications', True)
-                self.update_notifications = post_data.get('update_notifications', True)
-                self.config.set_entry("pushover", "app_token", self.pushover_app_token)
-                self.config.set_entry("pushover", "api_key", self.pushover_api_key)
-                self.config.set_entry("pushover", "system_status_notifications", self.system_status_notifications)
-                self.config.set_entry("pushover", "general_notifications", self.general_notifications)
-                self.config.set_entry("pushover", "security_code_notifications", self.security_code_notifications)
-                self.config.set_entry("pushover", "web_interface_notifications", self.web_interface_notifications)
-                self.config.set_entry("pushover", "update_notifications", self.update_notifications)
-                await self.config.write_async()
-                self.alert_text = "Pushover settings updated."
-                if self.system_status_notifications:
-                    if self.web_interface_notifications:
-                        asyncio.create_task(self.send_system_status_notification(message_title="Configuration", status_message="Pushover settings updated."))
-                response = "HTTP/1.1 303 See Other\r\nLocation: /\r\n\r\n"
-            elif "POST /update_security_code" in request:
-                content = request.split("\r\n\r\n")[1]
-                post_data = self.parse_form_data(content)  # Parse the form data manually
-                self.security_code = post_data.get('security_code', None)
-                self.config.set_entry("security", "security_code", self.security_code)
-                await self.config.write_async()
-                self.alert_text = "System security code updated."
-                if self.system_status_notifications:
-                    if self.web_interface_notifications:
-                        asyncio.create_task(self.send_system_status_notification(message_title="Configuration", status_message="System security code updated."))
-                response = "HTTP/1.1 303 See Other\r\nLocation: /\r\n\r\n"
-            elif "POST /update_password" in request:
-                content = request.split("\r\n\r\n")[1]
-                post_data = self.parse_form_data(content)  # Parse the form data manually
-                self.admin_password = post_data.get('password', None)
-                self.config.set_entry("server", "admin_password", self.admin_password)
-                await self.config.write_async()
-                self.alert_text = "Web administration password updated."
-                if self.system_status_notifications:
-                    if self.web_interface_notifications:
-                        asyncio.create_task(self.send_system_status_notification(message_title="Configuration", status_message="Web administration password updated."))
-                response = "HTTP/1.1 303 See Other\r\nLocation: /\r\n\r\n"
-            elif "POST /update_auto_update_settings" in request:
-                content = request.split("\r\n\r\n")[1]
-                post_data = self.parse_form_data(content)  # Parse the form data manually
-                self.enable_auto_update = post_data.get('enable_auto_update', True)
-                self.update_check_interval = post_data.get('update_check_interval', self.default_update_check_interval)
-                self.config.set_entry("update", "enable_auto_update", self.enable_auto_update)
-                self.config.set_entry("update", "update_check_interval", self.update_check_interval)
-                await self.config.write_async()
-                self.alert_text = "Automatic update settings updated."
-                if self.system_status_notifications:
-                    if self.web_interface_notifications:
-                        asyncio.create_task(self.send_system_status_notification(message_title="Configuration", status_message="Automatic update settings updated."))
-                response = "HTTP/1.1 303 See Other\r\nLocation: /\r\n\r\n"
-            elif "POST /update_time_sync_settings" in request:
-                content = request.split("\r\n\r\n")[1]
-                post_data = self.parse_form_data(content)  # Parse the form data manually
-                self.enable_time_sync = post_data.get('enable_time_sync', True)
-                self.time_sync_server = post_data.get('time_sync_server', self.default_time_sync_server)
-                self.time_sync_interval = post_data.get('time_sync_server', self.default_time_sync_interval)
-                self.config.set_entry("time", "enable_time_sync", self.enable_time_sync)
-                self.config.set_entry("time", "time_sync_server", self.time_sync_server)
-                self.config.set_entry("time", "time_sync_interval", self.time_sync_interval)
-                await self.config.write_async()
-                self.alert_text = "Time synchronisation settings updated."
-                if self.system_status_notifications:
-                    if self.web_interface_notifications:
-                        asyncio.create_task(self.send_system_status_notification(message_title="Configuration", status_message="Time synchronisation settings updated."))
-                response = "HTTP/1.1 303 See Other\r\nLocation: /\r\n\r\n"
-            elif "POST /reboot_device" in request:
-                content = request.split("\r\n\r\n")[1]
-                response = "HTTP/1.1 303 See Other\r\nLocation: /\r\n\r\n"
-                if self.system_status_notifications:
-                    if self.web_interface_notifications:
-                        asyncio.create_task(self.send_system_status_notification(message_title="System Reboot", status_message="System rebooting."))
-                        await asyncio.sleep(10)
-                machine.reset()
-            elif "POST /reset_firmware" in request:
-                content = request.split("\r\n\r\n")[1]
-                post_data = self.parse_form_data(content)  # Parse the form data manually
-                reset_confirmation = post_data.get('reset_confirmation', None)
-                if reset_confirmation != "secureme":
-                    self.alert_text = "Reset confirmation mismatch."
-                    if self.config_file in uos.listdir(self.config_directory):
-                        uos.remove(f"{self.config_directory}/{self.config_file}")
-                    if self.network_config_file in uos.listdir(self.config_directory):
-                        uos.remove(f"{self.config_directory}/{self.network_config_file}")
-                    uos.rmdir(self.config_directory)
-                response = "HTTP/1.1 303 See Other\r\nLocation: /\r\n\r\n"
-                if self.system_status_notifications:
-                    if self.web_interface_notifications:
-                        asyncio.create_task(self.send_system_status_notification(message_title="Configuration Reset", status_message="Configuration reset to factory defaults."))
-                        await asyncio.sleep(10)
-                    machine.reset()
-            else:
-                response = "HTTP/1.1 404 Not Found\r\n\r\n" + self.serve_error()
+            await asyncio.sleep(self.LOGIN_ALERT_WINDOW)
+        finally:
+            count = self.unreported_login_failures
+            self.unreported_login_failures = 0
+            self._login_alert_task = None
 
-            # Send the response
-            writer.write(response.encode())
-            await writer.drain()
+        if self.system_status_notifications:
+            if self.web_interface_notifications:
+                asyncio.create_task(self.send_system_status_notification(message_title="Web Interface", status_message=f"{count} failed web interface login attempts in the last {self.LOGIN_ALERT_WINDOW // 60} minutes."))
+
+    async def handle_request(self, reader, writer):
+        """Handles an HTTP connection for the web server, serving requests until it is closed or idle."""
+        if not await self.connections.acquire():
+            try:
+                await HTTPServer.Response("The server is busy.", status=503, content_type="text/plain", headers="Retry-After: 1\r\n").send(writer)
+            except Exception as e:
+                log.error("Error rejecting connection: {}", e)
+            finally:
+                writer.close()
+                await writer.wait_closed()
+            return
+
+        try:
+            client = writer.get_extra_info("peername")[0]
+            reader = HTTPServer.RequestReader(reader)
+            keep_alive = True
+            reused = False
+            while keep_alive:
+                try:
+                    request = await asyncio.wait_for(HTTPServer.read_request(reader), self.connections.idle_timeout)
+                except asyncio.TimeoutError:
+                    self.connections.idle_timeouts += 1
+                    break
+                except HTTPServer.RequestError as e:
+                    log.warning("Invalid request: {}", e)
+                    await HTTPServer.send_error(writer, e)
+                    break
+
+                if request is None:
+                    break
+
+                request.client = client
+                self.connections.record_request(reused)
+                reused = True
+
+                keep_alive = await self.serve_request(request, writer)
         except Exception as e:
-            print(f"Error handling request: {e}")
+            log.error("Error handling request: {}", e)
         finally:
+            self.connections.release()
             writer.close()
             await writer.wait_closed()
 
+    async def serve_request(self, request, writer):
+        """Serves a single request.
+
+        Args:
+        - request: The parsed Request.
+        - writer: The stream to write the response to.
+
+        Returns True if the connection can be reused for another request.
+        """
+        log.debug("Request: {}", request)
+
+        start = utime.ticks_ms()
+
+        # Stream pages with chunked transfer encoding where the client supports it
+        chunked = request.version == "HTTP/1.1"
+
+        # Keep the connection open unless the client closes it or other connections are waiting
+        keep_alive = chunked and request.header("connection", "").lower() != "close" and not self.connections.queued
+
+        with monitor.track("web_request"):
+            # Reject unknown paths before authentication
+            handler, status = self.ROUTES.match(request.method, request.path)
+            if handler is None:
+                if status == 405:
+                    response = HTTPServer.method_not_allowed(self.ROUTES, request.path)
+                else:
+                    response = HTTPServer.Response(self.serve_error(), status=404)
+            elif not self.is_public(request.path) and not self.authenticate(request):
+                # Send browsers to the login page, other requests are refused
+                if request.path.startswith("/api/"):
+                    response = HTTPServer.json_response({"error": "Unauthorized"}, status=401)
+                elif request.path == "/metrics":
+                    response = HTTPServer.Response("Unauthorized", status=401, content_type="text/plain", headers="WWW-Authenticate: Bearer\r\n")
+                elif request.method == "GET":
+                    response = HTTPServer.redirect("/login")
+                else:
+                    response = HTTPServer.Response(self.serve_unauthorized(), status=401)
+            else:
+                response = await handler(self, request)
+
+            # Event streams run until the client disconnects and are tracked separately
+            streaming = isinstance(response, HTTPServer.EventStream)
+            if not streaming:
+                keep_alive = await response.send(writer, chunked, keep_alive)
+
+        if streaming:
+            with monitor.track("event_stream"):
+                keep_alive = await response.send(writer, chunked, keep_alive)
+
+        metrics.record_request(self.ROUTES.pattern(request.path) or "unmatched", response.status, utime.ticks_diff(utime.ticks_ms(), start))
+
+        return keep_alive
+
+    @ROUTES.route("POST", "/login")
+    async def login(self, request):
+        """Starts a session when valid credentials are submitted."""
+        remaining = self.sessions.lockout_remaining(request.client)
+        if remaining:
+            return HTTPServer.Response("Too many failed login attempts. Try again later.", status=429, content_type="text/plain", headers=f"Retry-After: {remaining}\r\n")
+
+        post_data = self.parse_form_data(request.text())
+        username = post_data.get('username', '')
+        password = post_data.get('password', '')
+
+        # Check both credentials so the response time does not reveal which was incorrect
+        valid_username = self.sessions.check_password(username, "admin")
+        valid_password = self.sessions.check_password(password, self.admin_password)
+
+        if valid_username and valid_password:
+            self.sessions.record_success(request.client)
+            token = self.sessions.create()
+            return HTTPServer.Response(None, status=303, headers=f"Location: /\r\nSet-Cookie: {self.SESSION_COOKIE}={token}; Path=/; Max-Age={self.sessions.lifetime}; HttpOnly; SameSite=Strict\r\n")
+
+        log.warning("Incorrect credentials.")
+        if self.sessions.record_failure(request.client):
+            log.warning("Login locked out for {}.", request.client)
+        self.report_login_failure()
+
+        self.alert_text = "Incorrect username or password."
+        return HTTPServer.redirect("/login")
+
+    @ROUTES.route("POST", "/logout")
+    async def logout(self, request):
+        """Ends the current session."""
+        return HTTPServer.Response(None, status=303, headers=f"Location: /login\r\nSet-Cookie: {self.SESSION_COOKIE}=; Path=/; Max-Age=0; HttpOnly; SameSite=Strict\r\n")
+
+    @ROUTES.route("GET", "/api/status")
+    async def api_status(self, request):
+        """Returns the system status as JSON."""
+        status = {
+            "version": self.VERSION,
+            "uptime": self.uptime() // 1000,
+            "mem_free": gc.mem_free(),
+            "detect_motion": self.detect_motion,
+            "detect_tilt": self.detect_tilt,
+            "detect_sound": self.detect_sound
+        }
+
+        if self.system_status:
+            status.update(self.system_status())
+
+        return HTTPServer.json_response(status)
+
+    @ROUTES.route("GET", "/api/config/*")
+    async def api_get_config(self, request):
+        """Returns a configuration section as JSON."""
+        section = request.path[len("/api/config/"):]
+        if section not in self.config.sections:
+            return HTTPServer.json_response({"error": "Unknown section"}, status=404)
+
+        entries = {}
+        for key, value in self.config.get_section(section).items():
+            if (section, key) not in self.API_HIDDEN_ENTRIES:
+                entries[key] = value
+
+        return HTTPServer.json_response(entries)
+
+    @ROUTES.route("PATCH", "/api/config/*")
+    async def api_patch_config(self, request):
+        """Updates several entries in a configuration section from a JSON object with a single write."""
+        section = request.path[len("/api/config/"):]
+
+        try:
+            changes = json.loads(request.text())
+        except ValueError:
+            changes = None
+
+        if not isinstance(changes, dict) or not changes:
+            return HTTPServer.json_response({"error": "Expected a JSON object"}, status=400)
+
+        # Check every entry before applying any of them
+        accepted = []
+        invalid = []
+        for key, value in changes.items():
+            name = self.settings.names.get((section, key))
+            if name is None or (section, key) in self.API_HIDDEN_ENTRIES:
+                invalid.append(key)
+                continue
+
+            value = self.settings.check(name, value)
+            if value is None:
+                invalid.append(key)
+            else:
+                accepted.append((name, value))
+
+        if invalid:
+            return HTTPServer.json_response({"error": "Invalid entries", "keys": invalid}, status=400)
+
+        for name, value in accepted:
+            self.settings.set(name, value)
+        await self.config.write_async()
+
+        return HTTPServer.json_response({"updated": list(changes)})
+
+    @ROUTES.route("POST", "/api/arm")
+    async def api_arm(self, request):
+        """Arms the system."""
+        return self.request_arming(True)
+
+    @ROUTES.route("POST", "/api/disarm")
+    async def api_disarm(self, request):
+        """Disarms the system."""
+        return self.request_arming(False)
+
+    def request_arming(self, armed):
+        """Starts arming or disarming the system and returns the JSON response."""
+        if self.arm_handler is None:
+            return HTTPServer.json_response({"error": "Unavailable"}, status=503)
+
+        # Arming waits for the arming cooldown, so respond without waiting
+        asyncio.create_task(self.arm_handler(armed))
+
+        return HTTPServer.json_response({"armed": armed}, status=202)
+
+    @ROUTES.route("GET", "/metrics")
+    async def serve_metrics(self, request):
+        """Streams the firmware metrics in the Prometheus text format."""
+        return HTTPServer.Response(metrics.fragments(self.metric_gauges()), content_type="text/plain; version=0.0.4")
+
+    def metric_gauges(self):
+        """Generates the gauges sampled for each metrics scrape as (name, help, value) tuples."""
+        yield "secureme_uptime_seconds", "Time since the web server started.", self.uptime() // 1000
+        yield "secureme_heap_free_bytes", "Free heap.", gc.mem_free()
+        yield "secureme_heap_largest_block_bytes", "Largest allocatable heap block at the last memory sample.", monitor.largest_block
+
+        sta_if = network.WLAN(network.STA_IF)
+        rssi = None
+        if sta_if.isconnected():
+            try:
+                rssi = sta_if.status("rssi")
+            except Exception:
+                pass
+        yield "secureme_wifi_rssi_dbm", "Wi-Fi signal strength.", rssi
+
+    @ROUTES.route("GET", "/events")
+    async def events(self, request):
+        """Streams live device events as Server-Sent Events."""
+        subscription = event_bus.subscribe()
+        if subscription is None:
+            return HTTPServer.Response("Too many event streams.", status=503, content_type="text/plain", headers="Retry-After: 5\r\n")
+
+        return HTTPServer.EventStream(subscription)
+
+    @ROUTES.route("POST", "/update_network_settings")
+    async def update_network_settings(self, request):
+        """Updates the network settings."""
+        content = request.text()
+        post_data = self.parse_form_data(content)  # Parse the form data manually
+        ip_address = f"{post_data.get('ip1', '0')}.{post_data.get('ip2', '0')}.{post_data.get('ip3', '0')}.{post_data.get('ip4', '0')}"
+        subnet_mask = f"{post_data.get('subnet1', '0')}.{post_data.get('subnet2', '0')}.{post_data.get('subnet3', '0')}.{post_data.get('subnet4', '0')}"
+        gateway = f"{post_data.get('gateway1', '0')}.{post_data.get('gateway2', '0')}.{post_data.get('gateway3', '0')}.{post_data.get('gateway4', '0')}"
+        dns = f"{post_data.get('dns1', '0')}.{post_data.get('dns2', '0')}.{post_data.get('dns3', '0')}.{post_data.get('dns4', '0')}"
+        if 'dhcp' in post_data:
+            ip_address = "0.0.0.0"
+            subnet_mask = "0.0.0.0"
+            gateway = "0.0.0.0"
+            dns = "0.0.0.0"
+        await self.update_settings("Network settings", (
+            ("hostname", post_data.get('hostname', self.hostname)),
+            ("ip_address", ip_address),
+            ("subnet_mask", subnet_mask),
+            ("gateway", gateway),
+            ("dns", dns),
+        ), notify=False)
+        response = HTTPServer.redirect("/network_settings")
+        return response
+
+    @ROUTES.route("POST", "/update_web_interface_settings")
+    async def update_web_interface_settings(self, request):
+        """Updates the web interface settings."""
+        content = request.text()
+        post_data = self.parse_form_data(content)  # Parse the form data manually
+        await self.update_settings("Web interface settings", (
+            ("web_server_address", post_data.get('address', '')),
+            ("web_server_http_port", post_data.get('http_port', '')),
+        ))
+        response = HTTPServer.redirect("/")
+        return response
+
+    @ROUTES.route("POST", "/update_detection_settings")
+    async def update_detection_settings(self, request):
+        """Updates the detection settings."""
+        content = request.text()
+        post_data = self.parse_form_data(content)  # Parse the form data manually
+        await self.update_settings("Detection settings", (
+            ("detect_motion", 'detect_motion' in post_data),
+            ("detect_tilt", 'detect_tilt' in post_data),
+            ("detect_sound", 'detect_sound' in post_data),
+            ("sensor_cooldown", post_data.get('sensor_cooldown', '')),
+            ("arming_cooldown", post_data.get('arming_cooldown', '')),
+            ("pir_warmup_time", post_data.get('pir_warmup_time', '')),
+        ))
+        response = HTTPServer.redirect("/")
+        return response
+
+    @ROUTES.route("POST", "/update_pushover_settings")
+    async def update_pushover_settings(self, request):
+        """Updates the Pushover settings."""
+        content = request.text()
+        post_data = self.parse_form_data(content)  # Parse the form data manually
+        await self.update_settings("Pushover settings", (
+            ("pushover_app_token", post_data.get('pushover_token', '')),
+            ("pushover_api_key", post_data.get('pushover_key', '')),
+            ("system_status_notifications", 'status_notifications' in post_data),
+            ("general_notifications", 'general_notifications' in post_data),
+            ("security_code_notifications", 'security_code_notifications' in post_data),
+            ("web_interface_notifications", 'web_interface_notifications' in post_data),
+            ("update_notifications", 'update_notifications' in post_data),
+        ))
+        response = HTTPServer.redirect("/")
+        return response
+
+    @ROUTES.route("POST", "/update_security_code")
+    async def update_security_code(self, request):
+        """Updates the system security code."""
+        content = request.text()
+        post_data = self.parse_form_data(content)  # Parse the form data manually
+        if self.settings.set("security_code", post_data.get('security_code', '')):
+            await self.config.write_async()
+            self.alert_text = "System security code updated."
+            if self.system_status_notifications:
+                if self.web_interface_notifications:
+                    asyncio.create_task(self.send_system_status_notification(message_title="Configuration", status_message="System security code updated."))
+        else:
+            self.alert_text = f"The security code must be between {self.security_code_min_length} and {self.security_code_max_length} digits."
+        response = HTTPServer.redirect("/")
+        return response
+
+    @ROUTES.route("POST", "/update_password")
+    async def update_password(self, request):
+        """Updates the web administration password."""
+        content = request.text()
+        post_data = self.parse_form_data(content)  # Parse the form data manually
+        if self.settings.set("admin_password", post_data.get('password', '')):
+            await self.config.write_async()
+
+            # End all sessions started with the previous password
+            self.sessions.rotate()
+            self.alert_text = "Web administration password updated. Please log in again."
+            if self.system_status_notifications:
+                if self.web_interface_notifications:
+                    asyncio.create_task(self.send_system_status_notification(message_title="Configuration", status_message="Web administration password updated."))
+            return HTTPServer.redirect("/login")
+        else:
+            self.alert_text = "The web administration password is invalid."
+        response = HTTPServer.redirect("/")
+        return response
+
+    @ROUTES.route("POST", "/update_auto_update_settings")
+    async def update_auto_update_settings(self, request):
+        """Updates the automatic update settings."""
+        content = request.text()
+        post_data = self.parse_form_data(content)  # Parse the form data manually
+        await self.update_settings("Automatic update settings", (
+            ("enable_auto_update", 'enable_auto_update' in post_data),
+            ("update_check_interval", post_data.get('update_check_interval', '')),
+        ))
+        response = HTTPServer.redirect("/")
+        return response
+
+    @ROUTES.route("POST", "/update_time_sync_settings")
+    async def update_time_sync_settings(self, request):
+        """Updates the time synchronisation settings."""
+        content = request.text()
+        post_data = self.parse_form_data(content)  # Parse the form data manually
+        await self.update_settings("Time synchronisation settings", (
+            ("enable_time_sync", 'enable_time_sync' in post_data),
+            ("time_sync_server", post_data.get('time_sync_server', '')),
+            ("time_sync_interval", post_data.get('time_sync_interval', '')),
+        ))
+        response = HTTPServer.redirect("/")
+        return response
+
+    @ROUTES.route("POST", "/update_log_settings")
+    async def update_log_settings(self, request):
+        """Updates the logging settings."""
+        content = request.text()
+        post_data = self.parse_form_data(content)  # Parse the form data manually
+        await self.update_settings("Logging settings", (
+            ("log_level", post_data.get('log_level', '')),
+            ("flash_logging", 'flash_logging' in post_data),
+            ("console_logging", 'console_logging' in post_data),
+        ), notify=False)
+        response = HTTPServer.redirect("/logs")
+        return response
+
+    @ROUTES.route("POST", "/reboot_device")
+    async def reboot_device(self, request):
+        """Reboots the device."""
+        response = HTTPServer.redirect("/")
+        if self.system_status_notifications:
+            if self.web_interface_notifications:
+                asyncio.create_task(self.send_system_status_notification(message_title="System Reboot", status_message="System rebooting."))
+                await asyncio.sleep(10)
+        await self.config.flush_async(critical=True)
+        machine.reset()
+        return response
+
+    @ROUTES.route("POST", "/reset_firmware")
+    async def reset_firmware(self, request):
+        """Resets the configuration to factory defaults."""
+        content = request.text()
+        post_data = self.parse_form_data(content)  # Parse the form data manually
+        reset_confirmation = post_data.get('reset_confirmation', None)
+        if reset_confirmation != "secureme":
+            self.alert_text = "Reset confirmation mismatch."
+            return HTTPServer.redirect("/reset_firmware")
+
+        response = HTTPServer.redirect("/")
+        if self.system_status_notifications:
+            if self.web_interface_notifications:
+                asyncio.create_task(self.send_system_status_notification(message_title="Configuration Reset", status_message="Configuration reset to factory defaults."))
+                await asyncio.sleep(10)
+
+        # Remove the configuration and network configuration files with their snapshots and journals,
+        # without yielding so no write can recreate them
+        for filename in (self.config_file, self.network_config_file):
+            path = f"{self.config_directory}/{filename}"
+            for suffix in ("", ".bin", ".journal"):
+                try:
+                    uos.remove(f"{path}{suffix}")
+                except OSError:
+                    pass  # Not present
+        machine.reset()
+        return response
+
     def escape_html(self, text):
         """Manually escape HTML characters."""
         return (
@@ -561,36 +810,75 @@ class WebServer:
                 .replace("'", "&#39;")
         )
 
-    def parse_form_data(self, content):
-        """Parses URL-encoded form data into a dictionary and decodes percent-encoded characters."""
-        post_data = {}
-        pairs = content.split("&")  # Split the form data by '&'
+    async def update_settings(self, title, values, notify=True):
+        """Sets the values submitted from a settings form and reports any that were rejected.
 
-        for pair in pairs:
-            if "=" in pair:
-                key, value = pair.split("=", 1)  # Split each pair by '='
-                post_data[utils.urldecode(key)] = utils.urldecode(value)  # Decode the key and value
+        Args:
+        - title: The name of the settings group shown in alerts and notifications.
+        - values: A sequence of (setting name, form value) pairs.
+        - notify: Whether to send a configuration notification when a value is accepted.
+        """
+        rejected = [name for name, value in values if not self.settings.set(name, value)]
+        invalid = ", ".join(name.replace("_", " ") for name in rejected)
 
-        return post_data
+        if len(rejected) == len(values):
+            self.alert_text = f"{title} not updated. Invalid values: {invalid}."
+            return
+
+        await self.config.write_async()
+
+        if rejected:
+            self.alert_text = f"{title} updated except for invalid values: {invalid}."
+        else:
+            self.alert_text = f"{title} updated."
 
+        if notify and self.system_status_notifications:
+            if self.web_interface_notifications:
+                asyncio.create_task(self.send_system_status_notification(message_title="Configuration", status_message=f"{title} updated."))
+
+    def parse_form_data(self, content):
+        """Parses URL-encoded form data into a dictionary and decodes percent-encoded characters."""
+        return utils.parse_form(content)
+
+    @cached_page
     def serve_unauthorized(self):
         """Serves the web server unauthorized page."""
-        body = """<p>Unable to access the SecureMe web interface using the credentials you provided.<br>
-        Please check your access credentials and try again.</p>
+        body = """<p>You are not logged in to the SecureMe web interface or your session has expired.<br>
+        Please log in and try again.</p>
         <h2>System Recovery</h2>
         <p>If you are unable to access the web interface due to lost credentials, perform a configuration reset using the SecureMe console.</p>
-        <h2>Return To Home</h2>
-        <p>Click <a href="/">Here</a> to return to the home page.</p>
+        <h2>Log In</h2>
+        <p>Click <a href="/login">Here</a> to log in.</p>
         """
-        return self.html_template("Unauthorized", body)
+        return "Unauthorized", body
 
+    @cached_page
     def serve_error(self):
         """Serves the web server error page."""
         body = """<p>The page you requested does not exist.<br>
         <a href="/">Home</a></p>
         """
-        return self.html_template("Unauthorized", body)
+        return "Page Not Found", body
+
+    @ROUTES.page("GET", "/login")
+    @cached_page
+    def serve_login_form(self):
+        """Serves the web interface login form."""
+        form = """<h2>Log In</h2>
+        <p>Log in to manage the SecureMe system settings.</p>
+        <form method="POST" action="/login">
+            <label for="username">Username:</label>
+            <input type="text" id="username" name="username" autocomplete="username" required><br>
+            <label for="password">Password:</label>
+            <input type="password" id="password" name="password" autocomplete="current-password" required><br>
+            <input type="submit" value="Log In">
+        </form><br>
+        """
 
+        return "Log In", form
+
+    @ROUTES.page("GET", "/")
+    @cached_page
     def serve_index(self):
         """Serves the web interface index page."""
         body = """<p>Welcome to the Goat - SecureMe - Portable Security System.<br>
@@ -606,15 +894,22 @@ class WebServer:
         <li><a href="/change_security_code">Change System Security Code</a></li>
         <li><a href="/auto_update_settings">Automatic Update Settings</a></li>
         <li><a href="/time_sync_settings">Time Synchronisation Settings</a></li>
+        <li><a href="/memory">Memory Telemetry</a></li>
+        <li><a href="/logs">System Log</a></li>
         <li><a href="/reboot_device">Reboot Device</a></li>
         <li><a href="/reset_firmware">Reset Firmware</a></li>
         </ul></p>
         <h2>About SecureMe</h2>
         <p>SecureMe is a portable, configurable security system designed for simplicity and effectiveness.</p>
+        <form method="POST" action="/logout">
+            <input type="submit" value="Log Out">
+        </form>
         """
 
-        return self.html_template("Welcome", body)
+        return "Welcome", body
 
+    @ROUTES.page("GET", "/network_settings")
+    @cached_page
     def serve_network_settings_form(self):
         """Serves the network settings configuration form."""
         dhcp_enabled = "checked" if self.ip_address == "0.0.0.0" else ""
@@ -658,21 +953,12 @@ class WebServer:
             <input type="number" name="dns4" min="0" max="255" value="{self.dns.split('.')[3]}" required><br>
             <input type="submit" value="Save Settings">
         </form><br>
-        <script>
-            function toggleIPFields() {{
-                var dhcpChecked = document.getElementById('dhcp').checked;
-                var ipFields = document.querySelectorAll('input[type="number"]');
-                ipFields.forEach(field => {{
-                    field.disabled = dhcpChecked;
-                }});
-            }}
-            // Run on page load to set correct state
-            window.onload = toggleIPFields;
-        </script>
         """
 
-        return self.html_template("Network Settings", form)
+        return "Network Settings", form
 
+    @ROUTES.page("GET", "/web_interface_settings")
+    @cached_page
     def serve_web_interface_settings_form(self):
         """Serves the web interface settings form with the current settings pre-populated."""
         form = f"""<h2>Web Interface Settings</h2>
@@ -695,8 +981,10 @@ class WebServer:
         </form><br>
         """
 
-        return self.html_template("Web Interface Settings", form)
+        return "Web Interface Settings", form
 
+    @ROUTES.page("GET", "/detection_settings")
+    @cached_page
     def serve_detection_settings_form(self):
         """Serves the detection settings form with the current settings pre-populated."""
         detect_motion_checked = 'checked' if self.detect_motion else ''
@@ -735,8 +1023,10 @@ class WebServer:
         </form><br>
         """
 
-        return self.html_template("Detection Settings", form)
+        return "Detection Settings", form
 
+    @ROUTES.page("GET", "/change_password")
+    @cached_page
     def serve_change_password_form(self):
         """Serves the change password form.""" 
         form = f"""<h2>Change Administrator Password</h2>
@@ -750,8 +1040,10 @@ class WebServer:
         </form><br>
         """
 
-        return self.html_template("Change Admin Password", form)
+        return "Change Admin Password", form
 
+    @ROUTES.page("GET", "/pushover_settings")
+    @cached_page
     def serve_pushover_settings_form(self):
         """Serves the Pushover Settings form with the current credentials and settings pre-populated."""
         status_notifications_checked = 'checked' if self.system_status_notifications else ''
@@ -791,8 +1083,10 @@ class WebServer:
         </form><br>
         """
 
-        return self.html_template("Pushover Settings", form)
+        return "Pushover Settings", form
 
+    @ROUTES.page("GET", "/change_security_code")
+    @cached_page
     def serve_change_security_code_form(self):
         """Serves the change security code form.""" 
         form = f"""<h2>Change Security Code</h2>
@@ -807,8 +1101,10 @@ class WebServer:
         </form><br>
         """
 
-        return self.html_template("Change System Security Code", form)
+        return "Change System Security Code", form
 
+    @ROUTES.page("GET", "/auto_update_settings")
+    @cached_page
     def serve_auto_update_settings_form(self):
         """Serves the automatic update settings form with the current settings pre-populated."""
         enable_auto_update_checked = 'checked' if self.enable_auto_update else ''
@@ -831,8 +1127,10 @@ class WebServer:
         </form><br>
         """
 
-        return self.html_template("Automatic Update Settings", form)
+        return "Automatic Update Settings", form
 
+    @ROUTES.page("GET", "/time_sync_settings")
+    @cached_page
     def serve_time_sync_settings_form(self):
         """Serves the time synchronisation settings form with the current settings pre-populated."""
         enable_time_sync_checked = 'checked' if self.enable_time_sync else ''
@@ -861,8 +1159,157 @@ class WebServer:
         </form><br>
         """
 
-        return self.html_template("Time Synchronisation Settings", form)
+        return "Time Synchronisation Settings", form
+
+    @ROUTES.page("GET", "/memory")
+    def serve_memory_telemetry(self):
+        """Serves the memory telemetry page."""
+        return self.html_template("Memory Telemetry", self.render_memory_telemetry())
+
+    def render_memory_telemetry(self):
+        """Generates the memory telemetry page body as fragments."""
+        monitor.sample()
+        monitor.largest_free_block()
+        stats = monitor.get_stats()
+
+        yield f"""<h2>Memory Telemetry</h2>
+        <p>The statistics below describe how the SecureMe firmware is using memory.<br>
+        A high fragmentation percentage means large allocations may fail even when free memory is available.</p>
+        <h3>Heap</h3>
+        <p>Free Memory: {stats['mem_free']} bytes (minimum {stats['min_mem_free']} bytes)<br>
+        Allocated Memory: {stats['mem_alloc']} bytes (maximum {stats['max_mem_alloc']} bytes)<br>
+        Largest Free Block: {stats['largest_block']} bytes (minimum {stats['min_largest_block']} bytes)<br>
+        Fragmentation: {stats['fragmentation']}%</p>
+        <h3>Operations</h3>
+        <p>Heap use sampled at the start and end of heavy operations. Peaks inside an operation, such as during a network request, may be higher.</p>
+        <ul>
+        """
+
+        for name, operation in stats["operations"].items():
+            yield f"""<li>{name}: {operation['count']} runs, peak allocated {operation['peak_alloc']} bytes, minimum free {operation['min_free']} bytes</li>
+            """
+
+        yield """</ul>
+        """
+
+        gc_stats = gc_scheduler.get_stats()
+
+        yield f"""<h3>Garbage Collection</h3>
+        <p>Garbage collection is scheduled while the system is idle and held off during alarms and security code entry.</p>
+        <p>Collections: {gc_stats['collections']} (idle {gc_stats['idle_collections']}, forced {gc_stats['forced_collections']})<br>
+        Deferrals: {gc_stats['deferrals']}<br>
+        Threshold: {gc_stats['threshold']} bytes<br>
+        Maximum Pause: {gc_stats['max_pause']}ms</p>
+        <h3>Pause Durations</h3>
+        <ul>
+        """
+
+        for bucket, count in gc_stats["pause_histogram"].items():
+            yield f"""<li>{bucket}: {count}</li>
+            """
+
+        yield """</ul>
+        """
+
+        flash_stats = flash_scheduler.get_stats()
+
+        yield f"""<h3>Flash Writes</h3>
+        <p>Flash writes are deferred while alarms and indicator sounds are playing.</p>
+        <p>Immediate: {flash_stats['immediate_writes']}<br>
+        Deferred: {flash_stats['deferred_writes']}<br>
+        Forced: {flash_stats['forced_writes']}<br>
+        Critical: {flash_stats['critical_writes']}<br>
+        Maximum Wait: {flash_stats['max_wait']}ms</p>
+        """
+
+        connection_stats = self.connections.get_stats()
+
+        yield f"""<h3>Connections</h3>
+        <p>Connections are kept open between requests and admitted up to a limit sized to free memory.</p>
+        <p>Active: {connection_stats['active']} (limit {connection_stats['limit']}, peak {connection_stats['peak_active']})<br>
+        Connections: {connection_stats['connections']}<br>
+        Requests: {connection_stats['requests']} (reused connection {connection_stats['reuse_rate']}%)<br>
+        Queued: {connection_stats['queued_connections']}<br>
+        Rejected: {connection_stats['rejected_connections']}<br>
+        Idle Timeouts: {connection_stats['idle_timeouts']}<br>
+        Minimum Free Memory: {connection_stats['min_mem_free']} bytes</p>
+        """
+
+        cache_stats = self.page_cache.get_stats()
+
+        yield f"""<h3>Page Cache</h3>
+        <p>Rendered pages are cached until the configuration changes.</p>
+        <p>Cached Pages: {cache_stats['pages']} ({cache_stats['size']} of {cache_stats['budget']} bytes)<br>
+        Hits: {cache_stats['hits']} ({cache_stats['hit_rate']}%)<br>
+        Misses: {cache_stats['misses']}<br>
+        Evictions: {cache_stats['evictions']}<br>
+        Render Time Saved: {cache_stats['saved_ms']}ms</p>
+        """
+
+        event_stats = event_bus.get_stats()
+
+        yield f"""<h3>Events</h3>
+        <p>Live device events are streamed to subscribers on /events, dropping the oldest events for slow subscribers.</p>
+        <p>Subscribers: {event_stats['subscribers']}<br>
+        Published: {event_stats['published_events']}<br>
+        Dropped: {event_stats['dropped_events']}<br>
+        Rejected Subscribers: {event_stats['rejected_subscribers']}</p>
+        """
+
+    @ROUTES.page("GET", "/logs")
+    def serve_logs(self):
+        """Serves the system log page."""
+        return self.html_template("System Log", self.render_logs())
+
+    def render_logs(self):
+        """Generates the system log page body as fragments."""
+        stats = log_manager.get_stats()
+        flash_logging_checked = 'checked' if log_manager.flash_enabled else ''
+        console_logging_checked = 'checked' if log_manager.console else ''
+
+        yield f"""<h2>System Log</h2>
+        <p>The most recent messages recorded by the SecureMe firmware are shown below, newest first.<br>
+        Passwords, security codes and Pushover keys are removed from messages before they are recorded.</p>
+        <form method="POST" action="/update_log_settings">
+            <h3>Log Level</h3>
+            <p>Messages below the selected level are not recorded.</p>
+            <label for="log_level">Log Level:</label>
+            <select id="log_level" name="log_level">
+        """
+
+        for level, name in LEVEL_NAMES.items():
+            selected = 'selected' if level == log_manager.level else ''
+            yield f"""<option value="{level}" {selected}>{name.title()}</option>
+            """
+
+        yield f"""</select><br>
+            <h3>Log File</h3>
+            <p>Warnings and errors can be written to a log file on the device, which is rotated when it reaches {log_manager.max_file_size // 1024}KB.</p>
+            <label for="flash_logging">Write Log File</label>
+            <input type="checkbox" id="flash_logging" name="flash_logging" {flash_logging_checked}><br>
+            <h3>Console Output</h3>
+            <p>Messages can also be printed to the USB serial console while developing. Printing slows the system, so leave this disabled in normal use.</p>
+            <label for="console_logging">Print to Console</label>
+            <input type="checkbox" id="console_logging" name="console_logging" {console_logging_checked}><br>
+            <input type="submit" value="Save Settings">
+        </form><br>
+        <h3>Statistics</h3>
+        <p>Records: {stats['records']}<br>
+        Sampled Out: {stats['sampled_records']}<br>
+        Log File Writes: {stats['flash_writes']} (rotated {stats['rotations']} times, dropped {stats['dropped_records']} records)</p>
+        <h3>Messages</h3>
+        <ul>
+        """
+
+        for record in reversed(log_manager.recent()):
+            yield f"""<li>{self.escape_html(log_manager.format_record(record))}</li>
+            """
+
+        yield """</ul>
+        """
 
+    @ROUTES.page("GET", "/reboot_device")
+    @cached_page
     def serve_reboot_device_form(self):
         """Serves the reboot device form.""" 
         form = f"""<h2>Reboot Device</h2>
@@ -874,8 +1321,10 @@ class WebServer:
         </form><br>
         """
 
-        return self.html_template("Reboot Device", form)
+        return "Reboot Device", form
 
+    @ROUTES.page("GET", "/reset_firmware")
+    @cached_page
     def serve_reset_firmware_form(self):
         """Serves the reset firmware form.""" 
         form = f"""<h2>Reset SecureMe Firmware</h2>
@@ -890,7 +1339,7 @@ class WebServer:
         </form><br>
         """
 
-        return self.html_template("Reset SecureMe Firmware", form)
+        return "Reset SecureMe Firmware", form
 
     async def start_server(self):
         """Starts the SecureMe HTTP server asynchronously."""
@@ -901,33 +1350,34 @@ class WebServer:
             self.http_port = self.default_http_port
 
         try:
-            print("Starting SecureMe Web Interface...")
+            log.info("Starting SecureMe Web Interface...")
 
             self.server = await asyncio.start_server(self.handle_request, self.ip_address, self.http_port)
 
-            print(f"Serving on {self.ip_address}:{self.http_port}")
+            log.info("Serving on {}:{}", self.ip_address, self.http_port)
 
             while True:
                 machine.idle()
+                self.uptime()
 
                 await asyncio.sleep(1)  # Keep the server running
         except Exception as e:
             await self.stop_server()
-            print(f"Error starting server: {e}")
+            log.error("Error starting server: {}", e)
 
     async def stop_server(self):
         """Stops the SecureMe HTTP server."""
         try:
-            print("Stopping SecureMe Web Interface...")
+            log.info("Stopping SecureMe Web Interface...")
 
             if self.server:
                 self.server.close()
                 await self.server.wait_closed()
-                print("Server stopped.")
+                log.info("Server stopped.")
             else:
-                print("Server already stopped.")
+                log.info("Server already stopped.")
         except Exception as e:
-            print(f"Error stopping server: {e}")
+            log.error("Error stopping server: {}", e)
         finally:
             self.config_watcher.cancel()
 
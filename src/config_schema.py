@@ -0,0 +1,62 @@
+# Goat - SecureMe configuration schema
+# © (c) 2025 Goat Technologies
+# https://github.com/CodeGoat-dev/SecureMe
+# Description:
+# Describes every entry in the SecureMe firmware configuration file.
+# Shared by all firmware components which read or validate the configuration.
+
+# Schema entries are (name, section, key, type, default, minimum, maximum).
+# Minimum and maximum are value limits for integers and length limits for strings.
+# Entries with a default of None are optional.
+SCHEMA = (
+    # Security
+    ("detect_motion", "security", "detect_motion", bool, True, None, None),
+    ("detect_tilt", "security", "detect_tilt", bool, True, None, None),
+    ("detect_sound", "security", "detect_sound", bool, True, None, None),
+    ("sensor_cooldown", "security", "sensor_cooldown", int, 10, 0, 99),
+    ("arming_cooldown", "security", "arming_cooldown", int, 10, 0, 99),
+    ("pir_warmup_time", "security", "pir_warmup_time", int, 60, 0, 999),
+    ("security_code", "security", "security_code", str, "0000", 4, 8),
+
+    # Alarm
+    ("alarm_sound", "alarm", "alarm_sound", int, 0, 0, 4),
+
+    # Buzzer
+    ("buzzer_volume", "buzzer", "buzzer_volume", int, 3072, 0, 6144),
+
+    # Network
+    ("hostname", "network", "hostname", str, "SecureMe", 1, 63),
+    ("ip_address", "network", "ip_address", str, "0.0.0.0", 7, 15),
+    ("subnet_mask", "network", "subnet_mask", str, "0.0.0.0", 7, 15),
+    ("gateway", "network", "gateway", str, "0.0.0.0", 7, 15),
+    ("dns", "network", "dns", str, "0.0.0.0", 7, 15),
+
+    # Pushover
+    ("pushover_app_token", "pushover", "app_token", str, None, None, None),
+    ("pushover_api_key", "pushover", "api_key", str, None, None, None),
+    ("system_status_notifications", "pushover", "system_status_notifications", bool, True, None, None),
+    ("general_notifications", "pushover", "general_notifications", bool, True, None, None),
+    ("security_code_notifications", "pushover", "security_code_notifications", bool, True, None, None),
+    ("web_interface_notifications", "pushover", "web_interface_notifications", bool, True, None, None),
+    ("update_notifications", "pushover", "update_notifications", bool, True, None, None),
+
+    # Web server
+    ("web_server_address", "server", "address", str, "0.0.0.0", 7, 15),
+    ("web_server_http_port", "server", "http_port", int, 8000, 1, 65535),
+    ("admin_password", "server", "admin_password", str, "secureme", 1, 64),
+    ("metrics_token", "server", "metrics_token", str, None, 16, 64),
+
+    # Automatic update
+    ("enable_auto_update", "update", "enable_auto_update", bool, True, None, None),
+    ("update_check_interval", "update", "update_check_interval", int, 30, 1, 999),
+
+    # Time synchronisation
+    ("enable_time_sync", "time", "enable_time_sync", bool, True, None, None),
+    ("time_sync_server", "time", "time_sync_server", str, "https://goatbot.org", 1, 128),
+    ("time_sync_interval", "time", "time_sync_interval", int, 360, 1, 9999),
+
+    # Logging
+    ("log_level", "logging", "log_level", int, 20, 10, 40),
+    ("flash_logging", "logging", "flash_logging", bool, False, None, None),
+    ("console_logging", "logging", "console_logging", bool, False, None, None),
+)
@@ -8,8 +8,14 @@
 # Imports
 import uasyncio as asyncio
 import urequests
+from EventBus import bus as event_bus
+from Logger import get_logger
+from MemoryMonitor import monitor
 import utils
 
+# Logging
+log = get_logger("pushover")
+
 # Validate Pushover API key
 async def validate_api_key(app_token=None, api_key=None, timeout=5):
     """Validate a Pushover API key.
@@ -20,11 +26,11 @@ async def validate_api_key(app_token=None, api_key=None, timeout=5):
         - timeout: The request timeout in seconds.
         """
     if not utils.isPicoW():
-        print("Unsupported device.")
+        log.warning("Unsupported device.")
         return False
 
     if not utils.isNetworkConnected():
-        print("No internet connection available.")
+        log.warning("No internet connection available.")
         return False
 
     key_is_valid = False
@@ -46,17 +52,17 @@ async def validate_api_key(app_token=None, api_key=None, timeout=5):
 
     for attempt in range(3):  # Retry up to 3 times
         try:
-            print(f"Attempt {attempt + 1}: Validating API key...")
+            log.info("Attempt {}: Validating API key...", attempt + 1)
             response = urequests.post(url, data=data, headers=headers, timeout =timeout)
 
             if response.status_code == 200:
                 key_is_valid = True
-                print("API key is valid.")
+                log.info("API key is valid.")
                 return key_is_valid
             else:
-                print(f"Invalid API key. Status code: {response.status_code}")
+                log.warning("Invalid API key. Status code: {}", response.status_code)
         except Exception as e:
-            print(f"Error validating API key (Attempt {attempt + 1}): {e}")
+            log.error("Error validating API key (Attempt {}): {}", attempt + 1, e)
         finally:
             if 'response' in locals():
                 response.close()
@@ -80,25 +86,25 @@ async def send_notification(app_token=None, api_key=None, title="Goat - SecureMe
     await asyncio.sleep(0)
 
     if not utils.isPicoW():
-        print("Unsupported device.")
+        log.warning("Unsupported device.")
         return
 
     if not utils.isNetworkConnected():
-        print("No internet connection available.")
+        log.warning("No internet connection available.")
         return
 
     url = "https://api.pushover.net/1/messages.json"
 
     if not app_token:
-        print("A Pushover app token is required to send push notifications.")
+        log.warning("A Pushover app token is required to send push notifications.")
         return
 
     if not api_key:
-        print("A Pushover API key is required to send push notifications.")
+        log.warning("A Pushover API key is required to send push notifications.")
         return
 
     if not message:
-        print("A message must be provided to send push notifications.")
+        log.warning("A message must be provided to send push notifications.")
         return
 
     data_dict = {
@@ -113,20 +119,23 @@ async def send_notification(app_token=None, api_key=None, title="Goat - SecureMe
 
     for attempt in range(3):  # Retry up to 3 times
         try:
-            print(f"Attempt {attempt + 1}: Sending notification...")
-            response = urequests.post(url, data=data, headers=headers, timeout =timeout)
+            log.info("Attempt {}: Sending notification...", attempt + 1)
+            with monitor.track("pushover_post"):
+                response = urequests.post(url, data=data, headers=headers, timeout =timeout)
 
             if response.status_code == 200:
-                print("Notification sent successfully!")
-                print("Response:", response.text)
+                log.info("Notification sent successfully!")
+                log.debug("Response: {}", response.text)
+                event_bus.publish("notification", {"title": title, "sent": True})
                 return
             else:
-                print(f"Failed to send notification. Status code: {response.status_code}")
+                log.error("Failed to send notification. Status code: {}", response.status_code)
         except Exception as e:
-            print(f"Error sending notification (Attempt {attempt + 1}): {e}")
+            log.error("Error sending notification (Attempt {}): {}", attempt + 1, e)
         finally:
             if 'response' in locals():
                 response.close()
             await asyncio.sleep(0.5)  # Slight delay before retrying
 
-    print("All attempts to send notification failed.")
+    log.error("All attempts to send notification failed.")
+    event_bus.publish("notification", {"title": title, "sent": False})
@@ -3,9 +3,14 @@
 # Used throughout the SecureMe firmware to provide various utilities.
 
 # Imports
-from machine import Pin, PWM
+import gc
 import sys
+import micropython
 import uasyncio as asyncio
+from Logger import get_logger
+
+# Logging
+log = get_logger("utils")
 
 # Constants
 NUM_PINS = 30
@@ -46,9 +51,9 @@ def defragment_memory():
         _ = bytearray(16_000)  # Allocate 16KB (or as much as possible)
         del _
         gc.collect()  # Run GC again after freeing large block
-        print("Memory defragmented")
+        log.info("Memory defragmented")
     except MemoryError:
-        print("Memory allocation failed, skipping defrag")
+        log.warning("Memory allocation failed, skipping defrag")
 
 # Unused pin initialization function
 async def initialize_pins(skip_pins=None):
@@ -58,7 +63,9 @@ async def initialize_pins(skip_pins=None):
     Args:
         skip_pins: List of pin numbers to skip during initialization (default: None).
     """
-    print("Configuring unused GPIO pins...")
+    log.info("Configuring unused GPIO pins...")
+
+    from machine import Pin
 
     if skip_pins is None:
         skip_pins = []
@@ -82,7 +89,9 @@ async def deinitialize_pins(skip_pins=None):
     Args:
         skip_pins: List of pin numbers to skip during de-initialization (default: None).
     """
-    print("De-initializing GPIO pins...")
+    log.info("De-initializing GPIO pins...")
+
+    from machine import Pin
 
     if skip_pins is None:
         skip_pins = []
@@ -116,7 +125,7 @@ def pin_is_input(pin):
 # Configure network interfaces on PicoW
 async def configure_network():
     """Configures all network interfaces with a default disabled state."""
-    print("Initializing network interfaces...")
+    log.info("Initializing network interfaces...")
 
     import network
 
@@ -130,27 +139,112 @@ async def configure_network():
         sta.deinit()
         sta.active(False)
     except Exception as e:
-        print(f"Error in configure_network: {e}")
+        log.error("Error in configure_network: {}", e)
+
+# Percent encoding
+_HEX_DIGITS = b"0123456789ABCDEF"
+
+@micropython.viper
+def _unquote_into(buffer, length: int) -> int:
+    """Decodes percent escapes and plus signs in a buffer in place and returns the decoded length."""
+    data = ptr8(buffer)
+    read = 0
+    write = 0
+    while read < length:
+        byte = int(data[read])
+        read += 1
+        if byte == 43:  # '+'
+            byte = 32
+        elif byte == 37 and read + 1 < length:  # '%' followed by two characters
+            value = 0
+            index = read
+            while index < read + 2:
+                digit = int(data[index])
+                if digit >= 48 and digit <= 57:
+                    digit -= 48
+                elif (digit | 32) >= 97 and (digit | 32) <= 102:
+                    digit = (digit | 32) - 87
+                else:
+                    value = -1
+                    break
+                value = (value << 4) | digit
+                index += 1
+            if value >= 0:
+                byte = value
+                read += 2
+        data[write] = byte
+        write += 1
+    return write
+
+@micropython.viper
+def _quote_into(source, length: int, target) -> int:
+    """Percent-encodes a buffer into a target of three times its length and returns the encoded length."""
+    data = ptr8(source)
+    output = ptr8(target)
+    digits = ptr8(_HEX_DIGITS)
+    write = 0
+    index = 0
+    while index < length:
+        byte = int(data[index])
+        index += 1
+        if (byte >= 48 and byte <= 57) or (byte >= 65 and byte <= 90) or (byte >= 97 and byte <= 122) or byte == 45 or byte == 46 or byte == 95 or byte == 126:
+            output[write] = byte
+            write += 1
+        elif byte == 32:
+            output[write] = 43  # '+'
+            write += 1
+        else:
+            output[write] = 37  # '%'
+            output[write + 1] = digits[byte >> 4]
+            output[write + 2] = digits[byte & 15]
+            write += 3
+    return write
+
+def urldecode(value):
+    """Decodes a URL-encoded string in a single pass.
+
+    Percent escapes are decoded as UTF-8 bytes and plus signs as spaces.
+    Values which do not decode to valid UTF-8 are returned unchanged.
+
+    Args:
+    - value: The encoded string.
+    """
+    if "%" not in value and "+" not in value:
+        return value
+
+    buffer = bytearray(value.encode())
+    length = _unquote_into(buffer, len(buffer))
+    try:
+        return str(memoryview(buffer)[:length], "utf-8")
+    except UnicodeError:
+        return value
+
+def urlquote(value):
+    """Percent-encodes a string for use in a URL-encoded form.
+
+    Letters, digits and -._~ are kept, spaces become plus signs and all other bytes are escaped.
+
+    Args:
+    - value: The string to encode.
+    """
+    data = str(value).encode()
+    buffer = bytearray(len(data) * 3)
+    length = _quote_into(data, len(data), buffer)
+    return str(memoryview(buffer)[:length], "utf-8")
 
-# Minimal URL encoding function for MicroPython
 def urlencode(data):
     """Encode a dictionary into a URL-encoded string."""
-    return "&".join(f"{key}={value}" for key, value in data.items())
+    return "&".join(f"{urlquote(key)}={urlquote(value)}" for key, value in data.items())
 
-def urldecode(value):
-    """Decodes percent-encoded characters in a URL-encoded string."""
-    result = []
-    i = 0
-    while i < len(value):
-        if value[i] == "%" and i + 2 < len(value):
-            hex_value = value[i+1:i+3]
-            try:
-                result.append(chr(int(hex_value, 16)))  # Convert hex to char
-                i += 3
-            except ValueError:
-                result.append(value[i])  # If invalid, keep character as is
-                i += 1
-        else:
-            result.append(value[i])
-            i += 1
-    return "".join(result)
+def parse_form(content):
+    """Parses URL-encoded form data into a dictionary, decoding keys and values.
+
+    Args:
+    - content: The form data as a string.
+    """
+    form = {}
+    for pair in content.split("&"):
+        if "=" in pair:
+            key, value = pair.split("=", 1)
+            form[urldecode(key)] = urldecode(value)
+    return form
@@ -0,0 +1,19 @@
+// Goat - SecureMe web interface script
+// © (c) 2025 Goat Technologies
+// https://github.com/CodeGoat-dev/SecureMe
+
+// Disable the IP address fields while DHCP is enabled
+function toggleIPFields() {
+    var dhcpChecked = document.getElementById("dhcp").checked;
+    var ipFields = document.querySelectorAll('input[type="number"]');
+    ipFields.forEach(function (field) {
+        field.disabled = dhcpChecked;
+    });
+}
+
+// Set the correct state on page load
+window.addEventListener("load", function () {
+    if (document.getElementById("dhcp")) {
+        toggleIPFields();
+    }
+});